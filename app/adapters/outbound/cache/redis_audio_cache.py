@@ -0,0 +1,59 @@
+"""
+Adaptador Redis para audio TTS - Implementación de AudioCachePort (V2).
+
+Segundo nivel de la caché de frases TTS: guarda el audio crudo (bytes) con TTL,
+compartido entre réplicas. Conexión lazy y degradación silenciosa como CacheService.
+"""
+
+import logging
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app_v2.domain.ports import AudioCachePort
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "tts:phrase:"
+
+
+class RedisAudioCache(AudioCachePort):
+    """
+    Audio por clave en Redis (sin JSON: valores binarios).
+    """
+
+    def __init__(self, url: str | None = None, ttl_seconds: int | None = None):
+        self._url = url or settings.REDIS_URL
+        self._ttl = ttl_seconds or settings.TTS_CACHE_TTL_SECONDS
+        self._redis: Redis | None = None
+        self._initialized = False
+
+    async def _ensure_connected(self) -> Redis | None:
+        """Lazy connection; if Redis is down the tier is disabled (no retries)."""
+        if not self._initialized:
+            self._initialized = True
+            try:
+                self._redis = Redis.from_url(
+                    self._url,
+                    decode_responses=False,
+                    socket_connect_timeout=2,
+                    socket_timeout=2,
+                )
+                await self._redis.ping()
+                logger.info("✅ [TTS Cache] Redis tier connected")
+            except Exception as e:
+                logger.warning(f"⚠️ [TTS Cache] Redis unavailable, tier disabled: {e}")
+                self._redis = None
+        return self._redis
+
+    async def get(self, key: str) -> bytes | None:
+        redis = await self._ensure_connected()
+        if redis is None:
+            return None
+        return await redis.get(KEY_PREFIX + key)
+
+    async def set(self, key: str, audio: bytes) -> None:
+        redis = await self._ensure_connected()
+        if redis is None:
+            return
+        await redis.set(KEY_PREFIX + key, audio, ex=self._ttl)
@@ -0,0 +1,46 @@
+"""
+Caché de frases TTS del proceso configurada desde settings.
+
+La implementación (phrase_key, PhraseCache, DiskAudioCache) es una sola, la de
+app_v2/adapters/outbounds/tts_cache.py; aquí solo se elige el segundo nivel según
+TTS_CACHE_BACKEND (disco o Redis). El AzureTTSAdapter legacy y las rutas V2 usan la
+misma caché del proceso, así que una frase sintetizada por un stack la sirve al otro.
+"""
+
+import logging
+from functools import lru_cache
+
+from app.adapters.outbound.cache.redis_audio_cache import RedisAudioCache
+from app.core.config import settings
+from app_v2.adapters.outbounds.tts_cache import DiskAudioCache, PhraseCache, get_phrase_cache
+from app_v2.domain.ports import AudioCachePort
+
+logger = logging.getLogger(__name__)
+
+
+def tts_cache_enabled() -> bool:
+    """False si TTS_CACHE_BACKEND=off."""
+    return (settings.TTS_CACHE_BACKEND or "memory").lower() != "off"
+
+
+@lru_cache(maxsize=1)
+def get_tts_cache_tier() -> AudioCachePort | None:
+    """Segundo nivel según TTS_CACHE_BACKEND (disco o Redis); None = solo memoria."""
+    backend = (settings.TTS_CACHE_BACKEND or "memory").lower()
+    if backend == "disk":
+        return DiskAudioCache(settings.TTS_CACHE_DIR)
+    if backend == "redis":
+        return RedisAudioCache()
+    if backend not in ("memory", "off"):
+        logger.warning(f"⚠️ [TTS Cache] Unknown TTS_CACHE_BACKEND={backend!r}, using memory only")
+    return None
+
+
+def get_tts_phrase_cache() -> PhraseCache | None:
+    """
+    Returns:
+        La caché de frases del proceso (legacy y V2), o None si TTS_CACHE_BACKEND=off.
+    """
+    if not tts_cache_enabled():
+        return None
+    return get_phrase_cache(tier=get_tts_cache_tier(), max_bytes=settings.TTS_CACHE_MAX_MB * 1024 * 1024)
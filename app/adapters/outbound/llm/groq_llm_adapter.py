@@ -70,7 +70,9 @@ class GroqLLMAdapter(LLMPort):
         Generate streaming response from Groq.
 
         Logs TTFB with trace_id for distributed tracing.
-        Detects function_call in stream, returns LLMChunk.
+        Detects function calls in stream: tool_call deltas are assembled by index and,
+        at the end of the completion, each call is yielded as its own LLMChunk (the
+        last one carries finish_reason).
         """
         trace_id = request.metadata.get('trace_id', 'unknown')
         start_time = time.time()
@@ -117,12 +119,8 @@ class GroqLLMAdapter(LLMPort):
 
             stream = await self.client.chat.completions.create(**api_params)
 
-            function_call_buffer = {
-                "name": "",
-                "arguments": "",
-                "id": None
-            }
-            in_function_call = False
+            # index -> {"name", "arguments", "id"} (parallel tool calls stream interleaved)
+            function_call_buffers: dict[int, dict] = {}
 
             async for chunk in stream:
                 if not chunk.choices:
@@ -132,16 +130,19 @@ class GroqLLMAdapter(LLMPort):
                 finish_reason = chunk.choices[0].finish_reason
 
                 if hasattr(delta, 'tool_calls') and delta.tool_calls:
-                    tool_call = delta.tool_calls[0]
-                    in_function_call = True
-
-                    if tool_call.id:
-                        function_call_buffer["id"] = tool_call.id
-                    if hasattr(tool_call, 'function') and tool_call.function:
-                        if tool_call.function.name:
-                            function_call_buffer["name"] += tool_call.function.name
-                        if tool_call.function.arguments:
-                            function_call_buffer["arguments"] += tool_call.function.arguments
+                    for position, tool_call in enumerate(delta.tool_calls):
+                        index = getattr(tool_call, 'index', None)
+                        buffer = function_call_buffers.setdefault(
+                            position if index is None else index,
+                            {"name": "", "arguments": "", "id": None}
+                        )
+                        if tool_call.id:
+                            buffer["id"] = tool_call.id
+                        if hasattr(tool_call, 'function') and tool_call.function:
+                            if tool_call.function.name:
+                                buffer["name"] += tool_call.function.name
+                            if tool_call.function.arguments:
+                                buffer["arguments"] += tool_call.function.arguments
 
                     if first_byte_time is None:
                         first_byte_time = time.time()
@@ -165,13 +166,22 @@ class GroqLLMAdapter(LLMPort):
                     yield LLMChunk(text=token)
 
                 if finish_reason:
-                    if in_function_call and function_call_buffer["name"]:
+                    calls = [
+                        function_call_buffers[index]
+                        for index in sorted(function_call_buffers)
+                        if function_call_buffers[index]["name"]
+                    ]
+                    if not calls:
+                        yield LLMChunk(finish_reason=finish_reason)
+                    for position, buffer in enumerate(calls):
+                        last = position == len(calls) - 1
                         try:
-                            arguments = json.loads(function_call_buffer["arguments"])
+                            # Tools without parameters may stream no arguments at all
+                            arguments = json.loads(buffer["arguments"] or "{}")
                             function_call = LLMFunctionCall(
-                                name=function_call_buffer["name"],
+                                name=buffer["name"],
                                 arguments=arguments,
-                                call_id=function_call_buffer["id"]
+                                call_id=buffer["id"]
                             )
 
                             logger.info(
@@ -181,7 +191,7 @@ class GroqLLMAdapter(LLMPort):
 
                             yield LLMChunk(
                                 function_call=function_call,
-                                finish_reason=finish_reason
+                                finish_reason=finish_reason if last else None
                             )
                         except json.JSONDecodeError as e:
                             logger.error(
@@ -189,10 +199,9 @@ class GroqLLMAdapter(LLMPort):
                             )
                             yield LLMChunk(
                                 text="[Error: Failed to parse function call]",
-                                finish_reason=finish_reason
+                                finish_reason=finish_reason if last else None
                             )
-                    else:
-                        yield LLMChunk(finish_reason=finish_reason)
+                    function_call_buffers.clear()
 
             total_time = (time.time() - start_time) * 1000
             logger.info(
@@ -1,37 +1,116 @@
 """
 Fallback Wrapper for LLM Port - Graceful Degradation.
 
-Implements automatic failover between multiple LLM providers.
+Implements automatic failover between multiple LLM providers and, optionally,
+hedged requests: if the primary has not produced its first chunk after the
+hedge delay (a percentile of recent primary TTFTs), a backup request starts and
+the first stream to emit wins; the other one is cancelled.
 """
+import asyncio
+import contextlib
 import logging
+from collections import deque
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
 
+from app.core.metrics import llm_hedge_total
 from app.domain.ports import LLMException, LLMPort, LLMRequest
 
 logger = logging.getLogger(__name__)
 
+# Primary TTFT samples kept for the hedge delay percentile
+HEDGE_WINDOW = 200
+# Below this many samples the hedge delay is the configured maximum
+HEDGE_MIN_SAMPLES = 20
+
+_END = object()
+
+
+@dataclass
+class HedgeStats:
+    """Counters for hedged requests."""
+    requests: int = 0
+    hedged: int = 0
+    backup_wins: int = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        """Share of requests that started a backup."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def backup_win_rate(self) -> float:
+        """Share of hedged requests answered by the backup."""
+        return self.backup_wins / self.hedged if self.hedged else 0.0
+
+
+async def _first(stream: AsyncIterator):
+    return await anext(stream, _END)
+
+
+async def _close(stream: AsyncIterator) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        with contextlib.suppress(Exception):
+            await aclose()
+
 
 class LLMWithFallback(LLMPort):
     """
     LLM Port wrapper with graceful degradation.
 
     Attempts primary provider first, falls back to secondary providers
-    on retryable failures.
+    on retryable failures. With hedge_backup, a slow (not failed) primary
+    also gets a backup request racing it.
     """
 
-    def __init__(self, primary: LLMPort, fallbacks: list[LLMPort]):
+    def __init__(
+        self,
+        primary: LLMPort,
+        fallbacks: list[LLMPort],
+        hedge_backup: LLMPort | None = None,
+        hedge_model: str | None = None,
+        hedge_percentile: float = 95.0,
+        hedge_min_delay_s: float = 0.25,
+        hedge_max_delay_s: float = 1.5,
+    ):
         """
         Args:
             primary: Primary LLM provider (e.g., Groq)
             fallbacks: Ordered list of fallback providers
+            hedge_backup: Optional; provider for hedged backup requests
+            hedge_model: Model for backup requests (None keeps the request's model)
+            hedge_percentile: Primary TTFT percentile used as hedge delay
+            hedge_min_delay_s: Lower bound of the hedge delay
+            hedge_max_delay_s: Upper bound (and delay until enough samples)
         """
         self.primary = primary
         self.fallbacks = fallbacks
+        self.hedge_backup = hedge_backup
+        self.hedge_model = hedge_model
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay_s = hedge_min_delay_s
+        self.hedge_max_delay_s = hedge_max_delay_s
+        self.hedge_stats = HedgeStats()
+        self._primary_ttfts: deque[float] = deque(maxlen=HEDGE_WINDOW)
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the primary's first chunk before hedging."""
+        if len(self._primary_ttfts) < HEDGE_MIN_SAMPLES:
+            return self.hedge_max_delay_s
+        samples = sorted(self._primary_ttfts)
+        rank = min(len(samples) - 1, int(len(samples) * self.hedge_percentile / 100))
+        return min(self.hedge_max_delay_s, max(self.hedge_min_delay_s, samples[rank]))
 
     async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
         """
         Generate stream from primary, fallback on retryable failures.
         """
+        if self.hedge_backup is not None:
+            async for chunk in self._generate_hedged(request):
+                yield chunk
+            return
+
         # Try primary first
         try:
             logger.info("[LLM Fallback] Attempting primary provider")
@@ -49,7 +128,11 @@ class LLMWithFallback(LLMPort):
                 f"Trying {len(self.fallbacks)} fallback(s)..."
             )
 
-        # Try fallbacks
+        async for chunk in self._generate_from_fallbacks(request):
+            yield chunk
+
+    async def _generate_from_fallbacks(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Try fallbacks in order; the last failure propagates."""
         for i, fallback in enumerate(self.fallbacks):
             try:
                 logger.info(f"[LLM Fallback] Attempting fallback {i+1}/{len(self.fallbacks)}")
@@ -67,6 +150,100 @@ class LLMWithFallback(LLMPort):
                 logger.warning(f"[LLM Fallback] Fallback {i+1} failed: {e}")
                 continue
 
+    async def _generate_hedged(self, request: LLMRequest) -> AsyncIterator[str]:
+        """
+        Race primary and backup on the first chunk, then stream the winner.
+
+        Only the first chunk is raced: once a stream has emitted, it is the
+        response (switching mid-answer would repeat or mix text).
+        """
+        self.hedge_stats.requests += 1
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        delay = self.hedge_delay()
+
+        primary = aiter(self.primary.generate_stream(request))
+        racing: dict[asyncio.Task, tuple[str, AsyncIterator]] = {
+            asyncio.create_task(_first(primary)): ("primary", primary)
+        }
+        streams = [primary]
+        winner: tuple[str, AsyncIterator, object] | None = None
+        error: Exception | None = None
+
+        try:
+            done, _ = await asyncio.wait(racing, timeout=delay)
+            if not done:
+                self.hedge_stats.hedged += 1
+                logger.warning(
+                    f"[LLM Hedge] No first token from primary after {delay * 1000:.0f}ms, "
+                    f"starting backup (model={self.hedge_model or request.model})"
+                )
+                backup_request = replace(request, model=self.hedge_model) if self.hedge_model else request
+                backup = aiter(self.hedge_backup.generate_stream(backup_request))
+                streams.append(backup)
+                racing[asyncio.create_task(_first(backup))] = ("backup", backup)
+
+            while racing and winner is None:
+                done, _ = await asyncio.wait(racing, return_when=asyncio.FIRST_COMPLETED)
+                # Primary first if both finished in the same iteration
+                for task in sorted(done, key=lambda t: racing[t][0] != "primary"):
+                    name, stream = racing.pop(task)
+                    if task.exception() is None:
+                        winner = (name, stream, task.result())
+                        break
+                    error = task.exception()
+                    logger.warning(f"[LLM Hedge] {name} failed before first chunk: {error}")
+                    if name == "primary" and isinstance(error, LLMException) and not error.retryable:
+                        llm_hedge_total.labels(outcome="failed").inc()
+                        raise error
+
+            ttft = loop.time() - start
+            # A losing primary still took at least this long (censored sample)
+            if winner is None or winner[0] == "backup":
+                self._primary_ttfts.append(max(ttft, delay))
+            else:
+                self._primary_ttfts.append(ttft)
+        finally:
+            for task in racing:
+                task.cancel()
+            for task in racing:
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+            for stream in streams:
+                if winner is None or stream is not winner[1]:
+                    await _close(stream)
+
+        if winner is None:
+            llm_hedge_total.labels(outcome="failed").inc()
+            if len(streams) == 1 and isinstance(error, LLMException) and self.fallbacks:
+                # Primary failed fast (never hedged): regular failover
+                async for chunk in self._generate_from_fallbacks(request):
+                    yield chunk
+                return
+            raise error
+
+        name, stream, first = winner
+        if len(streams) == 1:
+            llm_hedge_total.labels(outcome="not_needed").inc()
+        else:
+            llm_hedge_total.labels(outcome=name).inc()
+            if name == "backup":
+                self.hedge_stats.backup_wins += 1
+            logger.info(
+                f"[LLM Hedge] {name} won after {ttft * 1000:.0f}ms "
+                f"(hedge rate {self.hedge_stats.hedge_rate:.0%}, "
+                f"backup wins {self.hedge_stats.backup_win_rate:.0%})"
+            )
+
+        try:
+            if first is _END:
+                return
+            yield first
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await _close(stream)
+
     async def get_available_models(self) -> list[str]:
         """Get models from primary provider."""
         return await self.primary.get_available_models()
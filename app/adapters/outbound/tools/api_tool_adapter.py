@@ -89,7 +89,8 @@ class APIToolAdapter(ToolPort):
                     )
                 }
             },
-            required=["address"]
+            required=["address"],
+            cache_ttl_seconds=300.0  # Market estimates do not move within a call
         )
 
     async def execute(self, request: ToolRequest) -> ToolResponse:
@@ -85,7 +85,8 @@ class DatabaseToolAdapter(ToolPort):
                     "default": 5
                 }
             },
-            required=["query"]
+            required=["query"],
+            cache_ttl_seconds=60.0  # Read-only lookup; short TTL so edits show up
         )
 
     async def execute(self, request: ToolRequest) -> ToolResponse:
@@ -2,6 +2,10 @@
 Adaptador Azure TTS - Implementación de TTSPort.
 
 Wrappea la lógica de síntesis de voz de Azure Speech SDK.
+synthesize_stream entrega el audio a medida que Azure lo produce (stream de salida en
+memoria), de modo que el primer chunk llega al pipeline mientras el resto de la frase se
+sintetiza. Los synthesizers salen del pool de proceso por (voz, formato, región) y las
+frases cortas repetidas se sirven desde la caché de frases TTS del proceso.
 """
 
 import asyncio
@@ -17,12 +21,22 @@ from app.core.config import settings
 from app.core.decorators import track_streaming_latency
 from app.domain.ports import TTSException, TTSPort, TTSRequest, VoiceMetadata
 from app.observability import get_metrics_collector
+from app.adapters.outbound.cache.tts_phrase_cache import get_tts_phrase_cache
+from app_v2.adapters.outbounds.azure_synthesizer_pool import (
+    SynthesizerKey,
+    SynthesizerPool,
+    get_synthesizer_pool,
+)
+from app_v2.adapters.outbounds.tts_cache import PhraseCache, phrase_key
 from app.adapters.outbound.tts.azure_voice_styles import get_voice_styles_spanish
 
 logger = logging.getLogger(__name__)
 
 
 
+# Voice used when synthesizing raw SSML without a request (the SSML <voice> tag wins anyway)
+DEFAULT_VOICE = "es-MX-DaliaNeural"
+
 # --- Cache for Dynamic Data ---
 _VOICE_CACHE: list[dict] = []
 _STYLE_CACHE: dict[str, list[str]] = {}
@@ -55,34 +69,71 @@ class AzureTTSAdapter(TTSPort):
             logger.warning(f"⚠️ [AzureTTS] Using legacy audio_mode: {legacy_mode}")
             self.audio_config = AudioConfig.from_legacy_mode(legacy_mode)
 
+        # Only used for listing voices; synthesizers get their own config from the pool
         self.speech_config = speechsdk.SpeechConfig(
             subscription=self.api_key,
             region=self.region
         )
-        self._synthesizer: speechsdk.SpeechSynthesizer | None = None
-
-    def _create_synthesizer(self, voice_name: str | None = None):
-        """Creates standard SpeechSynthesizer."""
-        if voice_name:
-            self.speech_config.speech_synthesis_voice_name = voice_name
 
-        # Determine Output Format based on AudioConfig
+        # Output format follows AudioConfig (pcm 16kHz for browser, G.711 8kHz for telephony)
         if self.audio_config.encoding == "pcm":
-             # 16kHz PCM (Browser)
-             self.speech_config.set_speech_synthesis_output_format(speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm)
+            self._output_format = "pcm_16k"
         elif self.audio_config.encoding == "alaw":
-             self.speech_config.set_speech_synthesis_output_format(speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoALaw)
+            self._output_format = "alaw_8k"
         else:
-             # Default fallback mulaw 8khz
-             self.speech_config.set_speech_synthesis_output_format(speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoMULaw)
+            self._output_format = "mulaw_8k"
+        self._pool: SynthesizerPool = get_synthesizer_pool()
+        # Shared phrase cache (greetings, fillers, repeated confirmations); None if disabled
+        self._phrase_cache: PhraseCache | None = get_tts_phrase_cache()
+
+    def _key(self, voice_name: str | None) -> SynthesizerKey:
+        return SynthesizerKey(
+            voice=voice_name or DEFAULT_VOICE,
+            output_format=self._output_format,
+            region=self.region,
+            api_key=self.api_key,
+        )
 
-        audio_config = speechsdk.audio.AudioConfig(filename="/dev/null")
+    async def warm_up(self, voice_id: str) -> None:
+        """Pre-opens a pooled synthesizer connection for the call's voice."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._pool.warm, self._key(voice_id))
 
-        return speechsdk.SpeechSynthesizer(
-            speech_config=self.speech_config,
-            audio_config=audio_config
+    def _phrase_key(self, request: TTSRequest) -> str | None:
+        """Content key for the TTS phrase cache (None if disabled or the text is too long)."""
+        if self._phrase_cache is None or not self._phrase_cache.cacheable(request.text):
+            return None
+        style = request.style if request.style and request.style.lower() != "default" else None
+        return phrase_key(
+            request.text,
+            request.voice_id,
+            self._output_format,
+            style=style,
+            speed=request.speed,
+            pitch=request.provider_options.get('pitch_hz', request.pitch),
+            volume=request.volume,
+            language=request.language,
         )
 
+    async def _speak(self, key: SynthesizerKey, ssml: str, cache_key: str | None = None) -> AsyncIterator[bytes]:
+        """
+        Synthesizes on an exclusive pooled synthesizer, yielding audio as it arrives.
+
+        With cache_key, cached phrases are served without calling Azure, a phrase
+        already being synthesized is awaited instead of synthesized again, and
+        completed syntheses are stored.
+        """
+        if cache_key is not None:
+            async for chunk in self._phrase_cache.stream(cache_key, lambda: self._speak(key, ssml)):
+                yield chunk
+            return
+        entry = await self._pool.acquire(key)
+        try:
+            async for chunk in entry.speak_stream(ssml):
+                yield chunk
+        finally:
+            self._pool.release(entry)
+
     async def _ensure_voices_loaded(self):
         """
         Fetches voices from Azure if cache is empty or expired.
@@ -152,29 +203,31 @@ class AzureTTSAdapter(TTSPort):
     @circuit(failure_threshold=3, recovery_timeout=60, expected_exception=TTSException)
     @track_streaming_latency("azure_tts")
     async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
-        """Genera audio desde texto en streaming."""
+        """
+        Genera audio desde texto en streaming real.
+
+        Cada chunk que Azure escribe en el stream de salida se entrega en cuanto llega.
+        TTFB = primer chunk de audio; total = fin de la síntesis.
+        """
         trace_id = request.metadata.get('trace_id', 'unknown')
-        start_time = time.time()
-        first_byte_time = None
+        start_time = time.perf_counter()
+        ttfb = None
         metrics_collector = get_metrics_collector()
 
         try:
-            if not self._synthesizer:
-                self._synthesizer = self._create_synthesizer(request.voice_id)
-
             ssml = self._build_ssml(request)
-            audio_data = await self.synthesize_ssml(ssml)
-
-            chunk_size = 4096
-            for i in range(0, len(audio_data), chunk_size):
-                chunk = audio_data[i:i+chunk_size]
-                if first_byte_time is None:
-                    first_byte_time = time.time()
-                    ttfb = (first_byte_time - start_time) * 1000
+            async for chunk in self._speak(self._key(request.voice_id), ssml, self._phrase_key(request)):
+                if ttfb is None:
+                    ttfb = (time.perf_counter() - start_time) * 1000
                     logger.info(f"[TTS Azure] trace={trace_id} TTFB={ttfb:.0f}ms voice={request.voice_id}")
                 yield chunk
 
-            total_time = (time.time() - start_time) * 1000
+            if ttfb is None:
+                raise Exception("No audio data returned")
+
+            total_time = (time.perf_counter() - start_time) * 1000
+            logger.info(f"[TTS Azure] trace={trace_id} total={total_time:.0f}ms voice={request.voice_id}")
+            await metrics_collector.record_latency(trace_id, 'tts_ttfb', ttfb)
             await metrics_collector.record_latency(trace_id, 'tts', total_time)
 
         except Exception as e:
@@ -185,32 +238,18 @@ class AzureTTSAdapter(TTSPort):
     async def synthesize(self, request: TTSRequest) -> bytes:
         """Sintetiza texto usando parámetros del request."""
         try:
-            if not self._synthesizer:
-                self._synthesizer = self._create_synthesizer(request.voice_id)
             ssml = self._build_ssml(request)
-            return await self.synthesize_ssml(ssml)
+            return await self._synthesize_collect(self._key(request.voice_id), ssml, self._phrase_key(request))
         except Exception as e:
              raise TTSException(f"Synthesis failed: {e}", retryable=True, provider="azure") from e
 
     async def synthesize_ssml(self, ssml: str) -> bytes:
         """Sintetiza directamente desde SSML."""
-        if not self._synthesizer:
-             # Default fallback if simple synthesize called without context
-             self._synthesizer = self._create_synthesizer("es-MX-DaliaNeural")
-
-        loop = asyncio.get_running_loop()
-
-        def _blocking_synthesis():
-            result = self._synthesizer.speak_ssml_async(ssml).get()
-            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                return result.audio_data
-            if result.reason == speechsdk.ResultReason.Canceled:
-                cancellation_details = result.cancellation_details
-                raise Exception(f"Synthesis canceled: {cancellation_details.reason}. Error details: {cancellation_details.error_details}")
-            return None
+        return await self._synthesize_collect(self._key(None), ssml)
 
+    async def _synthesize_collect(self, key: SynthesizerKey, ssml: str, cache_key: str | None = None) -> bytes:
         try:
-            audio_data = await loop.run_in_executor(None, _blocking_synthesis)
+            audio_data = b"".join([chunk async for chunk in self._speak(key, ssml, cache_key)])
             if not audio_data:
                 raise Exception("No audio data returned")
             return audio_data
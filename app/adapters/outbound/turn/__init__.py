@@ -0,0 +1,5 @@
+"""Local end-of-turn detector adapters."""
+
+from app.adapters.outbound.turn.lexical_end_of_turn_adapter import LexicalEndOfTurnAdapter
+
+__all__ = ["LexicalEndOfTurnAdapter"]
@@ -0,0 +1,86 @@
+"""
+Lexical End-of-Turn Adapter (es-MX).
+
+Rule scorer for EndOfTurnPort: a Spanish turn that ends in a conjunction,
+preposition, article or filler ("quiero pagar con", "es que este...") is almost
+never finished; terminal punctuation from STT and short closed answers ("sí",
+"gracias") almost always are. Everything else returns 0.5 so the use case can
+ask the LLM. A few set lookups per call (microseconds), no model to load.
+"""
+import re
+import unicodedata
+
+from app.domain.ports.end_of_turn_port import EndOfTurnPort
+
+# Lowercase, unaccented. Function words are matched before stripping accents:
+# que/qué, tu/tú, mi/mí, el/él, como/cómo, si/sí only differ by the accent.
+_CONJUNCTIONS = frozenset({
+    "y", "e", "o", "u", "ni", "pero", "sino", "aunque", "porque", "que", "si",
+    "como", "cuando", "donde", "mientras", "pues",
+})
+_PREPOSITIONS = frozenset({
+    "a", "al", "ante", "con", "contra", "de", "del", "desde", "en", "entre",
+    "hacia", "hasta", "para", "por", "sin", "sobre", "tras",
+})
+_DETERMINERS = frozenset({
+    "el", "la", "los", "las", "lo", "un", "una", "unos", "unas", "mi", "mis",
+    "tu", "tus", "su", "sus", "nuestro", "nuestra", "ese", "esa", "esos", "esas",
+})
+_FILLERS = frozenset({
+    "eh", "em", "emm", "mmm", "mm", "ah", "ahm", "este", "esteee", "entonces",
+    "digamos", "osea",
+})
+_TRAILING_PHRASES = frozenset({"o sea", "es que", "lo que", "a ver", "o no se", "y este"})
+_CLOSED_ANSWERS = frozenset({
+    "sí", "no", "claro", "gracias", "muchas gracias", "ok", "okay", "vale",
+    "perfecto", "exacto", "correcto", "listo", "sale", "órale", "va", "adiós",
+    "de acuerdo", "está bien", "así es", "nada más", "es todo",
+})
+
+_WORDS = re.compile(r"[^\W\d_]+")
+
+INCOMPLETE_SCORE = 0.1
+FILLER_SCORE = 0.2
+NEUTRAL_SCORE = 0.5
+PERIOD_SCORE = 0.8
+CLOSED_SCORE = 0.9
+QUESTION_SCORE = 0.95
+
+
+def _strip_accents(word: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFD", word) if unicodedata.category(c) != "Mn")
+
+
+class LexicalEndOfTurnAdapter(EndOfTurnPort):
+    """Rule/lexicon end-of-turn scorer for Mexican Spanish transcripts."""
+
+    @property
+    def name(self) -> str:
+        return "lexical-es-mx"
+
+    def completion_probability(self, text: str) -> float:
+        stripped = text.strip()
+        if not stripped:
+            return NEUTRAL_SCORE
+        if stripped.endswith(("...", "…", ",", ";", ":")):
+            return INCOMPLETE_SCORE
+        if stripped.endswith(("?", "!")):
+            return QUESTION_SCORE
+
+        words = _WORDS.findall(stripped.lower())
+        if not words:
+            return NEUTRAL_SCORE
+        if " ".join(words) in _CLOSED_ANSWERS:
+            return CLOSED_SCORE
+
+        if words[-1] in _CONJUNCTIONS or words[-1] in _PREPOSITIONS or words[-1] in _DETERMINERS:
+            # STT often closes a cut-off sentence with a period: the word wins
+            return INCOMPLETE_SCORE
+        last = _strip_accents(words[-1])
+        tail = " " + " ".join(_strip_accents(w) for w in words[-3:])
+        if last in _FILLERS or any(tail.endswith(" " + p) for p in _TRAILING_PHRASES):
+            return FILLER_SCORE
+
+        if stripped.endswith("."):
+            return PERIOD_SCORE
+        return NEUTRAL_SCORE
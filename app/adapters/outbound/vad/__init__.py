@@ -0,0 +1,5 @@
+"""Adapters de detección de actividad de voz (V2)."""
+
+from app.adapters.outbound.vad.silero_vad_adapter import SileroVADAdapter, create_vad_port
+
+__all__ = ["SileroVADAdapter", "create_vad_port"]
@@ -0,0 +1,77 @@
+"""
+Adapter V2 para VADPort.
+
+Usa la sesión Silero compartida del proceso (app/core/vad/service.py) para dar al
+TurnAccumulator de app_v2 una probabilidad de voz por ventana de 32 ms (512 muestras
+a 16 kHz, 256 a 8 kHz), igual que el VADProcessor legacy. Cada llamada tiene su propio
+estado recurrente; crear el adapter ya no carga el modelo. La inferencia es async
+(VADStream.infer): se agrupa con la de otras llamadas y no bloquea el event loop.
+
+Referencia legacy: app/processors/logic/vad.py (_init_model, _process_audio).
+Build Log: docs/APP_V2_BUILD_LOG.md — Paso 12, Paso 17, Paso 18.
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+
+from app.core.vad.service import DEFAULT_MODEL_PATH, VADInferenceService, VADStream, get_vad_service
+from app_v2.domain.ports import VADPort
+
+logger = logging.getLogger(__name__)
+
+
+class SileroVADAdapter(VADPort):
+    """
+    Implementación de VADPort con Silero VAD (ONNX).
+    """
+
+    def __init__(self, model_path: str | Path | None = None) -> None:
+        """
+        Args:
+            model_path: Ruta al modelo ONNX; por defecto la sesión compartida del proceso
+                (app/core/vad/data/silero_vad.onnx). Otra ruta crea un servicio propio.
+        """
+        if model_path is None or Path(model_path) == DEFAULT_MODEL_PATH:
+            service = get_vad_service()
+        else:
+            service = VADInferenceService(model_path)
+        if service is None:
+            raise RuntimeError("Silero VAD service unavailable")
+        self._streams: dict[int, VADStream] = {}
+        self._service = service
+
+    def window_samples(self, sample_rate: int) -> int:
+        return 512 if sample_rate == 16000 else 256
+
+    async def speech_probability(self, pcm_window: bytes, sample_rate: int) -> float:
+        # int16 tal cual: el servicio escala a float32 directamente en el tensor del batch
+        audio = np.frombuffer(pcm_window, dtype=np.int16)
+        try:
+            stream = self._streams.get(sample_rate)
+            if stream is None:
+                stream = self._streams[sample_rate] = self._service.open_stream(sample_rate)
+            return float(await stream.infer(audio))
+        except Exception as e:
+            logger.error("Silero VAD inference error: %s", e)
+            return 0.0
+
+    def reset(self) -> None:
+        for stream in self._streams.values():
+            stream.reset()
+
+
+def create_vad_port() -> VADPort | None:
+    """
+    Crea el adapter Silero para una llamada.
+
+    Returns:
+        SileroVADAdapter, o None si el modelo no puede cargarse
+        (el TurnAccumulator usa entonces detección por energía).
+    """
+    try:
+        return SileroVADAdapter()
+    except Exception as e:
+        logger.warning("Silero VAD unavailable, falling back to energy detection: %s", e)
+        return None
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import contextlib
 import json
@@ -14,6 +15,8 @@ class SimulatorTransport(AudioTransport):
     """
     def __init__(self, websocket: WebSocket):
         self.websocket = websocket
+        # Last queued send; each queued chunk waits for it to keep the order
+        self._queued_send: asyncio.Task | None = None
 
     async def send_audio(self, audio_data: bytes, sample_rate: int = 8000) -> None:
         # Simulator expects base64 audio in a specific JSON format
@@ -29,6 +32,16 @@ class SimulatorTransport(AudioTransport):
             logging.getLogger(__name__).error(f"SimulatorTransport Send Error: {e}")
             pass
 
+    def queue_audio(self, audio_data: bytes) -> None:
+        self._queued_send = asyncio.get_running_loop().create_task(
+            self._send_after(self._queued_send, audio_data)
+        )
+
+    async def _send_after(self, previous: asyncio.Task | None, audio_data: bytes) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+        await self.send_audio(audio_data)
+
     async def send_json(self, data: dict[str, Any]) -> None:
         with contextlib.suppress(Exception):
             await self.websocket.send_text(json.dumps(data))
@@ -0,0 +1,100 @@
+"""
+Telephony Media Reader.
+
+Inbound side of the Twilio/Telnyx media WebSocket (counterpart of media_writer).
+
+"media" events (~50/s per call) skip the generic JSON parse: the payload is
+located with a substring scan, base64-decoded and G.711-decoded, and handed off
+as a memoryview over the decoded samples (no bytes copy). Anything else (start,
+stop, marks, unusual formatting) goes through orjson when installed, else json.
+"""
+import binascii
+import json
+import logging
+from typing import Any, NamedTuple
+
+from app.core import audio_utils
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_MEDIA_EVENT = '"event":"media"'
+_PAYLOAD_KEY = '"payload":"'
+
+
+def loads(text: str) -> Any:
+    """JSON parse with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class InboundMessage(NamedTuple):
+    """One inbound WebSocket message."""
+    event: str | None
+    audio: memoryview | None = None  # media: 16-bit PCM
+    data: dict[str, Any] | None = None  # non-media (or slow-path) parsed message
+
+
+class InboundMediaDecoder:
+    """Per-call inbound message parser and audio decoder."""
+
+    def __init__(self, client: str = "twilio"):
+        """
+        Args:
+            client: "twilio", "telnyx" or "browser" (browser sends 16-bit PCM)
+        """
+        self.client = client
+        self.codec: str | None = None if client == "browser" else "ulaw"
+        self.fast_path_hits = 0
+
+    def set_format(self, start_data: dict[str, Any]) -> None:
+        """
+        Selects the G.711 codec from the start event.
+        Twilio: mediaFormat.encoding "audio/x-mulaw"; Telnyx: media_format.encoding "PCMU" | "PCMA".
+        """
+        if self.client == "browser":
+            return
+        media_format = start_data.get("mediaFormat") or start_data.get("media_format") or {}
+        encoding = str(media_format.get("encoding") or "").upper()
+        self.codec = "alaw" if "PCMA" in encoding or "ALAW" in encoding else "ulaw"
+
+    def parse(self, text: str) -> InboundMessage:
+        """Parses one message; media events carry their decoded audio."""
+        if _MEDIA_EVENT in text:
+            start = text.find(_PAYLOAD_KEY)
+            if start != -1:
+                start += len(_PAYLOAD_KEY)
+                end = text.find('"', start)
+                # Escaped characters (e.g. "\/") need the real JSON parser
+                if end != -1 and "\\" not in text[start:end]:
+                    self.fast_path_hits += 1
+                    return InboundMessage("media", self.decode_payload(text[start:end]))
+
+        msg = loads(text)
+        event = msg.get("event")
+        if event == "media":
+            payload = (msg.get("media") or {}).get("payload")
+            return InboundMessage(event, self.decode_payload(payload), msg)
+        return InboundMessage(event, None, msg)
+
+    def decode_payload(self, payload: str | None) -> memoryview | None:
+        """Base64 payload -> 16-bit PCM view (None if empty or malformed)."""
+        if not payload:
+            return None
+        try:
+            raw = binascii.a2b_base64(payload)
+        except (binascii.Error, ValueError) as e:
+            logger.warning(f"⚠️ [MediaReader] Malformed media payload: {e}")
+            return None
+        if not raw:
+            return None
+        if self.codec is None:
+            return memoryview(raw)
+        return audio_utils.decode_g711(raw, self.codec)
@@ -0,0 +1,223 @@
+"""
+Telephony Media Writer.
+
+Outbound side of the Twilio/Telnyx media WebSocket, shared by TelephonyTransport
+and V2TelephonyTransport.
+
+- MediaFrameEncoder: "media" events are built by filling a JSON template
+  pre-rendered per (protocol, stream id) with base64 written into a reusable
+  buffer (no dict building / json.dumps per 20ms frame).
+- MediaWriter: per-transport write queue drained by its own task, so a slow
+  socket delays only its own call and never the caller (orchestrator, playout
+  scheduler). Audio queued while a send is in flight is coalesced into one
+  message; the queue is bounded (oldest audio dropped first).
+"""
+import asyncio
+import binascii
+import contextlib
+import json
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Coalesced audio per message (8000 bytes = 1s @ 8kHz G.711)
+MAX_COALESCE_BYTES = 8000
+
+# Queued audio beyond this is dropped oldest-first (60s @ 8kHz G.711)
+MAX_PENDING_AUDIO_BYTES = 480_000
+
+# close() waits this long for queued audio (e.g. the apology) to go out
+FLUSH_TIMEOUT_SECONDS = 2.0
+
+
+class MediaFrameEncoder:
+    """Encodes outbound audio as the protocol's "media" event (JSON text)."""
+
+    def __init__(self, protocol: str, stream_id: str):
+        """
+        Args:
+            protocol: "twilio" or "telnyx"
+            stream_id: Twilio streamSid / Telnyx stream_id
+        """
+        sid = json.dumps(stream_id)
+        if protocol == "twilio":
+            head = '{"event": "media", "streamSid": ' + sid + ', "media": {"payload": "'
+            tail = '"}}'
+        else:
+            # inbound_track: audio sent TO Telnyx (so the caller hears it)
+            head = '{"event": "media", "stream_id": ' + sid + ', "media": {"payload": "'
+            tail = '", "track": "inbound_track"}}'
+        self.protocol = protocol
+        self.stream_id = stream_id
+        self._head = len(head)
+        self._tail = tail.encode("ascii")
+        self._buffer = bytearray(head.encode("utf-8"))
+
+    def encode(self, audio: bytes) -> str:
+        """Returns the "media" event text carrying audio (same JSON as json.dumps of the dict)."""
+        buffer = self._buffer
+        del buffer[self._head :]
+        buffer += binascii.b2a_base64(audio, newline=False)
+        buffer += self._tail
+        return buffer.decode("utf-8")
+
+
+@dataclass
+class MediaWriterStats:
+    """Per-transport write counters."""
+    messages_sent: int = 0
+    audio_chunks: int = 0
+    coalesced_chunks: int = 0  # chunks merged into a previous message
+    dropped_audio_bytes: int = 0
+
+
+class MediaWriter:
+    """
+    Ordered, bounded write queue for one media WebSocket.
+
+    Audio and control messages keep their relative order. The first failed send
+    marks the writer failed, drops everything queued and calls on_error.
+    """
+
+    def __init__(
+        self,
+        send_text: Callable[[str], Awaitable[None]],
+        on_error: Callable[[Exception], None] | None = None,
+        coalesce: bool = True,
+        max_coalesce_bytes: int = MAX_COALESCE_BYTES,
+        max_pending_audio_bytes: int = MAX_PENDING_AUDIO_BYTES,
+    ):
+        """
+        Args:
+            send_text: WebSocket send_text coroutine
+            on_error: Called once with the exception of the first failed send
+            coalesce: Merge consecutive queued audio chunks into one message
+            max_coalesce_bytes: Upper bound of audio per coalesced message
+            max_pending_audio_bytes: Queue bound for audio not yet sent
+        """
+        self._send_text = send_text
+        self._on_error = on_error
+        self.coalesce = coalesce
+        self.max_coalesce_bytes = max_coalesce_bytes
+        self.max_pending_audio_bytes = max_pending_audio_bytes
+        self.encoder: MediaFrameEncoder | None = None
+        self.stats = MediaWriterStats()
+        self.failed = False
+        # Items: bytes (audio, encoded on send) or str (ready JSON text)
+        self._queue: deque[bytes | str] = deque()
+        self._pending_audio = 0
+        self._task: asyncio.Task | None = None
+        self._warned_drop = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def set_stream(self, protocol: str, stream_id: str) -> None:
+        self.encoder = MediaFrameEncoder(protocol, stream_id)
+
+    def send_audio(self, audio: bytes) -> None:
+        """Queue audio (needs set_stream first; silently ignored otherwise, like before)."""
+        if self.failed or self.encoder is None or not audio:
+            return
+        self._queue.append(bytes(audio))
+        self._pending_audio += len(audio)
+        self.stats.audio_chunks += 1
+        if self._pending_audio > self.max_pending_audio_bytes:
+            self._drop_oldest_audio()
+        self._kick()
+
+    def send_text(self, text: str) -> None:
+        """Queue a control message (JSON text) behind the audio already queued."""
+        if self.failed:
+            return
+        self._queue.append(text)
+        self._kick()
+
+    def clear_audio(self) -> int:
+        """Drop queued audio that was not sent yet (barge-in). Returns bytes dropped."""
+        dropped = self._pending_audio
+        if dropped:
+            self._queue = deque(item for item in self._queue if isinstance(item, str))
+            self._pending_audio = 0
+        return dropped
+
+    async def flush(self, timeout: float = FLUSH_TIMEOUT_SECONDS) -> bool:
+        """Wait until the queue is drained. Returns False on timeout or failure."""
+        task = self._task
+        if task is not None and not task.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout)
+            except TimeoutError:
+                return False
+        return not self.failed
+
+    async def aclose(self, timeout: float = FLUSH_TIMEOUT_SECONDS) -> None:
+        """Flush (bounded) and stop; anything still queued is dropped."""
+        if not await self.flush(timeout):
+            logger.warning(f"⚠️ [MediaWriter] Closing with {len(self._queue)} queued messages unsent")
+        self.failed = True
+        self._queue.clear()
+        self._pending_audio = 0
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    def _drop_oldest_audio(self) -> None:
+        kept: deque[bytes | str] = deque()
+        for item in self._queue:
+            if isinstance(item, bytes) and self._pending_audio > self.max_pending_audio_bytes:
+                self._pending_audio -= len(item)
+                self.stats.dropped_audio_bytes += len(item)
+                continue
+            kept.append(item)
+        self._queue = kept
+        if not self._warned_drop:
+            self._warned_drop = True
+            logger.warning(
+                f"⚠️ [MediaWriter] Socket too slow: dropping oldest queued audio "
+                f"(> {self.max_pending_audio_bytes} bytes pending)"
+            )
+
+    def _kick(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    def _next_message(self) -> str:
+        item = self._queue.popleft()
+        if isinstance(item, str):
+            return item
+        size = len(item)
+        if self.coalesce and self._queue and isinstance(self._queue[0], bytes):
+            chunks = [item]
+            while (
+                self._queue
+                and isinstance(self._queue[0], bytes)
+                and size + len(self._queue[0]) <= self.max_coalesce_bytes
+            ):
+                chunk = self._queue.popleft()
+                chunks.append(chunk)
+                size += len(chunk)
+            self.stats.coalesced_chunks += len(chunks) - 1
+            item = b"".join(chunks)
+        self._pending_audio -= size
+        return self.encoder.encode(item)
+
+    async def _drain(self) -> None:
+        while self._queue and not self.failed:
+            text = self._next_message()
+            try:
+                await self._send_text(text)
+            except Exception as e:
+                self.failed = True
+                self._queue.clear()
+                self._pending_audio = 0
+                if self._on_error is not None:
+                    self._on_error(e)
+                return
+            self.stats.messages_sent += 1
@@ -1,9 +1,9 @@
-import base64
 import json
 from typing import Any
 
 from fastapi import WebSocket
 
+from app.adapters.telephony.media_writer import MediaWriter
 from app.domain.ports import AudioTransport
 
 
@@ -16,37 +16,19 @@ class TelephonyTransport(AudioTransport):
         self.websocket = websocket
         self.protocol = protocol # 'twilio' or 'telnyx'
         self.stream_id: str | None = None
+        # Queued, coalescing writer: a slow socket never blocks the caller
+        self.writer = MediaWriter(websocket.send_text)
 
     def set_stream_id(self, stream_id: str) -> None:
         self.stream_id = stream_id
+        self.writer.set_stream(self.protocol, stream_id)
 
-    async def send_audio(self, chunk: bytes) -> None:
-        if not self.stream_id:
-            return
+    async def send_audio(self, chunk: bytes, sample_rate: int = 8000) -> None:
+        self.queue_audio(chunk)
 
-        try:
-            b64 = base64.b64encode(chunk).decode('utf-8')
-
-            # Protocol Specific Handling
-            if self.protocol == "twilio":
-                msg = {
-                    "event": "media",
-                    "streamSid": self.stream_id,
-                    "media": {"payload": b64}
-                }
-            elif self.protocol == "telnyx":
-                 msg = {
-                    "event": "media",
-                    "stream_id": self.stream_id,
-                    "media": {
-                        "payload": b64,
-                        "track": "inbound_track"  # Send audio TO Telnyx (so user hears it)
-                    }
-                }
-
-            await self.websocket.send_text(json.dumps(msg))
-        except Exception:
-            pass
+    def queue_audio(self, audio_data: bytes) -> None:
+        # Queued and encoded by the writer (template JSON + base64)
+        self.writer.send_audio(audio_data)
 
     async def send_json(self, data: dict[str, Any]) -> None:
         try:
@@ -60,7 +42,10 @@ class TelephonyTransport(AudioTransport):
                      # but good practice to check logic.
                      pass
 
-            await self.websocket.send_text(json.dumps(data))
+            if data.get("event") == "clear":
+                # Barge-in: audio still queued locally must not reach the carrier
+                self.writer.clear_audio()
+            self.writer.send_text(json.dumps(data))
         except Exception:
             pass
 
@@ -95,4 +80,4 @@ class TelephonyTransport(AudioTransport):
                 logger.info("⚠️ VAD: Low confidence, likely background noise")
 
     async def close(self) -> None:
-        pass
+        await self.writer.aclose()
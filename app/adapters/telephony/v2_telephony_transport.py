@@ -8,11 +8,14 @@ close() cierra el WebSocket. Usado por routes_telephony cuando el handler usa Or
 Robustez: comprueba que el WebSocket esté conectado antes de cada send; si está cerrado
 loguea y no lanza, para evitar "Cannot call send once a close message has been sent".
 
+Escritura: los mensajes se encolan en un MediaWriter propio (plantilla JSON + base64,
+audio coalescido, cola acotada) que escribe en su propia tarea; un socket lento no
+bloquea al orquestador. Un fallo de envío marca el transport como cerrado.
+
 Referencia legacy: app/adapters/telephony/transport.py (TelephonyTransport).
 Build Log: docs/APP_V2_BUILD_LOG.md — Paso 8 (Fase 4).
 """
 
-import base64
 import contextlib
 import json
 import logging
@@ -20,6 +23,7 @@ from typing import Any
 
 from starlette.websockets import WebSocketState
 
+from app.adapters.telephony.media_writer import MediaWriter
 from app_v2.domain.ports import AudioTransport
 
 logger = logging.getLogger(__name__)
@@ -44,9 +48,22 @@ class V2TelephonyTransport(AudioTransport):
         self._protocol = protocol
         self._stream_id: str | None = None
         self._closed: bool = False
+        self._writer = MediaWriter(self._ws_send_text, on_error=self._on_send_error)
 
     def set_stream_id(self, stream_id: str) -> None:
         self._stream_id = stream_id
+        self._writer.set_stream(self._protocol, stream_id)
+
+    async def _ws_send_text(self, text: str) -> None:
+        await self._ws.send_text(text)
+
+    def _on_send_error(self, error: Exception) -> None:
+        self._closed = True
+        logger.warning(
+            "V2TelephonyTransport send failed (marking closed): %s",
+            error,
+            exc_info=False,
+        )
 
     def is_connected(self) -> bool:
         """True si el transport considera que el WebSocket sigue usable (no cerrado)."""
@@ -82,28 +99,7 @@ class V2TelephonyTransport(AudioTransport):
             return
         if not self._stream_id:
             return
-        try:
-            b64 = base64.b64encode(audio_data).decode("utf-8")
-            if self._protocol == "twilio":
-                msg = {
-                    "event": "media",
-                    "streamSid": self._stream_id,
-                    "media": {"payload": b64},
-                }
-            else:
-                msg = {
-                    "event": "media",
-                    "stream_id": self._stream_id,
-                    "media": {"payload": b64, "track": "inbound_track"},
-                }
-            await self._ws.send_text(json.dumps(msg))
-        except Exception as e:
-            self._closed = True
-            logger.warning(
-                "V2TelephonyTransport send_audio failed (marking closed): %s",
-                e,
-                exc_info=False,
-            )
+        self._writer.send_audio(audio_data)
 
     async def send_json(self, data: dict[str, Any]) -> None:
         self._log_state("send_json")
@@ -113,23 +109,20 @@ class V2TelephonyTransport(AudioTransport):
                 self._closed,
             )
             return
-        try:
-            payload = dict(data)
-            if self._stream_id and self._protocol == "twilio" and "streamSid" not in payload:
-                payload["streamSid"] = self._stream_id
-            await self._ws.send_text(json.dumps(payload))
-        except Exception as e:
-            self._closed = True
-            logger.warning(
-                "V2TelephonyTransport send_json failed (marking closed): %s",
-                e,
-                exc_info=False,
-            )
+        payload = dict(data)
+        if self._stream_id and self._protocol == "twilio" and "streamSid" not in payload:
+            payload["streamSid"] = self._stream_id
+        if payload.get("event") == "clear":
+            # Barge-in: el audio aún encolado localmente no debe llegar al carrier
+            self._writer.clear_audio()
+        self._writer.send_text(json.dumps(payload))
 
     async def close(self) -> None:
         if self._closed:
             logger.debug("V2TelephonyTransport close: already closed")
             return
+        # Deja salir lo encolado (p. ej. la disculpa) antes de cerrar, con límite de tiempo
+        await self._writer.aclose()
         self._closed = True
         logger.debug("V2TelephonyTransport close: marking closed and closing WebSocket")
         with contextlib.suppress(Exception):
@@ -27,16 +27,20 @@ from app.core.global_call_policy import (
     report_critical_error as report_policy_error,
 )
 from app.db.database import AsyncSessionLocal
+from app.adapters.outbound.cache.tts_phrase_cache import get_tts_phrase_cache
 from app.adapters.outbound.extraction.v2_extraction_adapter import V2ExtractionAdapter
 from app.adapters.outbound.persistence.v2_call_persistence_adapter import (
     V2CallPersistenceAdapter,
 )
+from app.adapters.outbound.vad import create_vad_port
 
 from app_v2.adapters import (
     AzureTTSAdapter,
+    CachedTTSAdapter,
     ConfigAdapter,
     GroqLLMAdapter,
     GroqWhisperSTTAdapter,
+    GroqWhisperStreamingSTTAdapter,
     WebSocketTransport,
 )
 from app_v2.application import Orchestrator
@@ -73,7 +77,8 @@ async def simulator_stream_v2(websocket: WebSocket):
 
     config_loader = load_config_for_call
     config_port = ConfigAdapter(loader=config_loader)
-    stt_port = GroqWhisperSTTAdapter(
+    stt_adapter = GroqWhisperStreamingSTTAdapter if settings.V2_STT_STREAMING else GroqWhisperSTTAdapter
+    stt_port = stt_adapter(
         api_key=settings.GROQ_API_KEY or "",
         model="whisper-large-v3",
     )
@@ -86,6 +91,9 @@ async def simulator_stream_v2(websocket: WebSocket):
         region=settings.AZURE_SPEECH_REGION or "eastus",
         output_format="pcm_16k",
     )
+    phrase_cache = get_tts_phrase_cache()
+    if phrase_cache is not None:
+        tts_port = CachedTTSAdapter(tts_port, phrase_cache, output_format="pcm_16k")
     transport = WebSocketTransport(websocket)
     persistence = V2CallPersistenceAdapter(session_factory=AsyncSessionLocal)
     extraction = V2ExtractionAdapter()
@@ -101,6 +109,7 @@ async def simulator_stream_v2(websocket: WebSocket):
         stream_id=client_id,
         persistence_port=persistence,
         extraction_port=extraction,
+        vad_port=create_vad_port(),
     )
     manager.register_orchestrator(client_id, orchestrator)
 
@@ -14,9 +14,12 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from starlette.websockets import WebSocketDisconnect
 
+from app.adapters.telephony.media_reader import InboundMediaDecoder
 from app.adapters.telephony.v2_telephony_transport import V2TelephonyTransport
+from app.adapters.outbound.cache.tts_phrase_cache import get_tts_phrase_cache
 from app.adapters.outbound.extraction.v2_extraction_adapter import V2ExtractionAdapter
 from app.adapters.outbound.persistence.v2_call_persistence_adapter import V2CallPersistenceAdapter
+from app.adapters.outbound.vad import create_vad_port
 from app.api.connection_manager import manager
 from app.api.v2_config_loader import load_config_for_call
 from app.core.config import settings
@@ -29,9 +32,11 @@ from app.db.database import AsyncSessionLocal
 
 from app_v2.adapters import (
     AzureTTSAdapter,
+    CachedTTSAdapter,
     ConfigAdapter,
     GroqLLMAdapter,
     GroqWhisperSTTAdapter,
+    GroqWhisperStreamingSTTAdapter,
 )
 from app_v2.application import Orchestrator
 from app_v2.application.errors import CriticalCallError
@@ -178,7 +183,8 @@ async def telephony_media_stream(
 
     transport = V2TelephonyTransport(websocket, protocol=client)
     config_port = ConfigAdapter(loader=load_config_for_call)
-    stt_port = GroqWhisperSTTAdapter(
+    stt_adapter = GroqWhisperStreamingSTTAdapter if settings.V2_STT_STREAMING else GroqWhisperSTTAdapter
+    stt_port = stt_adapter(
         api_key=settings.GROQ_API_KEY or "",
         model="whisper-large-v3",
     )
@@ -193,6 +199,9 @@ async def telephony_media_stream(
         region=settings.AZURE_SPEECH_REGION or "eastus",
         output_format=tts_output_format,
     )
+    phrase_cache = get_tts_phrase_cache()
+    if phrase_cache is not None:
+        tts_port = CachedTTSAdapter(tts_port, phrase_cache, output_format=tts_output_format)
     persistence = V2CallPersistenceAdapter(session_factory=AsyncSessionLocal)
     extraction = V2ExtractionAdapter()
 
@@ -207,8 +216,12 @@ async def telephony_media_stream(
         stream_id=client_id,
         persistence_port=persistence,
         extraction_port=extraction,
+        vad_port=create_vad_port(),
     )
     manager.register_orchestrator(client_id, orchestrator)
+    # El orquestador acumula turnos sobre PCM 16-bit; hasta el evento start se asume µ-law.
+    # Los eventos media se decodifican por vía rápida (sin json.loads) a PCM nuevo por mensaje.
+    inbound = InboundMediaDecoder(client)
 
     try:
         await orchestrator.start()
@@ -234,12 +247,13 @@ async def telephony_media_stream(
                 )
                 break
             data = await websocket.receive_text()
-            msg = json.loads(data)
-            event = msg.get("event")
+            message = inbound.parse(data)
+            event = message.event
 
             if event == "connected":
                 pass
             elif event == "start":
+                msg = message.data
                 start_data = msg.get("start", {})
                 stream_sid = (
                     start_data.get("streamSid")
@@ -247,12 +261,11 @@ async def telephony_media_stream(
                     or str(uuid.uuid4())
                 )
                 transport.set_stream_id(stream_sid)
+                inbound.set_format(start_data)
             elif event == "media":
-                payload = msg.get("media", {}).get("payload")
-                if payload:
+                if message.audio is not None:
                     try:
-                        audio_bytes = base64.b64decode(payload)
-                        await orchestrator.process_audio(audio_bytes)
+                        await orchestrator.process_audio(message.audio)
                     except CriticalCallError as e:
                         report_policy_error(
                             reason=e.reason,
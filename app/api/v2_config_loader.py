@@ -12,6 +12,7 @@ Documentación: docs/APP_V2_BUILD_LOG.md (Paso 4).
 import logging
 from typing import Any
 
+from app.core.config import settings
 from app.db.database import AsyncSessionLocal
 from app.domain.config_logic import apply_client_overlay
 from app.services.db_service import db_service
@@ -34,6 +35,8 @@ def _mutable_to_call_config(client_type: str, agent_id: int, p: Any) -> CallConf
         system_prompt=(getattr(p, "system_prompt", None) or "").strip(),
         first_message=(getattr(p, "first_message", None) or "").strip(),
         first_message_mode=getattr(p, "first_message_mode", None) or "speak-first",
+        history_token_budget=settings.V2_HISTORY_TOKEN_BUDGET,
+        history_summary_model=settings.V2_HISTORY_SUMMARY_MODEL,
         voice_name=getattr(p, "voice_name", None) or "es-MX-DaliaNeural",
         voice_language=getattr(p, "voice_language", None) or "es-MX",
         voice_speed=float(getattr(p, "voice_speed", None) or 1.0),
@@ -0,0 +1,172 @@
+"""
+Background Audio Loops.
+
+Background ambience (app/static/sounds/*.wav, bg_audio_path) is decoded,
+attenuated and re-encoded once per (file, gain, codec) and shared read-only by
+every call in the process. Playing background during silence is then a slice of
+the pre-encoded loop (no DSP per 20ms frame); mixing under TTS uses the
+attenuated linear PCM of the same loop.
+"""
+import functools
+import logging
+import struct
+from pathlib import Path
+
+from app.core import audio_utils
+
+logger = logging.getLogger(__name__)
+
+# Largest slice served without wrap-around concatenation (40ms @ 8kHz)
+MAX_SLICE_SAMPLES = 320
+
+# WAV format tags
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_ALAW = 6
+_WAVE_FORMAT_MULAW = 7
+
+
+def _wrap(buffer: bytes, pad: int) -> bytes:
+    """Append the first pad bytes (repeating short buffers) so any slice up to pad is contiguous."""
+    repeats = pad // len(buffer) + 1
+    return buffer + (buffer * repeats)[:pad]
+
+
+class BackgroundLoop:
+    """
+    Pre-processed background loop (immutable, shared across calls).
+
+    Positions are in samples; each caller keeps its own cursor.
+    """
+
+    def __init__(self, pcm: bytes, encoded: bytes, codec: str, gain: float):
+        """
+        Args:
+            pcm: Attenuated 16-bit linear PCM
+            encoded: Attenuated audio in codec (one byte per sample)
+            codec: "ulaw" or "alaw"
+            gain: Attenuation applied to the source
+        """
+        if not encoded or len(pcm) != 2 * len(encoded):
+            raise ValueError("Background loop needs matching, non-empty PCM and G.711 buffers")
+        self.codec = codec
+        self.gain = gain
+        self.samples = len(encoded)
+        self._pcm = _wrap(pcm, 2 * MAX_SLICE_SAMPLES)
+        self._encoded = _wrap(encoded, MAX_SLICE_SAMPLES)
+
+    @classmethod
+    def from_encoded(cls, encoded: bytes, codec: str = "ulaw") -> "BackgroundLoop":
+        """Wraps audio that is already attenuated and in the output codec."""
+        decode = audio_utils.alaw2lin if codec == "alaw" else audio_utils.ulaw2lin
+        return cls(decode(encoded, 2), encoded, codec, 1.0)
+
+    @property
+    def encoded_loop(self) -> bytes:
+        """One pass of the encoded loop (without wrap padding)."""
+        return self._encoded[: self.samples]
+
+    def _check(self, position: int, samples: int) -> None:
+        if samples > MAX_SLICE_SAMPLES:
+            raise ValueError(f"Slice of {samples} samples exceeds {MAX_SLICE_SAMPLES}")
+        if not 0 <= position < self.samples:
+            raise ValueError(f"Position {position} outside loop of {self.samples} samples")
+
+    def encoded(self, position: int, samples: int) -> bytes:
+        """G.711 slice starting at position (wraps around the loop end)."""
+        self._check(position, samples)
+        return self._encoded[position : position + samples]
+
+    def pcm(self, position: int, samples: int) -> bytes:
+        """16-bit PCM slice starting at position (wraps around the loop end)."""
+        self._check(position, samples)
+        return self._pcm[2 * position : 2 * (position + samples)]
+
+    def advance(self, position: int, samples: int) -> int:
+        """Cursor after consuming samples from position."""
+        return (position + samples) % self.samples
+
+
+def _parse_wav(raw: bytes) -> tuple[int, bytes]:
+    """
+    Returns (format tag, payload) of a RIFF/WAVE file.
+
+    Headerless files are treated as raw A-law (background files are A-law, 8kHz mono).
+    """
+    if raw[:4] != b"RIFF" or raw[8:12] != b"WAVE":
+        logger.warning("⚠️ [BG-SOUND] No RIFF/WAVE header. Assuming raw A-law mono.")
+        return _WAVE_FORMAT_ALAW, raw
+
+    format_tag = _WAVE_FORMAT_ALAW
+    offset = 12
+    while offset + 8 <= len(raw):
+        chunk_id = raw[offset : offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", raw, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            format_tag, channels, sample_rate = struct.unpack_from("<HHI", raw, body)
+            (bits,) = struct.unpack_from("<H", raw, body + 14)
+            if channels != 1 or sample_rate != 8000:
+                logger.warning(
+                    f"⚠️ [BG-SOUND] Expected 8kHz mono, got {sample_rate}Hz x{channels}. Played as-is."
+                )
+            if format_tag == _WAVE_FORMAT_PCM and bits != 16:
+                raise ValueError(f"Unsupported PCM width: {bits} bits")
+        elif chunk_id == b"data":
+            return format_tag, raw[body : body + chunk_size]
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise ValueError("WAV file has no 'data' chunk")
+
+
+def _decode_source(raw: bytes) -> bytes:
+    """Source file -> 16-bit PCM."""
+    format_tag, payload = _parse_wav(raw)
+    if format_tag == _WAVE_FORMAT_ALAW:
+        return audio_utils.alaw2lin(payload, 2)
+    if format_tag == _WAVE_FORMAT_MULAW:
+        return audio_utils.ulaw2lin(payload, 2)
+    if format_tag == _WAVE_FORMAT_PCM:
+        return payload[: len(payload) - len(payload) % 2]
+    raise ValueError(f"Unsupported WAV format tag: {format_tag}")
+
+
+@functools.lru_cache(maxsize=16)
+def _load_loop(path: str, mtime_ns: int, gain: float, codec: str) -> BackgroundLoop:
+    with open(path, "rb") as f:
+        raw = f.read()
+    pcm = audio_utils.mul(_decode_source(raw), 2, gain)
+    encode = audio_utils.lin2alaw if codec == "alaw" else audio_utils.lin2ulaw
+    loop = BackgroundLoop(pcm, encode(pcm, 2), codec, gain)
+    logger.info(f"🎵 [BG-SOUND] Pre-encoded {path} ({loop.samples} samples, {codec}, gain {gain})")
+    return loop
+
+
+def get_background_loop(path: str | Path, gain: float, codec: str = "ulaw") -> BackgroundLoop | None:
+    """
+    Process-wide pre-processed background loop.
+
+    Blocking (file read + one-off DSP on first use): call from a thread executor
+    in async code. The cache key includes the file mtime, so a replaced file is
+    reloaded.
+
+    Args:
+        path: WAV (A-law, u-law or 16-bit PCM) or raw A-law file
+        gain: Attenuation applied once at load
+        codec: Output codec of the encoded loop ("ulaw" or "alaw")
+
+    Returns:
+        Shared BackgroundLoop, or None if the file is missing or unusable
+    """
+    if codec not in audio_utils.G711_CODECS:
+        raise ValueError(f"Unknown G.711 codec: {codec!r}")
+    resolved = Path(path).resolve()
+    try:
+        mtime_ns = resolved.stat().st_mtime_ns
+    except FileNotFoundError:
+        logger.warning(f"⚠️ [BG-SOUND] File not found: {path}")
+        return None
+    try:
+        return _load_loop(str(resolved), mtime_ns, float(gain), codec)
+    except (OSError, ValueError, struct.error) as e:
+        logger.error(f"❌ [BG-SOUND] Failed to load {path}: {e}")
+        return None
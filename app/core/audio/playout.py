@@ -0,0 +1,342 @@
+"""
+Playout Scheduler.
+
+Paces outbound telephony audio at real time (one 20ms frame per tick) for every
+call in the process from a single task, instead of one sleep loop per call.
+
+- Deadline clock: tick k is due at start + k * frame_seconds (time.monotonic),
+  so sleep jitter never accumulates into drift.
+- Catch-up: a late wake-up serves every frame that became due, bounded by
+  max_catch_up_frames (older deadlines are skipped and counted).
+- Coalescing: frames served in one tick (steady state frames_per_message, or
+  catch-up) go out as one transport message, up to max_frames_per_message.
+- Offload: with many streams in a tick, rendering (mixing/encoding) runs as
+  one job on the CPU offload pool; a barge-in (clear()) during that job drops
+  the frames it was rendering.
+- Hand-off: payloads go to each call's write queue (MediaWriter) without
+  waiting for the socket, so a slow carrier connection never delays the tick.
+- Reporting: per-stream underruns (audio starved mid-playback) and scheduler
+  overruns (a tick took longer than a frame) / late ticks / skipped frames.
+"""
+import asyncio
+import contextlib
+import inspect
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.core.cpu_offload import get_cpu_offload
+
+logger = logging.getLogger(__name__)
+
+FRAME_SECONDS = 0.02  # 20ms frames
+FRAME_BYTES_TELEPHONY = 160  # 20ms @ 8kHz G.711
+
+# Late wake-ups beyond this many frames resynchronize instead of bursting
+MAX_CATCH_UP_FRAMES = 5
+
+# Silence gaps shorter than this (ticks) between audio frames count as underruns
+UNDERRUN_WINDOW_TICKS = 25  # 500ms
+
+# Ticks serving at least this many streams render on the offload pool
+# (below it the thread hop costs more than the mixing it moves off the loop)
+OFFLOAD_MIN_STREAMS = 8
+
+
+@dataclass
+class PlayoutStats:
+    """Per-stream playout counters."""
+    frames_sent: int = 0  # queued audio frames played (background fill not counted)
+    messages_sent: int = 0
+    underruns: int = 0
+    max_buffered_frames: int = 0
+
+
+@dataclass
+class SchedulerStats:
+    """Scheduler-wide timing counters."""
+    ticks: int = 0
+    late_ticks: int = 0
+    skipped_frames: int = 0
+    overruns: int = 0
+    max_lateness_ms: float = 0.0
+
+
+class PlayoutStream:
+    """
+    Outbound audio buffer of one call, played by the shared PlayoutScheduler.
+
+    Enqueued audio is split into frames. On each tick the scheduler asks for the
+    frames that are due; every frame goes through render (e.g. mix with
+    background) and the results are handed to send coalesced.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], None],
+        render: Callable[[bytes | None], bytes | None] | None = None,
+        frame_bytes: int = FRAME_BYTES_TELEPHONY,
+        frames_per_message: int = 1,
+        max_frames_per_message: int = MAX_CATCH_UP_FRAMES,
+        name: str = "stream",
+    ):
+        """
+        Args:
+            send: Queues one (possibly coalesced) payload for the carrier without
+                blocking (e.g. MediaWriter.send_audio)
+            render: Frame renderer: queued frame (or None when the buffer is empty)
+                -> frame to send (or None to send nothing). Defaults to identity.
+            frame_bytes: Bytes per 20ms frame
+            frames_per_message: Frames coalesced per message in steady state
+            max_frames_per_message: Upper bound of frames per message (catch-up)
+            name: Label for logs
+        """
+        self._send = send
+        self._render = render or (lambda frame: frame)
+        self.frame_bytes = frame_bytes
+        self.frames_per_message = max(1, frames_per_message)
+        self.max_frames_per_message = max(self.frames_per_message, max_frames_per_message)
+        self.name = name
+        self.stats = PlayoutStats()
+        self._frames: deque[bytes] = deque()
+        self._credit = 0
+        self._idle_ticks = 0
+        self._playing = False
+        # Bumped by clear(): renders of frames taken before a barge-in are dropped
+        self.generation = 0
+
+    @property
+    def send_target(self) -> Callable[[bytes], None]:
+        """Callable each payload is handed to."""
+        return self._send
+
+    @property
+    def buffered_frames(self) -> int:
+        return len(self._frames)
+
+    @property
+    def is_playing(self) -> bool:
+        """True while queued audio is being played out."""
+        return bool(self._frames)
+
+    def enqueue(self, audio: bytes) -> None:
+        """Queue audio for paced playout (split into frames; last one may be short)."""
+        size = self.frame_bytes
+        self._frames.extend(audio[i : i + size] for i in range(0, len(audio), size))
+        self.stats.max_buffered_frames = max(self.stats.max_buffered_frames, len(self._frames))
+
+    def clear(self) -> int:
+        """Drop queued audio (barge-in). Returns the number of frames dropped."""
+        dropped = len(self._frames)
+        self._frames.clear()
+        self._playing = False
+        self.generation += 1
+        return dropped
+
+    def take(self, due: int) -> list[bytes | None]:
+        """Pop the frames due this tick (None where the buffer ran empty); [] if no message is due."""
+        self._credit += due
+        if self._credit < self.frames_per_message:
+            return []
+        count, self._credit = self._credit, 0
+
+        frames: list[bytes | None] = []
+        for _ in range(count):
+            frame = self._frames.popleft() if self._frames else None
+            self._track(frame is not None)
+            frames.append(frame)
+        return frames
+
+    def render(self, frames: list[bytes | None]) -> list[bytes]:
+        """Render taken frames and group them into payloads (may run on a worker thread)."""
+        rendered: list[bytes] = []
+        for frame in frames:
+            out = self._render(frame)
+            if out:
+                rendered.append(out)
+
+        step = self.max_frames_per_message
+        return [b"".join(rendered[i : i + step]) for i in range(0, len(rendered), step)]
+
+    def collect(self, due: int) -> list[bytes]:
+        """Render the frames due this tick and group them into payloads."""
+        return self.render(self.take(due))
+
+    def _track(self, has_audio: bool) -> None:
+        if has_audio:
+            if not self._playing and 0 < self._idle_ticks <= UNDERRUN_WINDOW_TICKS:
+                # Playback resumed after a short starvation gap
+                self.stats.underruns += 1
+            self._playing = True
+            self._idle_ticks = 0
+            self.stats.frames_sent += 1
+        else:
+            if self._playing:
+                self._playing = False
+                self._idle_ticks = 0
+            self._idle_ticks += 1
+
+    def send(self, payloads: list[bytes]) -> None:
+        """Hand payloads to the transport queue in order."""
+        for payload in payloads:
+            self._send(payload)
+            self.stats.messages_sent += 1
+
+    def play(self, due: int) -> None:
+        """Render and send the frames due this tick."""
+        self.send(self.collect(due))
+
+
+class PlayoutScheduler:
+    """
+    Single deadline-clocked ticker serving all registered PlayoutStreams.
+
+    Runs while at least one stream is registered. Sends are non-blocking
+    hand-offs to each call's write queue: a slow socket backs up only its own
+    call's queue, never the tick. Ticks that still take longer than a frame
+    (rendering) are reported as overruns.
+    """
+
+    def __init__(
+        self,
+        frame_seconds: float = FRAME_SECONDS,
+        max_catch_up_frames: int = MAX_CATCH_UP_FRAMES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.frame_seconds = frame_seconds
+        self.max_catch_up_frames = max_catch_up_frames
+        self._clock = clock
+        self._streams: set[PlayoutStream] = set()
+        self._task: asyncio.Task | None = None
+        self.stats = SchedulerStats()
+
+    @property
+    def stream_count(self) -> int:
+        return len(self._streams)
+
+    def register(self, stream: PlayoutStream) -> None:
+        """
+        Start pacing a stream (starts the ticker if needed). Must run inside the event loop.
+
+        Raises:
+            TypeError: The stream's send awaits (a coroutine function would never
+                run on the tick), so it cannot be paced
+        """
+        if inspect.iscoroutinefunction(stream.send_target):
+            raise TypeError(f"{stream.name}: playout send must queue without awaiting (e.g. queue_audio)")
+        self._streams.add(stream)
+        task = self._task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._task = asyncio.create_task(self._run())
+
+    def unregister(self, stream: PlayoutStream) -> None:
+        """Stop pacing a stream and log its counters."""
+        if stream in self._streams:
+            self._streams.discard(stream)
+            s = stream.stats
+            logger.info(
+                f"🎚️ [Playout] {stream.name} done: frames={s.frames_sent} messages={s.messages_sent} "
+                f"underruns={s.underruns} max_buffered={s.max_buffered_frames}"
+            )
+
+    async def close(self) -> None:
+        """Unregister everything and stop the ticker."""
+        for stream in list(self._streams):
+            self.unregister(stream)
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def _frames_due(self, start: float, tick: int) -> tuple[int, int]:
+        """Returns (frames due now, ticks skipped) for deadline start + tick * frame."""
+        now = self._clock()
+        due = int((now - start) / self.frame_seconds) + 1 - tick
+        if due <= 0:
+            return 0, 0
+        lateness_ms = (now - (start + tick * self.frame_seconds)) * 1000
+        self.stats.max_lateness_ms = max(self.stats.max_lateness_ms, lateness_ms)
+        if due == 1:
+            return 1, 0
+        self.stats.late_ticks += 1
+        skipped = max(0, due - self.max_catch_up_frames)
+        self.stats.skipped_frames += skipped
+        return due - skipped, skipped
+
+    async def _run(self) -> None:
+        logger.info("🎚️ [Playout] Scheduler started")
+        start = self._clock()
+        tick = 0
+        try:
+            while self._streams:
+                due, skipped = self._frames_due(start, tick)
+                tick += skipped
+                if due:
+                    work_start = self._clock()
+                    await self._serve(due)
+                    tick += due
+                    self.stats.ticks += 1
+                    if self._clock() - work_start > self.frame_seconds:
+                        self.stats.overruns += 1
+                delay = start + tick * self.frame_seconds - self._clock()
+                await asyncio.sleep(max(0.0, delay))
+        finally:
+            logger.info(
+                f"🎚️ [Playout] Scheduler stopped: ticks={self.stats.ticks} late={self.stats.late_ticks} "
+                f"skipped={self.stats.skipped_frames} overruns={self.stats.overruns} "
+                f"max_lateness={self.stats.max_lateness_ms:.1f}ms"
+            )
+
+    async def _serve(self, due: int) -> None:
+        taken: list[tuple[PlayoutStream, int, list[bytes | None]]] = []
+        for stream in list(self._streams):
+            frames = stream.take(due)
+            if frames:
+                taken.append((stream, stream.generation, frames))
+        if not taken:
+            return
+
+        offload = get_cpu_offload()
+        if offload.enabled and len(taken) >= OFFLOAD_MIN_STREAMS:
+            try:
+                rendered = await offload.run(_render_all, taken)
+            except Exception as e:
+                logger.warning(f"⚠️ [Playout] Offloaded render failed, rendering inline: {e}")
+                rendered = _render_all(taken)
+        else:
+            rendered = _render_all(taken)
+
+        for (stream, generation, _), payloads in zip(taken, rendered, strict=True):
+            # Barge-in or hang-up while the frames were rendering
+            if not payloads or stream.generation != generation or stream not in self._streams:
+                continue
+            try:
+                stream.send(payloads)
+            except Exception as e:
+                logger.debug(f"[Playout] {stream.name} send failed: {e}")
+
+
+def _render_all(taken: list[tuple[PlayoutStream, int, list[bytes | None]]]) -> list[list[bytes]]:
+    """Renders the frames taken from each stream this tick (a failing stream sends nothing)."""
+    rendered: list[list[bytes]] = []
+    for stream, _, frames in taken:
+        try:
+            rendered.append(stream.render(frames))
+        except Exception as e:
+            logger.error(f"❌ [Playout] {stream.name} render failed: {e}")
+            rendered.append([])
+    return rendered
+
+
+_scheduler: PlayoutScheduler | None = None
+
+
+def get_playout_scheduler() -> PlayoutScheduler:
+    """Process-wide playout scheduler (one ticker for all calls)."""
+    global _scheduler  # noqa: PLW0603 - process-wide scheduler
+    if _scheduler is None:
+        _scheduler = PlayoutScheduler()
+    return _scheduler
@@ -0,0 +1,122 @@
+"""
+PCM Ring Buffer.
+
+Fixed-capacity 16-bit PCM ring for the inbound path: one writer (the call's
+decoded audio) and any number of readers (VAD, STT push writer, utterance
+recorder), each with its own cursor over the same samples.
+
+- Zero-copy windows: the first max_window samples are mirrored past the end of
+  the ring, so any window up to max_window samples is one contiguous int16 view.
+- No per-frame allocations: write() copies into the preallocated ring; readers
+  hand out views, or float32 windows scaled into a per-reader scratch array.
+- Bounded: a reader that falls more than capacity samples behind skips ahead to
+  the oldest retained sample and counts what it lost.
+
+Views (and float32 windows) are only valid until the writer laps them
+(capacity samples later) or, for float32, until the reader's next read.
+"""
+import numpy as np
+
+_INT16_SCALE = np.float32(1 / 32768)
+
+
+class PCMRingBuffer:
+    """Single-writer, multi-reader 16-bit PCM ring."""
+
+    def __init__(self, capacity: int, max_window: int = 512):
+        """
+        Args:
+            capacity: Samples retained for readers
+            max_window: Largest window (samples) served as a contiguous view
+        """
+        if max_window < 1 or capacity < max_window:
+            raise ValueError("PCMRingBuffer needs 1 <= max_window <= capacity")
+        self.capacity = capacity
+        self.max_window = max_window
+        self._samples = np.zeros(capacity + max_window, dtype=np.int16)
+        self.written = 0  # total samples written (absolute position of the write cursor)
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """
+        Appends 16-bit PCM (whole samples).
+
+        Returns:
+            Samples written
+        """
+        samples = np.frombuffer(data, dtype=np.int16)
+        count = len(samples)
+        if count > self.capacity:
+            # Only the newest capacity samples can be retained
+            self.written += count - self.capacity
+            samples = samples[-self.capacity :]
+            count = self.capacity
+
+        capacity, ring = self.capacity, self._samples
+        start = self.written % capacity
+        first = min(count, capacity - start)
+        ring[start : start + first] = samples[:first]
+        if first < count:
+            ring[: count - first] = samples[first:]
+        # Keep the mirror of the head in sync (any write that touched it)
+        if start < self.max_window or first < count:
+            ring[capacity:] = ring[: self.max_window]
+        self.written += count
+        return count
+
+    def view(self, position: int, samples: int) -> np.ndarray:
+        """Contiguous int16 view of samples starting at absolute position."""
+        if samples > self.max_window:
+            raise ValueError(f"Window of {samples} samples exceeds {self.max_window}")
+        if position < self.written - self.capacity or position + samples > self.written:
+            raise ValueError(f"Samples [{position}, {position + samples}) are not in the ring")
+        start = position % self.capacity
+        return self._samples[start : start + samples]
+
+    def reader(self) -> "PCMReader":
+        """New reader positioned at the write cursor (reads only future audio)."""
+        return PCMReader(self)
+
+
+class PCMReader:
+    """Independent read cursor over a PCMRingBuffer."""
+
+    def __init__(self, ring: PCMRingBuffer):
+        self._ring = ring
+        self.position = ring.written
+        self.dropped = 0  # samples overwritten before this reader got to them
+        self._scratch = np.empty(ring.max_window, dtype=np.float32)
+
+    @property
+    def available(self) -> int:
+        """Samples ready to read."""
+        self._catch_up()
+        return self._ring.written - self.position
+
+    def read(self, samples: int) -> np.ndarray | None:
+        """Next window as an int16 view, or None until enough audio arrived."""
+        if self.available < samples:
+            return None
+        window = self._ring.view(self.position, samples)
+        self.position += samples
+        return window
+
+    def read_float32(self, samples: int) -> np.ndarray | None:
+        """Next window scaled to float32 [-1, 1) in this reader's scratch array."""
+        window = self.read(samples)
+        if window is None:
+            return None
+        out = self._scratch[:samples]
+        np.multiply(window, _INT16_SCALE, out=out, casting="unsafe")
+        return out
+
+    def skip(self) -> int:
+        """Discards unread audio. Returns the samples skipped."""
+        skipped = self.available
+        self.position = self._ring.written
+        return skipped
+
+    def _catch_up(self) -> None:
+        oldest = self._ring.written - self._ring.capacity
+        if self.position < oldest:
+            self.dropped += oldest - self.position
+            self.position = oldest
@@ -1,122 +1,133 @@
 """
 Audio Utilities Replacement for audioop (Python 3.13+ compatibility)
 
-This module provides pure Python implementations for audio operations previously
+This module provides NumPy implementations for audio operations previously
 handled by the 'audioop' module, which was removed in Python 3.13.
 It focuses on G.711 (A-law/mu-law) conversions and basic 16-bit PCM operations.
-Uses pre-calculated Look-Up Tables (LUTs) for efficient G.711 conversion.
+
+G.711 conversion is a single table lookup per sample (np.take over np.frombuffer).
+The tables are built once at import time with vectorized NumPy and reproduce
+audioop bit for bit (Sun g711.c reference: 14-bit mu-law, 13-bit A-law).
+The *_into variants write into a caller-owned buffer, so a per-call 20 ms frame
+loop can reuse one output buffer instead of allocating per frame.
+gain_g711 / mix_g711 fuse decode -> gain/mix -> encode for G.711 frames.
 """
 
-import math
-import struct
+import functools
+
+import numpy as np
 
 # =============================================================================
 # LOOK-UP TABLES GENERATION
 # =============================================================================
 
-def _make_decode_tables():
-    """Generate G.711 decode tables (8-bit to 16-bit PCM)."""
-    # A-law decode table
-    tbl_a2p = []
-    for i in range(256):
-        val = i ^ 0x55
-        t = val & 0x7F
-        seg = (t & 0x70) >> 4
-        x = (t & 0x0F)
-
-        linear_value = (x << 4) + 8 if seg == 0 else (x << 4) + 264 << seg - 1
-
-        if val & 0x80:
-            linear_value = -linear_value
-
-        tbl_a2p.append(linear_value)
-
-    # mu-law decode table
-    tbl_u2p = []
-    for i in range(256):
-        val = ~i & 0xFF
-        t = ((val & 0x0F) << 3) + 0x84
-        seg = (val & 0x70) >> 4
-        linear_value = t << seg
-        linear_value -= 0x84
-        if val & 0x80:
-            linear_value = -linear_value
-        tbl_u2p.append(linear_value)
-
-    return tbl_a2p, tbl_u2p
-
-
-def _linear2alaw_sample(pcm_val):
-    """Encode single PCM sample to A-law."""
-    if pcm_val == -32768:
-        pcm_val = -32767
-
-    sign = 0x00
-    if pcm_val < 0:
-        pcm_val = -pcm_val
-        pcm_val = pcm_val - 1
-        sign = 0x80
-
-    # Simple Segment-based Encoder for A-law
-    if pcm_val < 0:
-        pcm_val = -pcm_val
-        sign = 0x00  # 0x55 XORed later
-    else:
-        sign = 0x80
-
-    pcm_val = min(pcm_val, 32767)
-
-    if pcm_val >= 256:
-        exp = 7
-        for e in range(1, 8):
-            if pcm_val < (256 << e):
-                exp = e
-                break
-        mantissa = (pcm_val >> (exp + 3)) & 0x0F
-        byte = (exp << 4) | mantissa
-    else:
-        byte = (pcm_val >> 4)
-
-    encoded = (sign | byte) ^ 0x55
-    return encoded
-
-
-def _linear2ulaw_sample(pcm_val):
-    """Encode single PCM sample to mu-law."""
-    if pcm_val < 0:
-        pcm_val = -pcm_val
-        sign = 0x80
-    else:
-        sign = 0x00
-
-    pcm_val = min(pcm_val, 32635)
-    pcm_val += 0x84
-
-    exp = 7
-    for e in range(7, -1, -1):
-        if (pcm_val & (1 << (e + 3))) != 0:
-            exp = e
-            break
-
-    mantissa = (pcm_val >> (exp + 3)) & 0x0F
-    byte = (sign | (exp << 4) | mantissa)
-    return (~byte & 0xFF)
+# Segment end points of the reference encoders (audioop seg_uend / seg_aend).
+_SEG_UEND = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF], dtype=np.int32)
+_SEG_AEND = np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF], dtype=np.int32)
+
+_ULAW_BIAS = 0x84
+_ULAW_CLIP = 8159  # 14-bit magnitude clip
+
+
+def _make_decode_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Generate G.711 decode tables (8-bit code -> 16-bit PCM)."""
+    codes = np.arange(256, dtype=np.int32)
+
+    # A-law: even bits inverted, sign bit set means positive
+    a_val = codes ^ 0x55
+    quant = a_val & 0x0F
+    seg = (a_val & 0x70) >> 4
+    magnitude = np.where(
+        seg == 0,
+        (2 * quant + 1) << 3,
+        (2 * quant + 33) << (seg + 2),
+    )
+    alaw = np.where(a_val & 0x80, magnitude, -magnitude)
+
+    # mu-law: all bits inverted, sign bit set means negative
+    u_val = ~codes & 0xFF
+    t = (((u_val & 0x0F) << 3) + _ULAW_BIAS) << ((u_val & 0x70) >> 4)
+    ulaw = np.where(u_val & 0x80, _ULAW_BIAS - t, t - _ULAW_BIAS)
+
+    return alaw.astype(np.int16), ulaw.astype(np.int16)
+
+
+def _make_encode_tables() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Generate G.711 encode tables (16-bit PCM -> 8-bit code).
+
+    Tables are indexed by the uint16 view of the int16 sample, so encoding is
+    lut[pcm.view(np.uint16)] with no offset or widening copy.
+    """
+    pcm = np.arange(65536, dtype=np.uint32).astype(np.uint16).view(np.int16).astype(np.int32)
+
+    # mu-law on the 14-bit value
+    val = pcm >> 2
+    mask = np.where(val < 0, 0x7F, 0xFF)
+    mag = np.minimum(np.abs(val), _ULAW_CLIP) + (_ULAW_BIAS >> 2)
+    seg = np.searchsorted(_SEG_UEND, mag)
+    uval = (seg << 4) | ((mag >> np.minimum(seg + 1, 8)) & 0x0F)
+    ulaw = np.where(seg >= 8, 0x7F, uval) ^ mask
+
+    # A-law on the 13-bit value
+    val = pcm >> 3
+    mask = np.where(val >= 0, 0xD5, 0x55)
+    mag = np.where(val >= 0, val, -val - 1)
+    seg = np.searchsorted(_SEG_AEND, mag)
+    quant = np.where(seg < 2, mag >> 1, mag >> np.minimum(seg, 8)) & 0x0F
+    alaw = np.where(seg >= 8, 0x7F, (seg << 4) | quant) ^ mask
+
+    return alaw.astype(np.uint8), ulaw.astype(np.uint8)
 
 
 # =============================================================================
 # GENERATE TABLES AT MODULE IMPORT
 # =============================================================================
 
-# Generate Decode Tables (256 entries each)
+# Decode tables (256 entries each, int16)
 _ALAW_TO_PCM, _ULAW_TO_PCM = _make_decode_tables()
 
-# Generate Encode Tables (65536 entries each for full 16-bit range)
-_PCM_TO_ALAW = [0] * 65536
-_PCM_TO_ULAW = [0] * 65536
+# Encode tables (65536 entries each, uint8 - 64 KB)
+_PCM_TO_ALAW, _PCM_TO_ULAW = _make_encode_tables()
+
+for _table in (_ALAW_TO_PCM, _ULAW_TO_PCM, _PCM_TO_ALAW, _PCM_TO_ULAW):
+    _table.flags.writeable = False
+del _table
 
-for i in range(-32768, 32768):
-    _PCM_TO_ALAW[i + 32768] = _linear2alaw_sample(i)
-    _PCM_TO_ULAW[i + 32768] = _linear2ulaw_sample(i)
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def _check_width(width: int) -> None:
+    if width != 2:
+        raise ValueError("Only 2-byte (16-bit) width supported")
+
+
+def _pcm16(fragment: bytes) -> np.ndarray:
+    """Zero-copy int16 view of a PCM fragment."""
+    if len(fragment) % 2:
+        raise ValueError("not a whole number of frames")
+    return np.frombuffer(fragment, dtype=np.int16)
+
+
+def _codes(fragment: bytes) -> np.ndarray:
+    """Zero-copy uint8 view of a G.711 fragment."""
+    return np.frombuffer(fragment, dtype=np.uint8)
+
+
+def _out_view(out: bytearray | memoryview, count: int, dtype: type, itemsize: int) -> np.ndarray:
+    """Writable view of the first count items of a caller-owned byte buffer."""
+    if len(out) < count * itemsize:
+        raise ValueError(f"Output buffer too small: {len(out)} < {count * itemsize} bytes")
+    return np.frombuffer(out, dtype=dtype, count=count)
+
+
+def _saturate16(samples: np.ndarray) -> bytes:
+    """Clip to the int16 range in place and return the 16-bit PCM bytes."""
+    np.maximum(samples, -32768, out=samples)
+    np.minimum(samples, 32767, out=samples)
+    return samples.astype(np.int16).tobytes()
 
 
 # =============================================================================
@@ -134,10 +145,8 @@ def alaw2lin(fragment: bytes, width: int) -> bytes:
     Returns:
         Linear PCM bytes
     """
-    if width != 2:
-        raise ValueError("Only 2-byte (16-bit) width supported for G.711 conversion")
-
-    return b"".join(struct.pack("<h", _ALAW_TO_PCM[b]) for b in fragment)
+    _check_width(width)
+    return np.take(_ALAW_TO_PCM, _codes(fragment)).tobytes()
 
 
 def ulaw2lin(fragment: bytes, width: int) -> bytes:
@@ -151,10 +160,8 @@ def ulaw2lin(fragment: bytes, width: int) -> bytes:
     Returns:
         Linear PCM bytes
     """
-    if width != 2:
-        raise ValueError("Only 2-byte width supported")
-
-    return b"".join(struct.pack("<h", _ULAW_TO_PCM[b]) for b in fragment)
+    _check_width(width)
+    return np.take(_ULAW_TO_PCM, _codes(fragment)).tobytes()
 
 
 def lin2alaw(fragment: bytes, width: int) -> bytes:
@@ -168,18 +175,8 @@ def lin2alaw(fragment: bytes, width: int) -> bytes:
     Returns:
         A-law encoded bytes
     """
-    if width != 2:
-        raise ValueError("Only 2-byte width supported")
-
-    result = bytearray()
-    for i in range(0, len(fragment), 2):
-        sample = struct.unpack_from("<h", fragment, i)[0]
-        # Clamp to 16-bit range
-        sample = max(-32768, min(32767, sample))
-        # Map using LUT for speed
-        result.append(_PCM_TO_ALAW[sample + 32768])
-
-    return bytes(result)
+    _check_width(width)
+    return np.take(_PCM_TO_ALAW, _pcm16(fragment).view(np.uint16)).tobytes()
 
 
 def lin2ulaw(fragment: bytes, width: int) -> bytes:
@@ -193,18 +190,8 @@ def lin2ulaw(fragment: bytes, width: int) -> bytes:
     Returns:
         mu-law encoded bytes
     """
-    if width != 2:
-        raise ValueError("Only 2-byte width supported")
-
-    result = bytearray()
-    for i in range(0, len(fragment), 2):
-        sample = struct.unpack_from("<h", fragment, i)[0]
-        # Clamp to 16-bit range
-        sample = max(-32768, min(32767, sample))
-        # Map using LUT for speed
-        result.append(_PCM_TO_ULAW[sample + 32768])
-
-    return bytes(result)
+    _check_width(width)
+    return np.take(_PCM_TO_ULAW, _pcm16(fragment).view(np.uint16)).tobytes()
 
 
 def rms(fragment: bytes, width: int) -> int:
@@ -218,19 +205,12 @@ def rms(fragment: bytes, width: int) -> int:
     Returns:
         RMS value as integer
     """
-    if width != 2:
-        raise ValueError("Only 2-byte width supported")
-
-    if not fragment:
+    _check_width(width)
+    data = _pcm16(fragment)
+    if data.size == 0:
         return 0
-
-    sum_squares = 0.0
-    count = len(fragment) // 2
-    for i in range(0, len(fragment), 2):
-        val = struct.unpack_from("<h", fragment, i)[0]
-        sum_squares += val * val
-
-    return int(math.sqrt(sum_squares / count))
+    # float64 accumulation avoids int16 overflow when squaring
+    return int(np.sqrt(np.dot(data, data.astype(np.float64)) / data.size))
 
 
 def max(fragment: bytes, width: int) -> int:
@@ -244,15 +224,12 @@ def max(fragment: bytes, width: int) -> int:
     Returns:
         Maximum absolute value as integer
     """
-    if width != 2:
-        raise ValueError("Only 2-byte width supported")
-
-    max_val = 0
-    for i in range(0, len(fragment), 2):
-        val = abs(struct.unpack_from("<h", fragment, i)[0])
-        max_val = max(val, max_val)
-
-    return max_val
+    _check_width(width)
+    data = _pcm16(fragment)
+    if data.size == 0:
+        return 0
+    # Widen before abs: abs(int16(-32768)) overflows
+    return int(np.abs(data.astype(np.int32)).max())
 
 
 def mul(fragment: bytes, width: int, factor: float) -> bytes:
@@ -265,20 +242,12 @@ def mul(fragment: bytes, width: int, factor: float) -> bytes:
         factor: Multiplication factor for volume
 
     Returns:
-        Modified PCM bytes
+        Modified PCM bytes (clipped to 16-bit, rounded down like audioop)
     """
-    if width != 2:
-        raise ValueError("Only 2-byte width supported")
-
-    result = bytearray()
-    for i in range(0, len(fragment), 2):
-        val = struct.unpack_from("<h", fragment, i)[0]
-        new_val = int(val * factor)
-        # Clip to 16-bit range
-        new_val = max(-32768, min(32767, new_val))
-        result.extend(struct.pack("<h", new_val))
-
-    return bytes(result)
+    _check_width(width)
+    scaled = _pcm16(fragment) * float(factor)
+    np.floor(scaled, out=scaled)
+    return _saturate16(scaled)
 
 
 def add(fragment1: bytes, fragment2: bytes, width: int) -> bytes:
@@ -293,18 +262,251 @@ def add(fragment1: bytes, fragment2: bytes, width: int) -> bytes:
     Returns:
         Mixed PCM bytes (length of shorter fragment)
     """
-    if width != 2:
-        raise ValueError("Only 2-byte width supported")
+    _check_width(width)
+    d1 = _pcm16(fragment1)
+    d2 = _pcm16(fragment2)
+    n = min(d1.size, d2.size)
+    mixed = d1[:n].astype(np.int32)
+    mixed += d2[:n]
+    return _saturate16(mixed)
+
+
+# =============================================================================
+# PREALLOCATED-BUFFER API
+# =============================================================================
+
+def alaw2lin_into(fragment: bytes, out: bytearray | memoryview) -> int:
+    """
+    Decode A-law into a caller-owned buffer (16-bit PCM).
+
+    Args:
+        fragment: A-law encoded audio bytes
+        out: Writable buffer of at least 2 * len(fragment) bytes
+
+    Returns:
+        Number of bytes written
+    """
+    codes = _codes(fragment)
+    np.take(_ALAW_TO_PCM, codes, out=_out_view(out, codes.size, np.int16, 2))
+    return 2 * codes.size
 
-    min_len = min(len(fragment1), len(fragment2))
-    result = bytearray()
 
-    for i in range(0, min_len, 2):
-        val1 = struct.unpack_from("<h", fragment1, i)[0]
-        val2 = struct.unpack_from("<h", fragment2, i)[0]
-        new_val = val1 + val2
-        # Clip to 16-bit range
-        new_val = max(-32768, min(32767, new_val))
-        result.extend(struct.pack("<h", new_val))
+def ulaw2lin_into(fragment: bytes, out: bytearray | memoryview) -> int:
+    """
+    Decode mu-law into a caller-owned buffer (16-bit PCM).
 
-    return bytes(result)
+    Args:
+        fragment: mu-law encoded audio bytes
+        out: Writable buffer of at least 2 * len(fragment) bytes
+
+    Returns:
+        Number of bytes written
+    """
+    codes = _codes(fragment)
+    np.take(_ULAW_TO_PCM, codes, out=_out_view(out, codes.size, np.int16, 2))
+    return 2 * codes.size
+
+
+def lin2alaw_into(fragment: bytes, out: bytearray | memoryview) -> int:
+    """
+    Encode 16-bit PCM to A-law into a caller-owned buffer.
+
+    Args:
+        fragment: Linear PCM audio bytes
+        out: Writable buffer of at least len(fragment) // 2 bytes
+
+    Returns:
+        Number of bytes written
+    """
+    pcm = _pcm16(fragment)
+    np.take(_PCM_TO_ALAW, pcm.view(np.uint16), out=_out_view(out, pcm.size, np.uint8, 1))
+    return pcm.size
+
+
+def lin2ulaw_into(fragment: bytes, out: bytearray | memoryview) -> int:
+    """
+    Encode 16-bit PCM to mu-law into a caller-owned buffer.
+
+    Args:
+        fragment: Linear PCM audio bytes
+        out: Writable buffer of at least len(fragment) // 2 bytes
+
+    Returns:
+        Number of bytes written
+    """
+    pcm = _pcm16(fragment)
+    np.take(_PCM_TO_ULAW, pcm.view(np.uint16), out=_out_view(out, pcm.size, np.uint8, 1))
+    return pcm.size
+
+
+# =============================================================================
+# FUSED G.711 OPERATIONS (decode -> gain/mix -> encode in one call)
+# =============================================================================
+
+# G.711 codec names accepted by the fused helpers
+G711_CODECS = ("ulaw", "alaw")
+
+_DECODE_TABLES = {"ulaw": _ULAW_TO_PCM, "alaw": _ALAW_TO_PCM}
+_ENCODE_TABLES = {"ulaw": _PCM_TO_ULAW, "alaw": _PCM_TO_ALAW}
+
+
+def _check_codec(codec: str) -> None:
+    if codec not in _DECODE_TABLES:
+        raise ValueError(f"Unknown G.711 codec: {codec!r} (expected one of {G711_CODECS})")
+
+
+def decode_g711(fragment: bytes, codec: str = "ulaw") -> memoryview:
+    """
+    Decode G.711 to 16-bit PCM, returned as a byte view of the decoded array.
+
+    Same samples as alaw2lin/ulaw2lin without the final tobytes() copy: for
+    20ms frames, fancy indexing into a fresh array is cheaper than np.take into
+    a reused buffer (out= forces buffering).
+
+    Args:
+        fragment: G.711 encoded audio bytes
+        codec: "ulaw" or "alaw"
+
+    Returns:
+        memoryview over the PCM bytes (len() in bytes)
+    """
+    _check_codec(codec)
+    return memoryview(_DECODE_TABLES[codec][_codes(fragment)]).cast("B")
+
+
+@functools.lru_cache(maxsize=64)
+def _scaled_decode_table(codec: str, gain: float) -> np.ndarray:
+    """256-entry decode table with the gain applied (int32, same rounding and clipping as mul)."""
+    scaled = np.floor(_DECODE_TABLES[codec] * gain)
+    np.maximum(scaled, -32768, out=scaled)
+    np.minimum(scaled, 32767, out=scaled)
+    table = scaled.astype(np.int32)
+    table.flags.writeable = False
+    return table
+
+
+@functools.lru_cache(maxsize=64)
+def _gain_translation(source_codec: str, codec: str, gain: float) -> bytes:
+    """256-byte code -> code table: decode, gain, re-encode."""
+    pcm = _scaled_decode_table(source_codec, gain).astype(np.int16)
+    return np.take(_ENCODE_TABLES[codec], pcm.view(np.uint16)).tobytes()
+
+
+def gain_g711(
+    fragment: bytes,
+    gain: float,
+    codec: str = "ulaw",
+    source_codec: str | None = None,
+) -> bytes:
+    """
+    Apply a gain to G.711 audio without leaving the 8-bit domain.
+
+    Equivalent to lin2<codec>(mul(<source>2lin(fragment), gain)) but done as a
+    single bytes.translate over a cached 256-entry table.
+
+    Args:
+        fragment: G.711 encoded audio bytes
+        gain: Multiplication factor
+        codec: Output codec ("ulaw" or "alaw")
+        source_codec: Input codec (defaults to codec)
+
+    Returns:
+        G.711 encoded bytes in the output codec
+    """
+    source_codec = source_codec or codec
+    _check_codec(codec)
+    _check_codec(source_codec)
+    return bytes(fragment).translate(_gain_translation(source_codec, codec, float(gain)))
+
+
+def _encode_mixed(mixed: np.ndarray, codec: str, out: np.ndarray) -> None:
+    """Saturate an int32 mix in place and encode it into out."""
+    np.maximum(mixed, -32768, out=mixed)
+    np.minimum(mixed, 32767, out=mixed)
+    np.take(_ENCODE_TABLES[codec], mixed.astype(np.int16).view(np.uint16), out=out)
+
+
+def mix_g711_into(
+    voice: bytes,
+    background: bytes,
+    out: bytearray | memoryview,
+    codec: str = "ulaw",
+    background_codec: str | None = None,
+    background_gain: float = 1.0,
+) -> int:
+    """
+    Mix two G.711 fragments into a caller-owned buffer.
+
+    Decode, background gain, saturated add and encode are done on NumPy arrays
+    in one call (no intermediate PCM bytes). The gain is folded into the
+    background decode table, so the per-frame work is two lookups, one add,
+    the clip and the encode lookup.
+
+    Args:
+        voice: Foreground G.711 audio (codec)
+        background: Background G.711 audio (background_codec)
+        out: Writable buffer of at least min(len(voice), len(background)) bytes
+        codec: Codec of voice and of the output ("ulaw" or "alaw")
+        background_codec: Codec of background (defaults to codec)
+        background_gain: Multiplication factor applied to background
+
+    Returns:
+        Number of bytes written (length of the shorter fragment)
+    """
+    background_codec = background_codec or codec
+    _check_codec(codec)
+    _check_codec(background_codec)
+    v = _codes(voice)
+    b = _codes(background)
+    n = min(v.size, b.size)
+    mixed = np.take(_scaled_decode_table(codec, 1.0), v[:n])
+    mixed += np.take(_scaled_decode_table(background_codec, float(background_gain)), b[:n])
+    _encode_mixed(mixed, codec, _out_view(out, n, np.uint8, 1))
+    return n
+
+
+def mix_g711(
+    voice: bytes,
+    background: bytes,
+    codec: str = "ulaw",
+    background_codec: str | None = None,
+    background_gain: float = 1.0,
+) -> bytes:
+    """
+    Mix two G.711 fragments (see mix_g711_into).
+
+    Equivalent to lin2<codec>(add(<codec>2lin(voice),
+    mul(<background_codec>2lin(background), background_gain))).
+
+    Returns:
+        G.711 encoded bytes (length of the shorter fragment)
+    """
+    out = bytearray(min(len(voice), len(background)))
+    mix_g711_into(voice, background, out, codec, background_codec, background_gain)
+    return bytes(out)
+
+
+def mix_g711_pcm(voice: bytes, background_pcm: bytes, codec: str = "ulaw") -> bytes:
+    """
+    Mix G.711 voice with a 16-bit PCM background that is already attenuated.
+
+    Used with pre-processed background loops: the background needs no decode
+    or gain per frame, only the saturated add and the encode.
+
+    Args:
+        voice: Foreground G.711 audio (codec)
+        background_pcm: 16-bit linear PCM background
+        codec: Codec of voice and of the output ("ulaw" or "alaw")
+
+    Returns:
+        G.711 encoded bytes (length of the shorter fragment, in samples)
+    """
+    _check_codec(codec)
+    v = _codes(voice)
+    b = _pcm16(background_pcm)
+    n = min(v.size, b.size)
+    mixed = np.take(_scaled_decode_table(codec, 1.0), v[:n])
+    mixed += b[:n]
+    out = np.empty(n, dtype=np.uint8)
+    _encode_mixed(mixed, codec, out)
+    return out.tobytes()
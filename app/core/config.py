@@ -35,6 +35,12 @@ class Settings(BaseSettings):
     GROQ_API_KEY: str = ""
     GROQ_MODEL: str = "llama-3.3-70b-versatile"
     GROQ_EXTRACTION_MODEL: str = "llama-3.1-8b-instant"  # Post-call extraction (fast/cheap)
+    # V2: Whisper by overlapping chunks while the user speaks (partial transcripts)
+    V2_STT_STREAMING: bool = False
+    # V2: estimated prompt tokens of history per LLM request (0 = whole transcript)
+    V2_HISTORY_TOKEN_BUDGET: int = 3000
+    # V2: model that summarizes turns dropped from the window ("" = no summary)
+    V2_HISTORY_SUMMARY_MODEL: str = "llama-3.1-8b-instant"
 
     # Provider Selection (Environment-based)
     DEFAULT_STT_PROVIDER: str = "azure"
@@ -66,6 +72,40 @@ class Settings(BaseSettings):
     # --- Infrastructure (Redis) ---
     REDIS_URL: str = "redis://redis:6379/0"
 
+    # --- TTS Phrase Cache ---
+    # Backend for the second tier: "memory" (LRU only), "disk", "redis" or "off"
+    TTS_CACHE_BACKEND: str = "memory"
+    TTS_CACHE_MAX_MB: int = 32
+    TTS_CACHE_DIR: str = "/tmp/tts_phrase_cache"
+    TTS_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+
+    # --- Pipeline Execution ---
+    # Per-processor inbox size (channel mode); 0 keeps the shared priority queue
+    PIPELINE_CHANNEL_SIZE: int = 0
+    # Start the LLM on the turn text when the user stops speaking (held until the turn commits)
+    LLM_SPECULATIVE_PREFETCH: bool = False
+    # Tools of one LLM completion executed at the same time (per call)
+    TOOL_MAX_CONCURRENCY: int = 4
+
+    # --- LLM Hedging ---
+    # Race a backup request when the primary has no first token after the hedge delay
+    LLM_HEDGE_ENABLED: bool = False
+    LLM_HEDGE_MODEL: str = "llama-3.1-8b-instant"
+    # Hedge delay = this percentile of recent primary TTFTs, clamped to [MIN, MAX]
+    LLM_HEDGE_PERCENTILE: float = 95.0
+    LLM_HEDGE_MIN_DELAY_MS: int = 250
+    LLM_HEDGE_MAX_DELAY_MS: int = 1500
+    # Reuse results of read-only tools (per-tool TTL) and coalesce identical in-flight calls
+    TOOL_RESULT_CACHE_ENABLED: bool = True
+
+    # --- CPU Offload (VAD inference, audio DSP) ---
+    # Worker threads for NumPy/ONNX work; 0 runs it inline on the event loop
+    CPU_OFFLOAD_THREADS: int = 2
+    # Worker processes for pure-Python DSP; 0 uses the threads
+    CPU_OFFLOAD_PROCESSES: int = 0
+    # Jobs queued or running before submitters wait
+    CPU_OFFLOAD_MAX_PENDING: int = 256
+
     # --- Consolidated Validators ---
 
     @field_validator('POSTGRES_USER', 'POSTGRES_PASSWORD')
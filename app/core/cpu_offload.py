@@ -0,0 +1,149 @@
+"""
+CPU Offload Pool.
+
+Process-wide workers for CPU-bound audio work, so one busy call does not stall
+the event loop (and with it the 20ms timing of every other call).
+
+- Threads: NumPy/ONNX work. ONNX Runtime and large NumPy kernels release the
+  GIL, so the loop keeps running while they compute.
+- Processes (optional, CPU_OFFLOAD_PROCESSES > 0): pure-Python DSP that holds
+  the GIL. Functions and arguments must be picklable; without a process pool
+  run_process() uses the threads.
+- Bounded submission: at most max_pending jobs are queued or running; further
+  submitters wait for a slot (backpressure) instead of growing the queue.
+- Cancellation: cancelling the awaiting task (e.g. a barge-in cancelling the
+  producer) cancels its job if it has not started yet.
+
+CPU_OFFLOAD_THREADS=0 disables offloading: jobs run inline on the caller.
+"""
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class OffloadStats:
+    """Submission counters."""
+    submitted: int = 0
+    completed: int = 0
+    cancelled: int = 0
+    failed: int = 0
+    max_pending: int = 0
+    blocked_submits: int = 0  # submits that had to wait for a slot
+    blocked_seconds: float = 0.0
+
+
+class CPUOffloadPool:
+    """Bounded thread pool (+ optional process pool) for CPU-bound work."""
+
+    def __init__(self, threads: int = 2, processes: int = 0, max_pending: int = 256):
+        """
+        Args:
+            threads: Worker threads (0 = run jobs inline on the caller)
+            processes: Worker processes for pure-Python DSP (0 = use the threads)
+            max_pending: Jobs queued or running before submitters wait
+        """
+        if max_pending < 1:
+            raise ValueError("CPUOffloadPool max_pending must be >= 1")
+        self.threads = max(0, threads)
+        self.processes = max(0, processes)
+        self.max_pending = max_pending
+        self.stats = OffloadStats()
+        self._thread_pool = (
+            ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="cpu-offload") if self.threads else None
+        )
+        self._process_pool = ProcessPoolExecutor(max_workers=self.processes) if self.processes else None
+        self._pending = 0
+        self._slots: asyncio.Semaphore | None = None
+        self._slots_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """False when jobs run inline (no worker threads)."""
+        return self._thread_pool is not None
+
+    @property
+    def pending(self) -> int:
+        """Jobs queued or running."""
+        return self._pending
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Runs fn(*args) on a worker thread (inline when disabled)."""
+        return await self._submit(self._thread_pool, fn, args)
+
+    async def run_process(self, fn: Callable[..., T], *args: Any) -> T:
+        """Runs a picklable fn(*args) on a worker process (threads if no process pool)."""
+        return await self._submit(self._process_pool or self._thread_pool, fn, args)
+
+    def shutdown(self) -> None:
+        """Stops the workers (queued jobs are cancelled)."""
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, executor: Executor | None, fn: Callable[..., T], args: tuple) -> T:
+        if executor is None:
+            return fn(*args)
+
+        slots = self._get_slots()
+        if slots.locked():
+            self.stats.blocked_submits += 1
+            started = time.monotonic()
+            await slots.acquire()
+            self.stats.blocked_seconds += time.monotonic() - started
+        else:
+            await slots.acquire()
+
+        self._pending += 1
+        self.stats.submitted += 1
+        self.stats.max_pending = max(self.stats.max_pending, self._pending)
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except asyncio.CancelledError:
+            self.stats.cancelled += 1
+            raise
+        except Exception:
+            self.stats.failed += 1
+            raise
+        finally:
+            self._pending -= 1
+            slots.release()
+        self.stats.completed += 1
+        return result
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        """Submission semaphore of the running loop (recreated if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._slots_loop = loop
+        return self._slots
+
+
+_pool: CPUOffloadPool | None = None
+
+
+def get_cpu_offload() -> CPUOffloadPool:
+    """Process-wide offload pool (sized by CPU_OFFLOAD_* settings)."""
+    global _pool  # noqa: PLW0603 - process-wide workers
+    if _pool is None:
+        _pool = CPUOffloadPool(
+            threads=settings.CPU_OFFLOAD_THREADS,
+            processes=settings.CPU_OFFLOAD_PROCESSES,
+            max_pending=settings.CPU_OFFLOAD_MAX_PENDING,
+        )
+        logger.info(
+            f"🧮 [Offload] CPU pool: threads={_pool.threads} processes={_pool.processes} "
+            f"max_pending={_pool.max_pending}"
+        )
+    return _pool
@@ -0,0 +1,90 @@
+"""
+Frame Channel - bounded per-processor inbox.
+
+Used by Pipeline in channel mode: every FrameProcessor gets its own inbox and
+task, so a slow stage (STT/LLM/TTS) only fills its own inbox instead of holding
+the whole chain. Data frames wait for space (backpressure propagates upstream
+stage by stage, nothing is dropped); SystemFrames and UPSTREAM frames use an
+unbounded fast lane that is always served first, so interruptions overtake
+queued data and upstream signals cannot deadlock against a full inbox.
+"""
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from app.core.frames import Frame
+
+
+@dataclass
+class ChannelStats:
+    """Queue-depth and backpressure counters of one stage."""
+    depth: int = 0
+    max_depth: int = 0
+    frames_in: int = 0
+    frames_out: int = 0
+    fast_lane_frames: int = 0
+    blocked_puts: int = 0  # puts that had to wait for space
+    blocked_seconds: float = 0.0
+
+
+class FrameChannel:
+    """Bounded data lane + unbounded system fast lane, single consumer."""
+
+    def __init__(self, name: str, maxsize: int):
+        """
+        Args:
+            name: Owning processor name (for metrics/logs)
+            maxsize: Data frames held before put() waits
+        """
+        if maxsize < 1:
+            raise ValueError("FrameChannel maxsize must be >= 1")
+        self.name = name
+        self.maxsize = maxsize
+        self.stats = ChannelStats()
+        self._data: deque[tuple[Frame, int]] = deque()
+        self._fast: deque[tuple[Frame, int]] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+    def qsize(self) -> int:
+        return len(self._data) + len(self._fast)
+
+    def full(self) -> bool:
+        return len(self._data) >= self.maxsize
+
+    async def put(self, frame: Frame, direction: int, fast: bool = False) -> None:
+        """Enqueue a frame; data lane puts wait while the inbox is full."""
+        if fast:
+            self._fast.append((frame, direction))
+            self.stats.fast_lane_frames += 1
+        else:
+            if len(self._data) >= self.maxsize:
+                self.stats.blocked_puts += 1
+                started = time.monotonic()
+                while len(self._data) >= self.maxsize:
+                    self._writable.clear()
+                    await self._writable.wait()
+                self.stats.blocked_seconds += time.monotonic() - started
+            self._data.append((frame, direction))
+        self.stats.frames_in += 1
+        self._update_depth()
+        self._readable.set()
+
+    async def get(self) -> tuple[Frame, int]:
+        """Next frame, fast lane first."""
+        while not (self._fast or self._data):
+            self._readable.clear()
+            await self._readable.wait()
+        item = self._fast.popleft() if self._fast else self._data.popleft()
+        self.stats.frames_out += 1
+        self._update_depth()
+        if len(self._data) < self.maxsize:
+            self._writable.set()
+        return item
+
+    def _update_depth(self) -> None:
+        depth = len(self._data) + len(self._fast)
+        self.stats.depth = depth
+        self.stats.max_depth = max(self.stats.max_depth, depth)
@@ -1,40 +1,75 @@
+import itertools
 import time
 import uuid
-from dataclasses import asdict, dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import Any
 
+# Frame ids: UUID-shaped (36 chars), random per process + monotonic counter.
+# Unique across processes like uuid4, without an os.urandom call per frame.
+_PROCESS_HEX = uuid.uuid4().hex
+_ID_PREFIX = f"{_PROCESS_HEX[:8]}-{_PROCESS_HEX[8:12]}-{_PROCESS_HEX[12:16]}-{_PROCESS_HEX[16:20]}-"
+_id_counter = itertools.count(1)
 
-@dataclass(kw_only=True)
+# Default metadata shared by every frame (read-only; pass metadata={...} to set it)
+EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty_metadata() -> Mapping[str, Any]:
+    return EMPTY_METADATA
+
+
+def new_frame_id() -> str:
+    """Cheap unique id in UUID format."""
+    return f"{_ID_PREFIX}{next(_id_counter):012x}"
+
+
+@dataclass(kw_only=True, slots=True)
 class Frame:
     """
     Base class for all frames in the pipeline.
 
+    Slotted and low-allocation: one frame per 20ms of audio per call.
+
     Attributes:
-        id (str): Unique identifier for the frame instance.
+        id (str): Unique identifier for the frame instance (generated on first access).
         name (str): Class name of the frame.
         timestamp (float): Creation time (Unix timestamp).
         trace_id (str): Distributed tracing ID (Conversational turn ID).
-        span_id (str): Span ID for this specific frame processing unit.
-        metadata (Dict[str, Any]): Arbitrary metadata.
+        span_id (str): Span ID for this specific frame processing unit (generated on first access).
+        metadata (Mapping[str, Any]): Arbitrary metadata (shared read-only empty mapping by default).
     """
-    id: str = field(init=False)
-    name: str = field(init=False)
     timestamp: float = field(default_factory=time.time)
 
     # Distributed Tracing Support
     trace_id: str = field(default="")
-    span_id: str = field(init=False)
 
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_metadata)
 
-    def __post_init__(self):
-        self.id = str(uuid.uuid4())
-        self.span_id = str(uuid.uuid4())
-        self.name = self.__class__.__name__
+    _id: str | None = field(default=None, init=False, repr=False, compare=False)
+    _span_id: str | None = field(default=None, init=False, repr=False, compare=False)
 
+    def __post_init__(self):
         # Generate trace_id if not provided
         if not self.trace_id:
-            self.trace_id = str(uuid.uuid4())
+            self.trace_id = new_frame_id()
+
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = new_frame_id()
+        return self._id
+
+    @property
+    def span_id(self) -> str:
+        if self._span_id is None:
+            self._span_id = new_frame_id()
+        return self._span_id
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
 
     def to_dict(self, include_binary: bool = False) -> dict[str, Any]:
         """
@@ -43,73 +78,80 @@ class Frame:
         Args:
             include_binary: If False, truncates/omits large binary fields for logging/JSON safety.
         """
-        data = asdict(self)
+        data: dict[str, Any] = {"id": self.id, "name": self.name, "span_id": self.span_id}
+        for f in fields(self):
+            if f.init:
+                data[f.name] = getattr(self, f.name)
+        data["metadata"] = dict(self.metadata)
 
         # Helper to clean non-serializable data
-        if not include_binary and 'data' in data and isinstance(data['data'], bytes):
-            data['data'] = f"<bytes len={len(data['data'])}>"
+        binary = data.get("data")
+        if isinstance(binary, memoryview):
+            binary = data["data"] = binary.tobytes()
+        if not include_binary and isinstance(binary, bytes):
+            data['data'] = f"<bytes len={len(binary)}>"
 
         return data
 
     def __str__(self):
-        return f"<{self.name} id={self.id[:8]}>"
+        return f"<{self.name} id={self.id[-8:]}>"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SystemFrame(Frame):
     """Frames that have high priority (Level 1) and control the pipeline flow."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DataFrame(Frame):
     """Frames that carry content (audio, text, etc.) with normal priority (Level 2)."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ControlFrame(Frame):
     """Frames that modify the behavior of processors with normal priority (Level 2)."""
     pass
 
 # --- System Frames (High Priority) ---
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StartFrame(SystemFrame):
     """Signal to start processing or a new interaction."""
-    metadata: dict[str, Any] = field(default_factory=dict)
+    pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EndFrame(SystemFrame):
     """Signal to end processing or interaction."""
     reason: str = "normal"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CancelFrame(SystemFrame):
     """Signal to cancel current operation immediately."""
     reason: str = "cancelled"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EndTaskFrame(SystemFrame):
     """Signal to end a specific task/tool execution."""
     task_id: str = ""
     result: dict[str, Any] = field(default_factory=dict)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ErrorFrame(SystemFrame):
     """Signal that an error has occurred."""
     error: str
     fatal: bool = False
     context: dict[str, Any] = field(default_factory=dict)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserStartedSpeakingFrame(SystemFrame):
     """Signal detected by VAD that user has started speaking."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserStoppedSpeakingFrame(SystemFrame):
     """Signal detected by VAD that user has stopped speaking."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BackpressureFrame(SystemFrame):
     """
     Backpressure signal emitted when pipeline queue is full or approaching capacity.
@@ -128,34 +170,44 @@ class BackpressureFrame(SystemFrame):
 
 # --- Data Frames (Normal Priority) ---
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AudioFrame(DataFrame):
-    """Frame containing raw audio data."""
-    data: bytes
+    """Frame containing raw audio data (bytes, or a memoryview over a caller-owned buffer)."""
+    data: bytes | memoryview
     sample_rate: int
     channels: int = 1
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TextFrame(DataFrame):
     """Frame containing text data (transcript or response)."""
     text: str
     is_final: bool = True
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
+class LLMSpeculationFrame(DataFrame):
+    """
+    Tentative user turn: the user stopped speaking but the turn is not committed yet.
+
+    The LLM may start generating on it and hold the output until a final TextFrame
+    with the same text commits the turn.
+    """
+    text: str
+
+@dataclass(kw_only=True, slots=True)
 class ImageFrame(DataFrame):
     """Frame containing image data."""
     data: bytes
     format: str
     size: tuple[int, int]
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RMSFrame(DataFrame):
     """Frame containing Root Mean Square audio levels (for visualization)."""
     rms: float
 
 # --- Control Frames (Normal Priority) ---
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UpdateSettingsFrame(ControlFrame):
     """Frame to update processor settings dynamically."""
     settings: dict[str, Any]
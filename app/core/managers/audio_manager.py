@@ -9,13 +9,15 @@ import contextlib
 import logging
 from pathlib import Path
 
+from app.core.audio.background_loops import BackgroundLoop, get_background_loop
+from app.core.audio.playout import PlayoutStream, get_playout_scheduler
 from app.domain.ports import AudioTransport
 
 logger = logging.getLogger(__name__)
 
 # Constants
 CHUNK_SIZE_TELEPHONY = 160  # 160 bytes = 20ms @ 8kHz PCMU
-STREAM_INTERVAL_SECONDS = 0.02  # 20ms transmission interval
+FRAMES_PER_MESSAGE = 1  # Steady-state 20ms frames per media message (catch-up coalesces more)
 CLIENT_TYPE_BROWSER = "browser"
 CLIENT_TYPE_TWILIO = "twilio"
 CLIENT_TYPE_TELNYX = "telnyx"
@@ -30,24 +32,44 @@ class AudioManager:
     - Chunked audio transmission (adapted to client type)
     - Background audio looping (comfort noise)
     - Stream lifecycle management
+
+    Telephony output is paced in real time by the process-wide PlayoutScheduler
+    (20ms frames against a deadline clock); browser output is sent as whole blobs.
     """
 
-    def __init__(self, transport: AudioTransport, client_type: str = CLIENT_TYPE_TWILIO):
+    def __init__(
+        self,
+        transport: AudioTransport,
+        client_type: str = CLIENT_TYPE_TWILIO,
+        frames_per_message: int = FRAMES_PER_MESSAGE,
+    ):
         """
         Initialize AudioManager.
 
         Args:
             transport: Audio transport interface (WebSocket wrapper)
             client_type: Client identifier (browser/twilio/telnyx)
+            frames_per_message: Telephony frames coalesced per media message
         """
         self.transport = transport
         self.client_type = client_type
 
-        # Audio Queue (unbounded by default, implicit backpressure via pipeline)
+        # Audio Queue (browser; unbounded by default, implicit backpressure via pipeline)
         self.audio_queue: asyncio.Queue = asyncio.Queue()
 
-        # Background Audio State
-        self.bg_loop_buffer: bytes | None = None
+        # Paced playout buffer (telephony)
+        self.playout: PlayoutStream | None = None
+        if client_type != CLIENT_TYPE_BROWSER:
+            self.playout = PlayoutStream(
+                send=transport.queue_audio,
+                render=self._render_frame,
+                frame_bytes=CHUNK_SIZE_TELEPHONY,
+                frames_per_message=frames_per_message,
+                name=f"AudioManager[{client_type}]",
+            )
+
+        # Background Audio State (loop shared read-only across calls, cursor per call)
+        self.bg_loop: BackgroundLoop | None = None
         self.bg_loop_index: int = 0
 
         # Stream Task
@@ -61,12 +83,17 @@ class AudioManager:
 
     async def start(self):
         """Start audio streaming loop."""
-        if not self.stream_task:
+        if self.playout:
+            get_playout_scheduler().register(self.playout)
+            logger.info("🔊 [AudioManager] Paced playout started")
+        elif not self.stream_task:
             self.stream_task = asyncio.create_task(self._audio_stream_loop())
             logger.info("🔊 [AudioManager] Stream loop started")
 
     async def stop(self):
         """Stop audio streaming and cleanup."""
+        if self.playout:
+            get_playout_scheduler().unregister(self.playout)
         if self.stream_task:
             self.stream_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -92,7 +119,10 @@ class AudioManager:
         self.is_bot_speaking = True
 
         logger.debug(f"📤 [AudioManager] Queuing {len(audio_data)} bytes for transmission")
-        await self.audio_queue.put(audio_data)
+        if self.playout:
+            self.playout.enqueue(audio_data)
+        else:
+            await self.audio_queue.put(audio_data)
 
     async def clear_queue(self):
         """Clear all pending audio from queue."""
@@ -104,6 +134,8 @@ class AudioManager:
                 count += 1
             except asyncio.QueueEmpty:
                 break
+        if self.playout:
+            count += self.playout.clear()
 
         if count > 0:
             logger.info(f"🗑️ [AudioManager] Cleared {count} audio chunks from queue")
@@ -114,71 +146,65 @@ class AudioManager:
         await self.clear_queue()
         self.is_bot_speaking = False
 
+    @property
+    def codec(self) -> str:
+        """G.711 codec of outbound telephony audio."""
+        return "alaw" if self.audio_encoding == "PCMA" else "ulaw"
+
+    @property
+    def bg_loop_buffer(self) -> bytes | None:
+        """Encoded background loop (one pass, without wrap padding)."""
+        return self.bg_loop.encoded_loop if self.bg_loop else None
+
+    @bg_loop_buffer.setter
+    def bg_loop_buffer(self, audio_buffer: bytes | None) -> None:
+        self.bg_loop = BackgroundLoop.from_encoded(audio_buffer, self.codec) if audio_buffer else None
+        self.bg_loop_index = 0
+
     def set_background_audio(self, audio_buffer: bytes):
         """
         Set background audio loop buffer.
 
         Args:
-            audio_buffer: Audio to loop during silence
+            audio_buffer: Audio to loop during silence (already in the outbound codec)
         """
         self.bg_loop_buffer = audio_buffer
-        self.bg_loop_index = 0
         logger.info(f"🎵 [AudioManager] Background audio set ({len(audio_buffer)} bytes)")
 
-    async def load_background_audio(self, file_path: str):
+    async def load_background_audio(self, file_path: str, gain: float = 1.0):
         """
         Load background audio from file path (Non-blocking).
-        Uses a thread executor to avoid blocking the asyncio loop during disk IO.
+
+        The file is decoded, attenuated and encoded to the outbound codec once per
+        process (shared read-only by every call); the first load runs in a thread
+        executor to avoid blocking the asyncio loop.
 
         Args:
-            file_path: Path to .wav file
+            file_path: Path to .wav file (A-law, u-law or 16-bit PCM)
+            gain: Attenuation applied once at load
         """
         if not Path(file_path).exists():
             logger.warning(f"⚠️ [AudioManager] Background audio file not found: {file_path}")
             return
 
-        try:
-            loop = asyncio.get_running_loop()
-            # Offload blocking IO to thread pool
-            audio_data = await loop.run_in_executor(None, self._read_file_sync, file_path)
-            self.set_background_audio(audio_data)
-        except Exception as e:
-            logger.error(f"❌ [AudioManager] Failed to load background audio: {e}")
-
-    @staticmethod
-    def _read_file_sync(path: str) -> bytes:
-        """Sync helper for file reading (runs in thread)."""
-        with open(path, 'rb') as f:
-            return f.read()
+        loop = asyncio.get_running_loop()
+        bg_loop = await loop.run_in_executor(None, get_background_loop, file_path, gain, self.codec)
+        if bg_loop is not None:
+            self.bg_loop = bg_loop
+            self.bg_loop_index = 0
+            logger.info(f"🎵 [AudioManager] Background loop ready ({bg_loop.samples} samples)")
 
     async def _audio_stream_loop(self):
         """
-        Main audio streaming loop.
+        Browser streaming loop.
 
-        Continuously transmits audio chunks from queue or background audio.
+        Transmits queued audio blobs as they arrive (the browser player buffers them).
         """
         while True:
             try:
-                # Try to get audio from queue (non-blocking with timeout)
-                try:
-                    audio_blob = await asyncio.wait_for(
-                        self.audio_queue.get(),
-                        timeout=0.1
-                    )
-
-                    # Transmit queued audio
-                    await self._transmit_audio(audio_blob)
-                    self.audio_queue.task_done()
-
-                except TimeoutError:
-                    # No queued audio - send background audio if available
-                    # Only play background noise if we are SURE bot is not talking
-                    if self.bg_loop_buffer and not self.is_bot_speaking:
-                        await self._transmit_background_audio()
-                    else:
-                        # Small sleep to prevent busy loop
-                        await asyncio.sleep(STREAM_INTERVAL_SECONDS)
-
+                audio_blob = await self.audio_queue.get()
+                await self._transmit_audio(audio_blob)
+                self.audio_queue.task_done()
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -187,53 +213,26 @@ class AudioManager:
 
     async def _transmit_audio(self, audio_blob: bytes):
         """
-        Transmit audio blob with chunking based on client type.
+        Transmit a full audio blob (browser).
 
         Args:
             audio_blob: Audio data to transmit
         """
-        if self.client_type == CLIENT_TYPE_BROWSER:
-            # Browser: send full blob
-            await self.transport.send_audio(audio_blob)
-            logger.debug(f"📤 [AudioManager] Sent {len(audio_blob)} bytes (browser)")
-        else:
-            # Telephony: chunking
-            chunk_size = CHUNK_SIZE_TELEPHONY
-            for i in range(0, len(audio_blob), chunk_size):
-                chunk = audio_blob[i:i + chunk_size]
-                await self.transport.send_audio(chunk)
-
-            logger.debug(f"📤 [AudioManager] Sent {len(audio_blob)} bytes in chunks")
-
-        # Note: We do NOT auto-reset is_bot_speaking to False here anymore.
-        # It's safer to let the Orchestrator/Pipeline signal explicit "End of Turn".
-        # However, if queue is empty for a long time, we might reset?
-        # For strict audit: Removing the "auto-off" logic is safer to prevent flickering.
-        # The Orchestrator calls `interrupt_speaking` or `stop` which handles logic.
-        # Or, we assume "speaking" is strictly "has items in queue".
-
-        if self.audio_queue.empty():
-             # Graceful state update: Only reset if we truly have nothing left.
-             # In a real pipeline, "EndFrame" should trigger this.
-             # For now, we keep it simple but logged.
-             pass
-
-    async def _transmit_background_audio(self):
-        """Transmit background audio chunk."""
-        if not self.bg_loop_buffer:
-            return
-
-        chunk_size = CHUNK_SIZE_TELEPHONY
-        chunk = self.bg_loop_buffer[
-            self.bg_loop_index : self.bg_loop_index + chunk_size
-        ]
+        await self.transport.send_audio(audio_blob)
+        logger.debug(f"📤 [AudioManager] Sent {len(audio_blob)} bytes (browser)")
 
-        if len(chunk) < chunk_size:
-            # Loop back to start
-            self.bg_loop_index = 0
-            chunk = self.bg_loop_buffer[0:chunk_size]
-        else:
-            self.bg_loop_index += chunk_size
+    def _render_frame(self, frame: bytes | None) -> bytes | None:
+        """
+        Telephony frame for the current 20ms tick.
 
-        await self.transport.send_audio(chunk)
-        await asyncio.sleep(STREAM_INTERVAL_SECONDS)
+        Queued TTS audio as-is; when the queue is empty, a slice of the pre-encoded
+        background loop (only if we are SURE the bot is not talking).
+        """
+        if frame is not None:
+            return frame
+        bg_loop = self.bg_loop
+        if not bg_loop or self.is_bot_speaking:
+            return None
+        chunk = bg_loop.encoded(self.bg_loop_index, CHUNK_SIZE_TELEPHONY)
+        self.bg_loop_index = bg_loop.advance(self.bg_loop_index, CHUNK_SIZE_TELEPHONY)
+        return chunk
@@ -85,6 +85,12 @@ llm_tokens_total = Counter(
     ['provider', 'model', 'type']  # type: prompt, completion
 )
 
+llm_hedge_total = Counter(
+    'llm_hedge_total',
+    'LLM requests by hedging outcome',
+    ['outcome']  # outcome: not_needed, primary, backup, failed
+)
+
 tts_requests_total = Counter(
     'tts_requests_total',
     'Total TTS (Text-to-Speech) requests',
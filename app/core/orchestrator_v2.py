@@ -539,16 +539,16 @@ class VoiceOrchestratorV2:
         apply_client_overlay(self.config, self.client_type)
 
         # Load background audio
-        self._load_background_audio()
+        await self._load_background_audio()
 
-    def _load_background_audio(self) -> None:
+    async def _load_background_audio(self) -> None:
         """Load background audio if configured."""
         bg_audio_enabled = getattr(self.config, 'bg_audio_enabled', False)
         if not bg_audio_enabled:
             return
 
         bg_path = getattr(self.config, 'bg_audio_path', 'assets/silence.wav')
-        self.audio_manager.load_background_audio(bg_path)
+        await self.audio_manager.load_background_audio(bg_path)
 
     async def _build_pipeline(self) -> None:
         """Build processing pipeline using Factory."""
@@ -3,6 +3,7 @@ import contextlib
 import logging
 from collections.abc import Callable, Coroutine
 
+from app.core.frame_channel import ChannelStats
 from app.core.frames import BackpressureFrame, Frame, SystemFrame
 from app.core.processor import FrameDirection, FrameProcessor
 
@@ -51,15 +52,27 @@ class Pipeline(FrameProcessor):
     - Backpressure Management: Monitors queue size to prevent OOM.
     - Priority Queue: Ensures SystemFrames bypass traffic congestion.
     - Dropped Frame Tracking: Monitors system health under load.
+
+    Channel mode (channel_size set): instead of one shared queue feeding the
+    whole chain inline, every processor owns a bounded inbox and a task
+    (see app.core.frame_channel). A slow stage no longer blocks the stages
+    before it; full inboxes make the producer wait (backpressure up to
+    queue_frame) instead of dropping, and SystemFrames use a fast lane.
     """
 
-    def __init__(self, processors: list[FrameProcessor] | None = None, max_queue_size: int = 100):
+    def __init__(
+        self,
+        processors: list[FrameProcessor] | None = None,
+        max_queue_size: int = 100,
+        channel_size: int | None = None,
+    ):
         """
         Initialize pipeline.
 
         Args:
             processors: List of frame processors
-            max_queue_size: Maximum queue size (default 100)
+            max_queue_size: Maximum queue size (default 100). In channel mode, size of the entry inbox.
+            channel_size: Per-processor inbox size; enables channel mode (None = shared queue)
         """
         super().__init__(name="Pipeline")
         self._source = PipelineSource(self._handle_upstream)
@@ -82,6 +95,13 @@ class Pipeline(FrameProcessor):
         self._backpressure_warning_sent = False
         self._dropped_frames_count = 0
 
+        # Channel mode: one bounded inbox per processor
+        self.channel_size = channel_size
+        if channel_size:
+            self._source.attach_channel(max_queue_size)
+            for processor in self._processors[1:]:
+                processor.attach_channel(channel_size)
+
     def _link_processors(self):
         prev = self._processors[0]
         for curr in self._processors[1:]:
@@ -98,7 +118,13 @@ class Pipeline(FrameProcessor):
         # ✅ Start all processors (initializes background workers like TTS)
         for processor in self._processors:
             await processor.start()
-        
+
+        if self.channel_size:
+            for processor in self._processors:
+                processor.start_channel()
+            logger.info(f"Pipeline started (channel mode, inbox size {self.channel_size}).")
+            return
+
         self._task = asyncio.create_task(self._process_queue())
         logger.info("Pipeline started.")
 
@@ -110,10 +136,26 @@ class Pipeline(FrameProcessor):
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
 
+        if self.channel_size:
+            for processor in self._processors:
+                await processor.stop_channel()
+            self._log_channel_stats()
+
         for p in self._processors:
             await p.cleanup()
         logger.info("Pipeline stopped.")
 
+    def channel_stats(self) -> dict[str, ChannelStats]:
+        """Per-stage inbox metrics (channel mode only; empty otherwise)."""
+        return {p.name: p._channel.stats for p in self._processors if p._channel is not None}
+
+    def _log_channel_stats(self):
+        for name, stats in self.channel_stats().items():
+            logger.info(
+                f"[Pipeline] Stage {name}: in={stats.frames_in} max_depth={stats.max_depth} "
+                f"blocked_puts={stats.blocked_puts} blocked={stats.blocked_seconds * 1000:.0f}ms"
+            )
+
     async def queue_frame(self, frame: Frame, direction: int = FrameDirection.DOWNSTREAM):
         """
         Add a frame to the processing queue.
@@ -122,7 +164,14 @@ class Pipeline(FrameProcessor):
         - Emits WARNING signal at 80% capacity.
         - Emits CRITICAL signal when full.
         - SystemFrames have higher priority (1) than DataFrame/ControlFrame (2).
+
+        In channel mode the frame goes to the entry inbox instead and this waits
+        while it is full (nothing is dropped).
         """
+        if self.channel_size:
+            await self._queue_frame_channel(frame, direction)
+            return
+
         priority = 1 if isinstance(frame, SystemFrame) else 2
         self._counter += 1
 
@@ -173,6 +222,22 @@ class Pipeline(FrameProcessor):
                 direction
             )
 
+    async def _queue_frame_channel(self, frame: Frame, direction: int):
+        """Channel mode entry: Source inbox (DOWNSTREAM) or Sink inbox (UPSTREAM)."""
+        entry = self._source if direction == FrameDirection.DOWNSTREAM else self._sink
+        channel = entry._channel
+        depth, limit = channel.qsize(), channel.maxsize
+        if depth >= 0.8 * limit and not self._backpressure_warning_sent:
+            logger.warning(f"[Pipeline] Backpressure WARNING: entry inbox {depth}/{limit}")
+            self._backpressure_warning_sent = True
+            severity = "critical" if channel.full() else "warning"
+            await entry.enqueue_frame(
+                BackpressureFrame(queue_size=depth, max_size=limit, severity=severity), direction
+            )
+        elif depth < 0.5 * limit:
+            self._backpressure_warning_sent = False
+        await entry.enqueue_frame(frame, direction)
+
     async def _inject_critical_frame(self, frame: Frame, direction: int, force: bool = False):
         """Helper to inject high-priority system frames."""
         # Critical frames always get highest priority (0)
@@ -7,9 +7,11 @@ import logging
 from collections.abc import Callable
 from typing import Any
 
+from app.adapters.outbound.turn import LexicalEndOfTurnAdapter
 from app.core.audio.hold_audio import HoldAudioPlayer
 
 # Managers & Utils
+from app.core.config import settings
 from app.core.control_channel import ControlChannel
 from app.core.managers import CRMManager
 
@@ -20,7 +22,7 @@ from app.core.pipeline import Pipeline
 from app.domain.ports import LLMPort, STTPort, TTSPort
 
 # Domain Logic (Use Cases)
-from app.domain.use_cases import DetectTurnEndUseCase, ExecuteToolUseCase
+from app.domain.use_cases import DetectTurnEndUseCase, ExecuteToolUseCase, ToolResultCache
 from app.processors.logic.aggregator import ContextAggregator
 from app.processors.logic.llm import LLMProcessor
 from app.processors.logic.metrics import MetricsProcessor
@@ -100,7 +102,9 @@ class PipelineFactory:
         agg = ContextAggregator(
             config=config,
             conversation_history=conversation_history,
-            llm_provider=llm_port  # Needed for semantic context analysis
+            llm_provider=llm_port,  # Needed for semantic context analysis
+            speculative=settings.LLM_SPECULATIVE_PREFETCH,
+            end_of_turn=LexicalEndOfTurnAdapter()  # Local first; LLM only if ambiguous
         )
 
         # 4. LLM Processor
@@ -110,7 +114,11 @@ class PipelineFactory:
             context_data['crm'] = crm_manager.crm_context
 
         # Tool Use Case
-        execute_tool_use_case = ExecuteToolUseCase(tools)
+        execute_tool_use_case = ExecuteToolUseCase(
+            tools,
+            max_concurrency=settings.TOOL_MAX_CONCURRENCY,
+            cache=ToolResultCache() if settings.TOOL_RESULT_CACHE_ENABLED else None
+        )
 
         # Hold Audio Player (for tool execution delays)
         hold_audio_player = HoldAudioPlayer(orchestrator_ref.audio_manager)
@@ -141,4 +149,5 @@ class PipelineFactory:
         processors = [stt, vad, agg, llm, tts, metrics, reporter, output_sink]
         logger.info(f"🏭 [Factory] Pipeline assembled with {len(processors)} processors")
 
-        return Pipeline(processors)
+        # Channel mode: per-stage inboxes so a slow STT/LLM/TTS stage cannot stall VAD
+        return Pipeline(processors, channel_size=settings.PIPELINE_CHANNEL_SIZE or None)
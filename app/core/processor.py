@@ -1,8 +1,11 @@
+import asyncio
+import contextlib
 import logging
 from abc import ABC, abstractmethod
 from enum import IntEnum
 
-from app.core.frames import Frame
+from app.core.frame_channel import FrameChannel
+from app.core.frames import Frame, SystemFrame
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -19,6 +22,9 @@ class FrameProcessor(ABC):
         self.name = name or self.__class__.__name__
         self._next: FrameProcessor | None = None
         self._prev: FrameProcessor | None = None
+        # Channel mode (Pipeline(channel_size=...)): own inbox + task
+        self._channel: FrameChannel | None = None
+        self._channel_task: asyncio.Task | None = None
 
     def link(self, processor: 'FrameProcessor'):
         """Connect this processor to the next one."""
@@ -44,15 +50,58 @@ class FrameProcessor(ABC):
         """Send a frame to the next processor in the chain."""
         if direction == FrameDirection.DOWNSTREAM:
             if self._next:
-                await self._next.process_frame(frame, direction)
+                await self._next.enqueue_frame(frame, direction)
             else:
                 logger.debug(f"[{self.name}] Dropped DOWNSTREAM frame (End of Chain): {frame}")
         elif direction == FrameDirection.UPSTREAM:
             if self._prev:
-                await self._prev.process_frame(frame, direction)
+                await self._prev.enqueue_frame(frame, direction)
             else:
                 logger.debug(f"[{self.name}] Dropped UPSTREAM frame (Start of Chain): {frame}")
 
+    # --- Channel mode ---
+
+    async def enqueue_frame(self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM):
+        """
+        Deliver a frame to this processor.
+        Inline (process_frame on the caller's task) unless a channel is attached; then
+        the frame goes to the inbox (waiting for space if it is a full data lane).
+        """
+        if self._channel is None:
+            await self.process_frame(frame, direction)
+            return
+        fast = isinstance(frame, SystemFrame) or direction == FrameDirection.UPSTREAM
+        await self._channel.put(frame, direction, fast=fast)
+
+    def attach_channel(self, maxsize: int) -> FrameChannel:
+        """Give this processor a bounded inbox (served by start_channel)."""
+        self._channel = FrameChannel(self.name, maxsize)
+        return self._channel
+
+    def start_channel(self) -> None:
+        """Start the task draining the inbox."""
+        if self._channel is not None and (self._channel_task is None or self._channel_task.done()):
+            self._channel_task = asyncio.create_task(self._run_channel(), name=f"{self.name}-channel")
+
+    async def stop_channel(self) -> None:
+        """Stop the inbox task (queued frames are discarded)."""
+        if self._channel_task is not None:
+            self._channel_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._channel_task
+            self._channel_task = None
+
+    async def _run_channel(self):
+        channel = self._channel
+        while True:
+            frame, direction = await channel.get()
+            try:
+                await self.process_frame(frame, direction)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[{self.name}] Error processing {frame}: {e}", exc_info=True)
+
     async def cleanup(self):  # noqa: B027 - Optional hook for subclasses
         """Release resources."""
         pass
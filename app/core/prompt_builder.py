@@ -1,6 +1,13 @@
+import json
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
+# Compiled prompts kept across calls (one per distinct agent profile)
+MAX_COMPILED_PROMPTS = 128
+_compiled_prompts: "OrderedDict[tuple, CompiledPrompt]" = OrderedDict()
+
 
 class PromptBuilder:
     """
@@ -13,6 +20,29 @@ class PromptBuilder:
         """
         Combines base system prompt with dynamic style instructions AND context variables.
         """
+        return PromptBuilder.compile(config).render(context)
+
+    @staticmethod
+    def compile(config: Any) -> "CompiledPrompt":
+        """
+        Static part of the prompt (base + style + dynamic vars), built once per config version.
+
+        The version is the content of the profile fields the prompt depends on, so calls
+        sharing an agent profile share the compiled prompt.
+        """
+        key = _config_fingerprint(config)
+        compiled = _compiled_prompts.get(key)
+        if compiled is None:
+            compiled = PromptBuilder._compile(config)
+            _compiled_prompts[key] = compiled
+            if len(_compiled_prompts) > MAX_COMPILED_PROMPTS:
+                _compiled_prompts.popitem(last=False)
+        else:
+            _compiled_prompts.move_to_end(key)
+        return compiled
+
+    @staticmethod
+    def _compile(config: Any) -> "CompiledPrompt":
         base_prompt = getattr(config, 'system_prompt', '') or "Eres un asistente útil."
 
         # 1. Parsing Configuration
@@ -63,43 +93,79 @@ class PromptBuilder:
 
         dynamic_instructions = "\n".join(style_block)
 
-        final_prompt = f"""{base_prompt}
+        static_prompt = f"""{base_prompt}
 
 <dynamic_style_overrides>
 {dynamic_instructions}
 </dynamic_style_overrides>
 </dynamic_style_overrides>
 """
-        # 5. Inject Context Variables (Campaign Data)
-        if context:
-            try:
-                # Format as structured block
-                context_str = "\n".join([f"- {k}: {v}" for k, v in context.items()])
-                final_prompt += f"""
-<context_data>
-{context_str}
-</context_data>
-"""
-            except Exception as e:
-                logging.warning(f"Error injecting context: {e}")
-
-        # 6. Inject Dynamic Variables (NEW)
+        # 5. Dynamic Variables (NEW)
         # Allows {nombre}, {empresa} style placeholders in system_prompt
+        dynamic_vars: dict = {}
         if hasattr(config, 'dynamic_vars_enabled') and config.dynamic_vars_enabled:
-            dynamic_vars = getattr(config, 'dynamic_vars', None)
-            if dynamic_vars:
+            raw_vars = getattr(config, 'dynamic_vars', None)
+            if raw_vars:
                 try:
                     # Parse JSON if it's a string
-                    if isinstance(dynamic_vars, str):
-                        import json
-                        dynamic_vars = json.loads(dynamic_vars)
-
-                    # Replace {key} with value in final_prompt
-                    for key, value in dynamic_vars.items():
-                        placeholder = f"{{{key}}}"
-                        final_prompt = final_prompt.replace(placeholder, str(value))
-                        logging.debug(f"🔧 [DYNAMIC VAR] Replaced '{placeholder}' with '{value}'")
+                    if isinstance(raw_vars, str):
+                        raw_vars = json.loads(raw_vars)
+                    dynamic_vars = {f"{{{key}}}": str(value) for key, value in raw_vars.items()}
                 except Exception as e:
                     logging.warning(f"Error injecting dynamic variables: {e}")
 
-        return final_prompt
+        return CompiledPrompt(
+            static=_replace_vars(static_prompt, dynamic_vars),
+            dynamic_vars=dynamic_vars,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPrompt:
+    """
+    Prompt with everything but the per-call context already rendered.
+
+    render() only formats the <context_data> block (CRM / campaign data) and applies
+    the dynamic variables to it.
+    """
+    static: str
+    dynamic_vars: dict[str, str]
+
+    def render(self, context: dict | None = None) -> str:
+        if not context:
+            return self.static
+        # Inject Context Variables (Campaign Data)
+        try:
+            # Format as structured block
+            context_str = "\n".join([f"- {k}: {v}" for k, v in context.items()])
+        except Exception as e:
+            logging.warning(f"Error injecting context: {e}")
+            return self.static
+        context_block = f"""
+<context_data>
+{context_str}
+</context_data>
+"""
+        return self.static + _replace_vars(context_block, self.dynamic_vars)
+
+
+def _replace_vars(text: str, dynamic_vars: dict[str, str]) -> str:
+    # Replace {key} with value
+    for placeholder, value in dynamic_vars.items():
+        text = text.replace(placeholder, value)
+    return text
+
+
+def _config_fingerprint(config: Any) -> tuple:
+    dynamic_vars = None
+    if getattr(config, 'dynamic_vars_enabled', False):
+        dynamic_vars = getattr(config, 'dynamic_vars', None)
+        if not isinstance(dynamic_vars, str | None):
+            dynamic_vars = json.dumps(dynamic_vars, sort_keys=True, default=str)
+    return (
+        getattr(config, 'system_prompt', ''),
+        getattr(config, 'response_length', 'short'),
+        getattr(config, 'conversation_tone', 'warm'),
+        getattr(config, 'conversation_formality', 'semi_formal'),
+        dynamic_vars,
+    )
@@ -14,6 +14,21 @@ logger = logging.getLogger(__name__)
 # Constants
 _MODEL_RESET_STATES_TIME = 5.0
 
+
+def create_session(path, force_onnx_cpu=True):
+    """Single-threaded ONNX Runtime session for the Silero model."""
+    if not onnxruntime:
+        raise ImportError("onnxruntime is required for Silero VAD")
+
+    opts = onnxruntime.SessionOptions()
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
+
+    if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
+        return onnxruntime.InferenceSession(path, providers=["CPUExecutionProvider"], sess_options=opts)
+    return onnxruntime.InferenceSession(path, sess_options=opts)
+
+
 class SileroOnnxModel:
     """
     ONNX runtime wrapper for the Silero VAD model.
@@ -21,19 +36,7 @@ class SileroOnnxModel:
     """
 
     def __init__(self, path, force_onnx_cpu=True):
-        if not onnxruntime:
-            raise ImportError("onnxruntime is required for Silero VAD")
-
-        opts = onnxruntime.SessionOptions()
-        opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = 1
-
-        if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
-            self.session = onnxruntime.InferenceSession(
-                path, providers=["CPUExecutionProvider"], sess_options=opts
-            )
-        else:
-            self.session = onnxruntime.InferenceSession(path, sess_options=opts)
+        self.session = create_session(path, force_onnx_cpu)
 
         self.reset_states()
         self.sample_rates = [8000, 16000]
@@ -0,0 +1,214 @@
+"""
+Silero VAD Inference Service.
+
+One ONNX Runtime session per process, shared by every call. Each call opens a
+VADStream that owns its recurrent state (state/context); windows submitted by
+many calls in the same event-loop turn are batched into a single session.run
+(batch dimension = calls) on the CPU offload pool, off the event loop (ONNX
+Runtime releases the GIL while it computes).
+
+Batching is exact: the model treats batch rows independently, so a call gets
+the same probability it would get from its own SileroOnnxModel.
+"""
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.core.cpu_offload import get_cpu_offload
+from app.core.vad.model import create_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = Path(__file__).resolve().parent / "data" / "silero_vad.onnx"
+
+# Silero v5: 32ms windows, plus the tail of the previous window as context
+WINDOW_SAMPLES = {8000: 256, 16000: 512}
+CONTEXT_SAMPLES = {8000: 32, 16000: 64}
+
+# Windows per session.run
+MAX_BATCH = 64
+
+_STATE_SHAPE = (2, 128)
+
+
+@dataclass
+class VADServiceStats:
+    """Batching counters."""
+    batches: int = 0
+    windows: int = 0
+    max_batch: int = 0
+
+
+class VADStream:
+    """Per-call recurrent VAD state on the shared session."""
+
+    def __init__(self, service: "VADInferenceService", sample_rate: int):
+        if sample_rate not in WINDOW_SAMPLES:
+            raise ValueError(f"Supported sampling rates: {list(WINDOW_SAMPLES)}")
+        self._service = service
+        self.sample_rate = sample_rate
+        self.window_samples = WINDOW_SAMPLES[sample_rate]
+        self.context_samples = CONTEXT_SAMPLES[sample_rate]
+        self.state = np.zeros(_STATE_SHAPE, dtype=np.float32)
+        self.context = np.zeros(self.context_samples, dtype=np.float32)
+        # Bumped by reset(): results of a batch taken before the reset don't overwrite it
+        self.generation = 0
+
+    def reset(self) -> None:
+        self.state = np.zeros(_STATE_SHAPE, dtype=np.float32)
+        self.context = np.zeros(self.context_samples, dtype=np.float32)
+        self.generation += 1
+
+    async def infer(self, window: np.ndarray) -> float:
+        """
+        Speech probability of one window, batched with other calls.
+
+        Args:
+            window: float32 samples in [-1, 1], or raw int16 PCM (scaled on the worker)
+        """
+        return await self._service.submit(self, window)
+
+    def infer_sync(self, window: np.ndarray) -> float:
+        """Same as infer, run immediately on the calling thread (batch of one)."""
+        return self._service.run_now(self, window)
+
+
+class _Request:
+    __slots__ = ("future", "generation", "stream", "window")
+
+    def __init__(self, stream: VADStream, window: np.ndarray, future: asyncio.Future):
+        self.stream = stream
+        self.window = window
+        self.future = future
+        self.generation = stream.generation
+
+
+class VADInferenceService:
+    """Shared Silero session with cross-call micro-batching."""
+
+    def __init__(self, model_path: str | Path = DEFAULT_MODEL_PATH, max_batch: int = MAX_BATCH):
+        """
+        Args:
+            model_path: Silero ONNX model
+            max_batch: Upper bound of windows per session.run
+        """
+        self._session = create_session(str(model_path))
+        self.max_batch = max_batch
+        self.stats = VADServiceStats()
+        self._pending: deque[_Request] = deque()
+        self._worker: asyncio.Task | None = None
+
+    def open_stream(self, sample_rate: int) -> VADStream:
+        return VADStream(self, sample_rate)
+
+    async def submit(self, stream: VADStream, window: np.ndarray) -> float:
+        self._check(stream, window)
+        loop = asyncio.get_running_loop()
+        request = _Request(stream, window, loop.create_future())
+        self._pending.append(request)
+        worker = self._worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._worker = loop.create_task(self._drain())
+        return await request.future
+
+    def run_now(self, stream: VADStream, window: np.ndarray) -> float:
+        self._check(stream, window)
+        request = _Request(stream, window, None)
+        return self._run_batch([request])[0]
+
+    def _check(self, stream: VADStream, window: np.ndarray) -> None:
+        if window.shape != (stream.window_samples,):
+            raise ValueError(
+                f"Provided number of samples is {window.shape} (Required: {stream.window_samples})"
+            )
+
+    async def _drain(self) -> None:
+        offload = get_cpu_offload()
+        # One batch in flight at a time: per-stream state stays sequential
+        while self._pending:
+            batch = self._take_batch()
+            try:
+                probabilities = await offload.run(self._run_batch, batch)
+            except Exception as e:
+                logger.error(f"VAD batch inference error: {e}")
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+            for request, probability in zip(batch, probabilities, strict=True):
+                if not request.future.done():
+                    request.future.set_result(probability)
+
+    def _take_batch(self) -> list[_Request]:
+        """Oldest requests of one sample rate, at most one per stream (state is sequential)."""
+        sample_rate = self._pending[0].stream.sample_rate
+        batch: list[_Request] = []
+        streams: set[int] = set()
+        kept: deque[_Request] = deque()
+        while self._pending:
+            request = self._pending.popleft()
+            if (
+                len(batch) < self.max_batch
+                and request.stream.sample_rate == sample_rate
+                and id(request.stream) not in streams
+            ):
+                streams.add(id(request.stream))
+                batch.append(request)
+            else:
+                kept.append(request)
+        self._pending = kept
+        return batch
+
+    def _run_batch(self, batch: list[_Request]) -> list[float]:
+        first = batch[0].stream
+        context, size = first.context_samples, len(batch)
+        x = np.empty((size, context + first.window_samples), dtype=np.float32)
+        state = np.empty((2, size, 128), dtype=np.float32)
+        for i, request in enumerate(batch):
+            x[i, :context] = request.stream.context
+            window = request.window
+            if window.dtype == np.int16:
+                np.multiply(window, 1 / 32768, out=x[i, context:], casting="unsafe")
+            else:
+                x[i, context:] = window
+            state[:, i] = request.stream.state
+
+        out, new_state = self._session.run(
+            None, {"input": x, "state": state, "sr": np.array(first.sample_rate, dtype="int64")}
+        )
+
+        for i, request in enumerate(batch):
+            stream = request.stream
+            if stream.generation == request.generation:
+                stream.state = new_state[:, i].copy()
+                stream.context = x[i, -context:].copy()
+        self.stats.batches += 1
+        self.stats.windows += size
+        self.stats.max_batch = max(self.stats.max_batch, size)
+        return out[:, 0].tolist()
+
+
+_service: VADInferenceService | None = None
+_service_failed = False
+
+
+def get_vad_service() -> VADInferenceService | None:
+    """
+    Process-wide VAD service (model loaded on first use).
+
+    Returns:
+        The shared service, or None if the model or onnxruntime is unavailable
+    """
+    global _service, _service_failed  # noqa: PLW0603 - process-wide session
+    if _service is None and not _service_failed:
+        try:
+            _service = VADInferenceService()
+            logger.info(f"🎤 [VAD] Shared Silero session loaded ({DEFAULT_MODEL_PATH.name})")
+        except Exception as e:
+            _service_failed = True
+            logger.warning(f"⚠️ [VAD] Silero unavailable, VAD disabled: {e}")
+    return _service
@@ -145,8 +145,16 @@ def get_voice_ports(audio_mode: str = "twilio") -> VoicePorts:
 
     primary_llm = registry.create_llm(llm_config)
 
-    # Fallbacks (future: OpenAI, Claude)
-    llm_adapter = LLMWithFallback(primary=primary_llm, fallbacks=[])
+    # Fallbacks (future: OpenAI, Claude). Hedge backup: same provider, faster model
+    llm_adapter = LLMWithFallback(
+        primary=primary_llm,
+        fallbacks=[],
+        hedge_backup=primary_llm if settings.LLM_HEDGE_ENABLED else None,
+        hedge_model=settings.LLM_HEDGE_MODEL,
+        hedge_percentile=settings.LLM_HEDGE_PERCENTILE,
+        hedge_min_delay_s=settings.LLM_HEDGE_MIN_DELAY_MS / 1000.0,
+        hedge_max_delay_s=settings.LLM_HEDGE_MAX_DELAY_MS / 1000.0
+    )
     logger.info(f"✅ [VoicePorts] LLM configured: {llm_provider_name}")
 
     # -------------------------------------------------------------------------
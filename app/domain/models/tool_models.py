@@ -40,6 +40,8 @@ class ToolDefinition:
     description: str
     parameters: dict[str, Any]  # JSON Schema properties
     required: list[str] = field(default_factory=list)
+    # Read-only tools: seconds a successful result may be reused (0 = never cached)
+    cache_ttl_seconds: float = 0.0
 
     def to_openai_format(self) -> dict[str, Any]:
         """
@@ -4,6 +4,7 @@ from .audio_transport import AudioTransport
 from .cache_port import CachePort
 from .call_repository_port import CallRecord, CallRepositoryPort
 from .config_repository_port import ConfigDTO, ConfigNotFoundException, ConfigRepositoryPort
+from .end_of_turn_port import EndOfTurnPort
 from .llm_port import LLMException, LLMMessage, LLMPort, LLMRequest
 from .stt_port import STTConfig, STTEvent, STTException, STTPort, STTRecognizer, STTResultReason
 from .tts_port import TTSException, TTSPort, TTSRequest, VoiceMetadata
@@ -18,6 +19,8 @@ __all__ = [
     "ConfigNotFoundException",
     # Config
     "ConfigRepositoryPort",
+    # Turn detection
+    "EndOfTurnPort",
     "LLMException",
     "LLMMessage",
     # LLM
@@ -12,6 +12,16 @@ class AudioTransport(ABC):
         """Send audio data to the client."""
         pass
 
+    @abstractmethod
+    def queue_audio(self, audio_data: bytes) -> None:
+        """
+        Queue audio for the client without waiting for the network.
+
+        Used by the shared playout scheduler, which must never block on one
+        call's socket. Chunks must go out in the order they were queued.
+        """
+        pass
+
     @abstractmethod
     async def send_json(self, data: dict[str, Any]) -> None:
         """Send JSON control message to the client."""
@@ -0,0 +1,39 @@
+"""
+Port (Interface) for local end-of-turn detection.
+
+Scores how likely a transcript is a finished user turn, without a network call.
+Used by ClassifyTurnCompletionUseCase before falling back to the LLM.
+"""
+from abc import ABC, abstractmethod
+
+
+class EndOfTurnPort(ABC):
+    """
+    Port for local (in-process) semantic end-of-turn detectors.
+
+    Implementations must answer in well under 10 ms: they run on the event loop
+    between the user's silence and the turn commit.
+
+    Example implementations:
+    - LexicalEndOfTurnAdapter: es-MX trailing conjunction / filler rules
+    - A small text classifier run through onnxruntime (like Silero VAD)
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Detector identifier (logs and stats)."""
+        pass
+
+    @abstractmethod
+    def completion_probability(self, text: str) -> float:
+        """
+        Probability that text is a complete turn.
+
+        Args:
+            text: Aggregated user transcript of the candidate turn
+
+        Returns:
+            Score in [0, 1]; 0.5 means the detector has no opinion
+        """
+        pass
@@ -1,6 +1,17 @@
 """Domain Use Cases - Pure business logic."""
+from .classify_turn_completion import ClassifyTurnCompletionUseCase, TurnCompletionStats
 from .detect_turn_end import DetectTurnEndUseCase  # ✅ Module 14
 from .execute_tool import ExecuteToolUseCase
 from .handle_barge_in import BargeInCommand, HandleBargeInUseCase
+from .tool_result_cache import ToolCacheStats, ToolResultCache
 
-__all__ = ['BargeInCommand', 'DetectTurnEndUseCase', 'ExecuteToolUseCase', 'HandleBargeInUseCase']
+__all__ = [
+    'BargeInCommand',
+    'ClassifyTurnCompletionUseCase',
+    'DetectTurnEndUseCase',
+    'ExecuteToolUseCase',
+    'HandleBargeInUseCase',
+    'ToolCacheStats',
+    'ToolResultCache',
+    'TurnCompletionStats',
+]
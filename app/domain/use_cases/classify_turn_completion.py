@@ -0,0 +1,103 @@
+"""
+ClassifyTurnCompletionUseCase.
+
+Semantic end-of-turn decision for the 'semantic' segmentation strategy: a local
+EndOfTurnPort answers confident cases in-process; only ambiguous scores pay for
+an LLM round trip.
+"""
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from app.domain.ports.end_of_turn_port import EndOfTurnPort
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TurnCompletionStats:
+    """Counters for how candidate turn ends were decided."""
+    local_complete: int = 0
+    local_incomplete: int = 0
+    fallback_calls: int = 0
+    fallback_complete: int = 0
+    fallback_errors: int = 0
+
+    @property
+    def decisions(self) -> int:
+        return self.local_complete + self.local_incomplete + self.fallback_calls
+
+    @property
+    def local_hit_rate(self) -> float:
+        """Share of decisions made without the LLM fallback."""
+        if not self.decisions:
+            return 0.0
+        return (self.local_complete + self.local_incomplete) / self.decisions
+
+
+class ClassifyTurnCompletionUseCase:
+    """
+    Domain use case: is the aggregated transcript a finished turn?
+
+    Example:
+        >>> use_case = ClassifyTurnCompletionUseCase(LexicalEndOfTurnAdapter(), llm_fallback=ask_llm)
+        >>> if not await use_case.is_complete("quiero pagar con"):
+        ...     await asyncio.sleep(extra_wait)
+    """
+
+    def __init__(
+        self,
+        detector: EndOfTurnPort,
+        llm_fallback: Callable[[str], Awaitable[bool]] | None = None,
+        complete_threshold: float = 0.7,
+        incomplete_threshold: float = 0.3,
+    ):
+        """
+        Args:
+            detector: Local end-of-turn scorer
+            llm_fallback: Optional; asked only for scores between the thresholds
+            complete_threshold: Score at or above which the turn is complete
+            incomplete_threshold: Score at or below which the turn is incomplete
+        """
+        if not 0.0 <= incomplete_threshold < complete_threshold <= 1.0:
+            raise ValueError("Thresholds must satisfy 0 <= incomplete < complete <= 1")
+        self.detector = detector
+        self.llm_fallback = llm_fallback
+        self.complete_threshold = complete_threshold
+        self.incomplete_threshold = incomplete_threshold
+        self.stats = TurnCompletionStats()
+
+    async def is_complete(self, text: str) -> bool:
+        """
+        Decide whether text ends the user's turn.
+
+        Args:
+            text: Aggregated user transcript
+
+        Returns:
+            True if complete; ambiguous scores without fallback lean on 0.5
+        """
+        score = self.detector.completion_probability(text)
+
+        if score >= self.complete_threshold:
+            self.stats.local_complete += 1
+            return True
+        if score <= self.incomplete_threshold:
+            self.stats.local_incomplete += 1
+            return False
+        if self.llm_fallback is None:
+            return score >= 0.5
+
+        self.stats.fallback_calls += 1
+        try:
+            complete = await self.llm_fallback(text)
+        except Exception as e:
+            # Fail safe: assume complete to proceed
+            self.stats.fallback_errors += 1
+            logger.warning(f"[ClassifyTurn] LLM fallback failed: {e}")
+            return True
+
+        if complete:
+            self.stats.fallback_complete += 1
+        logger.debug(f"[ClassifyTurn] Ambiguous score {score:.2f} → LLM says complete={complete}")
+        return complete
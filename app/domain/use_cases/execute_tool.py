@@ -4,13 +4,18 @@ Execute Tool Use Case - Domain logic for tool orchestration.
 Hexagonal Architecture: Domain use case coordinates tool execution.
 Independent of infrastructure (adapters, frameworks).
 """
+import asyncio
 import logging
 
 from app.domain.models.tool_models import ToolDefinition, ToolRequest, ToolResponse
 from app.domain.ports.tool_port import ToolPort
+from app.domain.use_cases.tool_result_cache import ToolResultCache
 
 logger = logging.getLogger(__name__)
 
+# Tools of one LLM completion running at the same time (per call)
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 class ExecuteToolUseCase:
     """
@@ -25,14 +30,27 @@ class ExecuteToolUseCase:
     - Orchestrates multiple tools via dependency injection
     """
 
-    def __init__(self, tools: dict[str, ToolPort]):
+    def __init__(
+        self,
+        tools: dict[str, ToolPort],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: ToolResultCache | None = None,
+    ):
         """
         Initialize use case with available tools.
 
         Args:
             tools: Dictionary mapping tool_name -> ToolPort instance
+            max_concurrency: Tools of one batch (execute_many) running at the same time
+            cache: Optional result cache for tools declaring cache_ttl_seconds > 0
         """
         self.tools = tools
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache = cache
+        # Cacheability is declared by each tool's definition
+        self.cache_ttl = {
+            name: tool.get_definition().cache_ttl_seconds for name, tool in tools.items()
+        }
         logger.info(
             f"[ExecuteToolUseCase] Initialized with {len(tools)} tools: "
             f"{list(tools.keys())}"
@@ -42,7 +60,8 @@ class ExecuteToolUseCase:
         """
         Execute requested tool.
 
-        Validates tool exists, executes it, and logs results.
+        Validates tool exists, executes it, and logs results. Tools declaring
+        cache_ttl_seconds go through the result cache (if configured).
 
         Args:
             request: Tool execution request with tool_name and arguments
@@ -72,7 +91,29 @@ class ExecuteToolUseCase:
                 trace_id=trace_id
             )
 
-        # Execute tool
+        ttl_seconds = self.cache_ttl.get(tool_name, 0.0)
+        if self.cache is not None and ttl_seconds > 0:
+            return await self.cache.get_or_execute(request, ttl_seconds, self._run)
+        return await self._run(request)
+
+    def is_cached(self, request: ToolRequest) -> bool:
+        """
+        Check if request would be answered from the result cache right now.
+
+        Args:
+            request: Tool execution request
+
+        Returns:
+            True if a fresh cached result exists, False otherwise
+        """
+        if self.cache is None or self.cache_ttl.get(request.tool_name, 0.0) <= 0:
+            return False
+        return self.cache.is_cached(request)
+
+    async def _run(self, request: ToolRequest) -> ToolResponse:
+        """Execute a registered tool with timeout and error handling."""
+        trace_id = request.trace_id
+        tool_name = request.tool_name
         tool = self.tools[tool_name]
 
         logger.info(
@@ -81,7 +122,21 @@ class ExecuteToolUseCase:
         )
 
         try:
-            response = await tool.execute(request)
+            # Backstop: adapters apply their own timeouts, a hung tool must not hold the turn
+            response = await asyncio.wait_for(tool.execute(request), timeout=request.timeout_seconds)
+        except TimeoutError:
+            logger.warning(
+                f"[ExecuteToolUseCase] trace={trace_id} "
+                f"Tool '{tool_name}' timed out after {request.timeout_seconds}s"
+            )
+
+            return ToolResponse(
+                tool_name=tool_name,
+                result=None,
+                success=False,
+                error_message=f"Tool timeout ({request.timeout_seconds}s)",
+                trace_id=trace_id
+            )
         except Exception as e:
             # Catch any unexpected exceptions from adapter
             logger.error(
@@ -112,6 +167,33 @@ class ExecuteToolUseCase:
 
         return response
 
+    async def execute_many(self, requests: list[ToolRequest]) -> list[ToolResponse]:
+        """
+        Execute independent tools concurrently (at most max_concurrency at a time).
+
+        Each tool keeps its own timeout; one failure does not affect the others.
+
+        Args:
+            requests: Tool requests from one LLM completion
+
+        Returns:
+            ToolResponses in the same order as requests
+        """
+        if len(requests) == 1:
+            return [await self.execute(requests[0])]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(request: ToolRequest) -> ToolResponse:
+            async with semaphore:
+                return await self.execute(request)
+
+        logger.info(
+            f"[ExecuteToolUseCase] Executing {len(requests)} tools "
+            f"(max {self.max_concurrency} concurrent): {[r.tool_name for r in requests]}"
+        )
+        return list(await asyncio.gather(*(run(r) for r in requests)))
+
     def get_tool_definitions(self) -> list[ToolDefinition]:
         """
         Get all tool definitions for LLM function calling.
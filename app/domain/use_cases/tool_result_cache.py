@@ -0,0 +1,149 @@
+"""
+Tool Result Cache - TTL cache with single-flight for read-only tools.
+
+Keys are tool name + canonical JSON of arguments and request context (server
+URL/secret), so {"a": 1, "b": 2} and {"b": 2, "a": 1} share an entry. Only
+tools that declare ToolDefinition.cache_ttl_seconds > 0 are cached or
+coalesced: tools with side effects (bookings, updates) always run.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+
+from app.domain.models.tool_models import ToolRequest, ToolResponse
+
+logger = logging.getLogger(__name__)
+
+# Entries kept per cache (LRU beyond this)
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass
+class ToolCacheStats:
+    """Counters for how cacheable tool requests were served."""
+    hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of cacheable requests served without a new execution."""
+        total = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+def cache_key(request: ToolRequest) -> str:
+    """Canonical key: tool name + sorted JSON of arguments and context."""
+    payload = json.dumps(
+        [request.arguments, request.context],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return f"{request.tool_name}:{payload}"
+
+
+class ToolResultCache:
+    """
+    Successful tool responses by key, with per-entry TTL.
+
+    Concurrent requests for the same key share one execution (single-flight);
+    failed responses are returned to every waiter but never stored.
+
+    Example:
+        >>> cache = ToolResultCache()
+        >>> response = await cache.get_or_execute(request, ttl_seconds=60, execute=run_tool)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: Entries kept before evicting the least recently used
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, ToolResponse]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.stats = ToolCacheStats()
+
+    def get(self, request: ToolRequest) -> ToolResponse | None:
+        """Fresh cached response for request, or None."""
+        key = cache_key(request)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def is_cached(self, request: ToolRequest) -> bool:
+        """True if request would be answered from the cache right now."""
+        return self.get(request) is not None
+
+    async def get_or_execute(
+        self,
+        request: ToolRequest,
+        ttl_seconds: float,
+        execute: Callable[[ToolRequest], Awaitable[ToolResponse]],
+    ) -> ToolResponse:
+        """
+        Cached response, the in-flight execution's response, or a new execution.
+
+        Args:
+            request: Tool request (trace_id of the response is the caller's)
+            ttl_seconds: Lifetime of a successful response
+            execute: Runs the tool; must return a ToolResponse (not raise)
+
+        Returns:
+            ToolResponse for request
+        """
+        cached = self.get(request)
+        if cached is not None:
+            self.stats.hits += 1
+            logger.info(f"[ToolResultCache] trace={request.trace_id} HIT '{request.tool_name}'")
+            return replace(cached, execution_time_ms=0.0, trace_id=request.trace_id)
+
+        key = cache_key(request)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+            logger.info(f"[ToolResultCache] trace={request.trace_id} COALESCED '{request.tool_name}'")
+        else:
+            self.stats.misses += 1
+            task = asyncio.create_task(self._fill(key, request, ttl_seconds, execute))
+            self._inflight[key] = task
+
+        # Shielded: a cancelled caller (barge-in) does not cancel the shared execution
+        response = await asyncio.shield(task)
+        return replace(response, trace_id=request.trace_id)
+
+    async def _fill(
+        self,
+        key: str,
+        request: ToolRequest,
+        ttl_seconds: float,
+        execute: Callable[[ToolRequest], Awaitable[ToolResponse]],
+    ) -> ToolResponse:
+        try:
+            response = await execute(request)
+            if response.success:
+                self._entries[key] = (self._clock() + ttl_seconds, response)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all stored responses (in-flight executions keep running)."""
+        self._entries.clear()
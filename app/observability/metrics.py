@@ -21,6 +21,7 @@ class LatencyMetrics:
     stt_latency: float = 0.0
     llm_ttfb: float = 0.0        # Time To First Byte from LLM
     llm_total: float = 0.0       # Total LLM generation time
+    tts_ttfb: float = 0.0        # Time To First Byte from TTS (first audio chunk)
     tts_latency: float = 0.0
 
     # Pipeline metrics
@@ -37,6 +38,7 @@ class LatencyMetrics:
             'stt_latency_ms': round(self.stt_latency, 2),
             'llm_ttfb_ms': round(self.llm_ttfb, 2),
             'llm_total_ms': round(self.llm_total, 2),
+            'tts_ttfb_ms': round(self.tts_ttfb, 2),
             'tts_latency_ms': round(self.tts_latency, 2),
             'total_latency_ms': round(self.total_latency, 2),
             'queue_depth_max': self.queue_depth_max,
@@ -68,6 +70,7 @@ class MetricsCollector:
             'total_requests': 0,
             'avg_stt_latency': 0.0,
             'avg_llm_ttfb': 0.0,
+            'avg_tts_ttfb': 0.0,
             'avg_tts_latency': 0.0,
         }
 
@@ -82,7 +85,7 @@ class MetricsCollector:
 
         Args:
             trace_id: Conversation turn ID
-            component: 'stt', 'llm_ttfb', 'llm_total', 'tts'
+            component: 'stt', 'llm_ttfb', 'llm_total', 'tts_ttfb', 'tts'
             latency_ms: Latency in milliseconds
         """
         async with self._lock:
@@ -105,6 +108,8 @@ class MetricsCollector:
                 metrics.llm_ttfb = latency_ms
             elif component == 'llm_total':
                 metrics.llm_total = latency_ms
+            elif component == 'tts_ttfb':
+                metrics.tts_ttfb = latency_ms
             elif component == 'tts':
                 metrics.tts_latency = latency_ms
             elif component == 'queue_depth':
@@ -133,6 +138,9 @@ class MetricsCollector:
         elif component == 'llm_ttfb':
             prev = self._stats['avg_llm_ttfb']
             self._stats['avg_llm_ttfb'] = prev + (latency_ms - prev) / n
+        elif component == 'tts_ttfb':
+            prev = self._stats['avg_tts_ttfb']
+            self._stats['avg_tts_ttfb'] = prev + (latency_ms - prev) / n
         elif component == 'tts':
             prev = self._stats['avg_tts_latency']
             self._stats['avg_tts_latency'] = prev + (latency_ms - prev) / n
@@ -154,6 +162,7 @@ class MetricsCollector:
                 'total_requests': self._stats['total_requests'],
                 'avg_stt_latency_ms': round(self._stats['avg_stt_latency'], 2),
                 'avg_llm_ttfb_ms': round(self._stats['avg_llm_ttfb'], 2),
+                'avg_tts_ttfb_ms': round(self._stats['avg_tts_ttfb'], 2),
                 'avg_tts_latency_ms': round(self._stats['avg_tts_latency'], 2),
                 'traces_in_memory': len(self._metrics)
             }
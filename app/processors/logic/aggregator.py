@@ -5,11 +5,14 @@ from typing import Any
 from app.core.frames import (
     CancelFrame,
     Frame,
+    LLMSpeculationFrame,
     TextFrame,
     UserStartedSpeakingFrame,
     UserStoppedSpeakingFrame,
 )
 from app.core.processor import FrameDirection, FrameProcessor
+from app.domain.ports import EndOfTurnPort, LLMMessage, LLMRequest
+from app.domain.use_cases import ClassifyTurnCompletionUseCase
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +22,39 @@ class ContextAggregator(FrameProcessor):
     Aggregates User Transcripts into coherent Turns.
     Manages Conversation History.
     Triggers LLM only when "Turn" is complete (Smart Silence).
+
+    Speculative mode: as soon as the user stops speaking, the tentative turn text is
+    pushed as an LLMSpeculationFrame so the LLM can start generating during the
+    Smart Silence wait. The commit still happens after the same timeouts (no extra
+    false turn-ends); the LLM releases its held output if the committed text matches.
+
+    Semantic strategy: a local EndOfTurnPort scores each candidate turn end; the
+    LLM is asked only when the local score is ambiguous.
     """
-    def __init__(self, config: Any, conversation_history: list[dict], llm_provider: Any = None):
+    def __init__(
+        self,
+        config: Any,
+        conversation_history: list[dict],
+        llm_provider: Any = None,
+        speculative: bool = False,
+        end_of_turn: EndOfTurnPort | None = None,
+    ):
         super().__init__(name="ContextAggregator")
         self.config = config
         # NOTE: conversation_history is a shared mutable list reference.
         # It MUST be modified in-place to maintain sync with Orchestrator.
         self.conversation_history = conversation_history
         self.llm_provider = llm_provider
+        self.speculative = speculative
+        # Without a local detector every semantic check goes to the LLM
+        self.turn_classifier = (
+            ClassifyTurnCompletionUseCase(
+                end_of_turn,
+                llm_fallback=self._llm_completion_check if llm_provider else None,
+            )
+            if end_of_turn
+            else None
+        )
 
         # State
         self.interim_buffer = ""
@@ -78,6 +106,7 @@ class ContextAggregator(FrameProcessor):
         # Start Turn Timer if we have accumulated text
         if self.current_turn_text:
             self._turn_timer_task = asyncio.create_task(self._monitor_turn_completion())
+            await self._speculate()
 
     async def _handle_text(self, text: str):
         if not text.strip():
@@ -92,6 +121,12 @@ class ContextAggregator(FrameProcessor):
              if self._turn_timer_task:
                  self._turn_timer_task.cancel()
              self._turn_timer_task = asyncio.create_task(self._monitor_turn_completion())
+             await self._speculate()
+
+    async def _speculate(self):
+        """Let the LLM start on the tentative turn (superseded by the next speculation or CancelFrame)."""
+        if self.speculative:
+            await self.push_frame(LLMSpeculationFrame(text=self.current_turn_text.strip()))
 
     async def _monitor_turn_completion(self):
         try:
@@ -101,7 +136,8 @@ class ContextAggregator(FrameProcessor):
             # 2. Semantic Check (if enabled and provider available)
             strategy = getattr(self.config, 'segmentation_strategy', 'default')
 
-            if strategy == 'semantic' and self.llm_provider and len(self.current_turn_text) > 5:
+            can_classify = self.turn_classifier or self.llm_provider
+            if strategy == 'semantic' and can_classify and len(self.current_turn_text) > 5:
                 is_complete = await self._check_semantic_completion(self.current_turn_text)
                 if not is_complete:
                     logger.info(f"🤔 [SEMANTIC] Sentence incomplete: '{self.current_turn_text}'. Extending wait.")
@@ -120,32 +156,55 @@ class ContextAggregator(FrameProcessor):
 
     async def _check_semantic_completion(self, text: str) -> bool:
         """
-        Ask LLM if the sentence is complete.
+        Decide if the sentence is complete (local detector first, LLM if ambiguous).
         Returns True if complete, False if incomplete.
         """
-        try:
-            system_prompt = (
-                "You are a helpful assistant serving as a semantic detector. "
-                "Analyze the user's speech transcript. "
-                "Output ONLY 'YES' if the sentence is syntactically complete and makes sense as a turn end. "
-                "Output 'NO' if it seems broken, interrupted, or trailing off."
-            )
-
-            response = ""
-            messages = [{"role": "user", "content": f"Text: \"{text}\""}]
-
-            # Use low temperature for determinism
-            async for token in self.llm_provider.get_stream(messages, system_prompt, temperature=0.0, max_tokens=5):
-                response += token
-
-            result = response.strip().upper()
-            return "YES" in result
+        if self.turn_classifier:
+            return await self.turn_classifier.is_complete(text)
 
+        try:
+            return await self._llm_completion_check(text)
         except Exception as e:
             # Fail safe: assume complete to proceed
             logger.warning(f"⚠️ Semantic check failed: {e}")
             return True
 
+    async def _llm_completion_check(self, text: str) -> bool:
+        """Ask LLM if the sentence is complete (one short completion)."""
+        system_prompt = (
+            "You are a helpful assistant serving as a semantic detector. "
+            "Analyze the user's speech transcript. "
+            "Output ONLY 'YES' if the sentence is syntactically complete and makes sense as a turn end. "
+            "Output 'NO' if it seems broken, interrupted, or trailing off."
+        )
+
+        # Use low temperature for determinism
+        request = LLMRequest(
+            messages=[LLMMessage(role="user", content=f"Text: \"{text}\"")],
+            model=getattr(self.config, 'llm_model', 'llama-3.3-70b-versatile'),
+            temperature=0.0,
+            max_tokens=5,
+            system_prompt=system_prompt,
+        )
+
+        response = ""
+        async for chunk in self.llm_provider.generate_stream(request):
+            if chunk.has_text:
+                response += chunk.text
+
+        result = response.strip().upper()
+        return "YES" in result
+
+    async def cleanup(self):
+        if self.turn_classifier and self.turn_classifier.stats.decisions:
+            stats = self.turn_classifier.stats
+            logger.info(
+                f"📊 [SEMANTIC] {self.turn_classifier.detector.name}: {stats.decisions} decisions, "
+                f"local hit rate {stats.local_hit_rate:.0%}, LLM fallback {stats.fallback_calls} "
+                f"({stats.fallback_errors} errors)"
+            )
+        await super().cleanup()
+
     async def _commit_turn(self):
         text = self.current_turn_text.strip()
         if not text:
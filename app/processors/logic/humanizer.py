@@ -40,7 +40,8 @@ class HumanizerProcessor(FrameProcessor):
         if enabled and text and len(text) > 10 and random.random() < 0.2:
             filler = random.choice(self.fillers)
             logger.info(f"🗣️ [HUMANIZER] Injecting filler: '{filler}'")
-            text = f"{filler} {text}"
+            # Own frame: the filler is synthesized alone, so its audio comes from the TTS phrase cache
+            await self.push_frame(TextFrame(text=filler), FrameDirection.DOWNSTREAM)
 
         # Create new frame or modify existing? TextFrame is likely immutable dataclass?
         # Check frames.py definition. Usually standard classes.
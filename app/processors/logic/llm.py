@@ -5,20 +5,39 @@ import uuid
 from typing import Any
 
 from app.core.audio.hold_audio import HoldAudioPlayer
-from app.core.frames import CancelFrame, EndTaskFrame, Frame, TextFrame
+from app.core.frames import CancelFrame, EndTaskFrame, Frame, LLMSpeculationFrame, TextFrame
 from app.core.processor import FrameDirection, FrameProcessor
 from app.core.prompt_builder import PromptBuilder
 from app.domain.models.llm_models import LLMFunctionCall
-from app.domain.models.tool_models import ToolRequest
+from app.domain.models.tool_models import ToolRequest, ToolResponse
 from app.domain.ports import LLMMessage, LLMPort, LLMRequest
 from app.domain.use_cases import ExecuteToolUseCase
 
 logger = logging.getLogger(__name__)
 
+
+class _Speculation:
+    """Generation started on a tentative turn; its output is held until the turn commits."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.task: asyncio.Task | None = None
+        self.held: list[Frame] = []
+        self.released = asyncio.Event()
+
+
 class LLMProcessor(FrameProcessor):
     """
     Consumes TextFrames (User Transcripts), sends to LLM via LLMPort, produces TextFrames (Assistant Response).
     Handles function calling, hold audio, and conversation history.
+
+    LLMSpeculationFrames (tentative turns) start a generation whose frames are held:
+    a final TextFrame with the same text releases them at once, anything else cancels
+    the speculation. Tool calls and history updates wait for the release.
+
+    Prompt, tool schemas and request parameters are compiled once at construction
+    (profile fields do not change within a call); per request only the context block
+    of the system prompt is rendered.
     """
     def __init__(
         self,
@@ -40,10 +59,25 @@ class LLMProcessor(FrameProcessor):
         self.trace_id = trace_id or str(uuid.uuid4())
         self.hold_audio_player = hold_audio_player
         self._current_task: asyncio.Task | None = None
+        self._speculation: _Speculation | None = None
+
+        # Compiled once per call (the prompt is also shared across calls with the same profile)
+        self._prompt = PromptBuilder.compile(config)
+        self._tools = self._compile_tools()
+        self._context_window = getattr(config, 'context_window', 10)
+        self._model = getattr(config, 'llm_model', 'llama-3.3-70b-versatile')
+        self._temperature = getattr(config, 'temperature', 0.7)
+        self._max_tokens = getattr(config, 'max_tokens', 600)
+        self._frequency_penalty = getattr(config, 'frequency_penalty', 0.0)
+        self._presence_penalty = getattr(config, 'presence_penalty', 0.0)
 
     async def process_frame(self, frame: Frame, direction: int):
         if direction == FrameDirection.DOWNSTREAM:
             if isinstance(frame, TextFrame) and frame.is_final:
+                # Turn committed unchanged: the speculative generation becomes the response
+                if await self._release_speculation(frame.text):
+                    return
+
                 # Implicit interruption: cancel previous generation
                 if self._current_task and not self._current_task.done():
                     self._current_task.cancel()
@@ -51,8 +85,13 @@ class LLMProcessor(FrameProcessor):
                 # Start new generation
                 self._current_task = asyncio.create_task(self._handle_user_text(frame.text))
 
+            elif isinstance(frame, LLMSpeculationFrame):
+                # Consumed here: only this processor knows about held output
+                self._start_speculation(frame.text)
+
             elif isinstance(frame, CancelFrame):
                 logger.info("🛑 [LLM] Received CancelFrame. Stopping generation.")
+                self._cancel_speculation()
                 if self._current_task and not self._current_task.done():
                     self._current_task.cancel()
                 await self.push_frame(frame, direction)
@@ -62,7 +101,60 @@ class LLMProcessor(FrameProcessor):
         else:
             await self.push_frame(frame, direction)
 
-    async def _handle_user_text(self, text: str):
+    def _start_speculation(self, text: str):
+        """Starts generating on a tentative turn, replacing any previous speculation."""
+        self._cancel_speculation()
+        if not text or (self._current_task and not self._current_task.done()):
+            # Never speculate over a committed response still in progress
+            return
+        spec = _Speculation(text)
+        spec.task = asyncio.create_task(self._handle_user_text(text, spec))
+        self._speculation = spec
+        logger.debug(f"⚡ [LLM] trace={self.trace_id} Speculating on: {text[:50]}...")
+
+    def _cancel_speculation(self):
+        spec, self._speculation = self._speculation, None
+        if spec and not spec.task.done():
+            spec.task.cancel()
+            logger.debug(f"⚡ [LLM] trace={self.trace_id} Speculation discarded")
+
+    async def _release_speculation(self, text: str) -> bool:
+        """
+        Adopts the speculative generation if it was started on exactly this turn.
+
+        Returns:
+            True if the held output was released (no new generation needed)
+        """
+        spec, self._speculation = self._speculation, None
+        if spec is None:
+            return False
+        if spec.text != text.strip() or spec.task.done():
+            if not spec.task.done():
+                spec.task.cancel()
+            return False
+
+        logger.info(f"⚡ [LLM] trace={self.trace_id} Speculation hit: releasing {len(spec.held)} held frames")
+        self._append_user_turn(text)
+        # Frames produced while flushing are appended to held and drained here too
+        while spec.held:
+            await self.push_frame(spec.held.pop(0))
+        spec.released.set()
+        self._current_task = spec.task
+        return True
+
+    def _append_user_turn(self, text: str):
+        # Deduplicated: the aggregator already appended it to the shared history
+        if not self.conversation_history or self.conversation_history[-1].get("content") != text:
+            self.conversation_history.append({"role": "user", "content": text})
+
+    async def _emit(self, frame: Frame, spec: _Speculation | None):
+        """Pushes downstream, or holds the frame while the speculation is unconfirmed."""
+        if spec is not None and not spec.released.is_set():
+            spec.held.append(frame)
+        else:
+            await self.push_frame(frame)
+
+    async def _handle_user_text(self, text: str, spec: _Speculation | None = None):
         """
         Main LLM Loop:
         1. Update history.
@@ -75,12 +167,12 @@ class LLMProcessor(FrameProcessor):
         logger.debug(f"🧠 [LLM_IN] Prompt: '{text}' | History Depth: {len(self.conversation_history)}")
 
 
-        # 1. Update History (Deduplicated logic)
-        if not self.conversation_history or self.conversation_history[-1].get("content") != text:
-            self.conversation_history.append({"role": "user", "content": text})
+        # 1. Update History (Deduplicated logic; a speculation appends on release)
+        if spec is None:
+            self._append_user_turn(text)
 
         try:
-            await self._generate_llm_response()
+            await self._generate_llm_response(spec=spec)
 
         except asyncio.CancelledError:
             logger.info(f"🛑 [LLM] trace={self.trace_id} Generation cancelled.")
@@ -88,84 +180,69 @@ class LLMProcessor(FrameProcessor):
         except Exception as e:
             logger.error(f"[LLM] trace={self.trace_id} Error: {e}", exc_info=True)
 
-    async def _generate_llm_response(self, tool_result_message: dict | None = None):
+    async def _generate_llm_response(
+        self,
+        tool_result_messages: list[dict] | None = None,
+        spec: _Speculation | None = None,
+    ):
         """
         Generate LLM response suitable for conversation loop.
+
+        With spec, the tentative user turn is added to the request only (history is
+        untouched until release) and output frames are held.
         """
         # Apply Logic: Context Window
-        context_window = getattr(self.config, 'context_window', 10)
+        context_window = self._context_window
+
+        history = self.conversation_history
+        tentative = spec is not None and not spec.released.is_set()
+        if tentative and (not history or history[-1].get("content") != spec.text):
+            history = [*history, {"role": "user", "content": spec.text}]
 
         if isinstance(context_window, int) and context_window > 0:
-            history_slice = self.conversation_history[-context_window:]
+            history_slice = history[-context_window:]
         else:
-            history_slice = self.conversation_history
+            history_slice = history
 
         # Build messages
         messages = [LLMMessage(role=msg["role"], content=msg["content"])
                     for msg in history_slice]
 
-        # Continuation (Function Calling)
-        if tool_result_message:
+        # Continuation (Function Calling): every result of the previous completion
+        for tool_result_message in tool_result_messages or ():
             messages.append(LLMMessage(
                 role=tool_result_message["role"],
                 content=tool_result_message["content"]
             ))
 
-        # Prepare Tools
-        tools = None
-        if self.execute_tool and self.execute_tool.tool_count > 0:
-            tools = [
-                tool_def.to_openai_format()
-                for tool_def in self.execute_tool.get_tool_definitions()
-            ]
-
         # Request
         request = LLMRequest(
             messages=messages,
-            model=getattr(self.config, 'llm_model', 'llama-3.3-70b-versatile'),
-            temperature=getattr(self.config, 'temperature', 0.7),
-            max_tokens=getattr(self.config, 'max_tokens', 600),
+            model=self._model,
+            temperature=self._temperature,
+            max_tokens=self._max_tokens,
             system_prompt=self._build_system_prompt(),
-            tools=tools,
+            tools=self._tools,
             metadata={"trace_id": self.trace_id},
-            frequency_penalty=getattr(self.config, 'frequency_penalty', 0.0),
-            presence_penalty=getattr(self.config, 'presence_penalty', 0.0)
+            frequency_penalty=self._frequency_penalty,
+            presence_penalty=self._presence_penalty
         )
 
         # Stream
         full_response_buffer = ""
         sentence_buffer = ""
         should_end_call = False
+        function_calls: list[LLMFunctionCall] = []
 
         async for chunk in self.llm_port.generate_stream(request):
-            # Case A: Function Call
+            # Case A: Function Call (collected: a completion may request several tools)
             if chunk.has_function_call:
                 logger.info(
                     f"🔧 [LLM] trace={self.trace_id} Function call: "
                     f"{chunk.function_call.name}({list(chunk.function_call.arguments.keys())})"
                 )
-
-                tool_response = await self._execute_tool(chunk.function_call)
-
-                self.conversation_history.append({
-                    "role": "assistant",
-                    "content": f"[TOOL_CALL: {chunk.function_call.name}]"
-                })
-
-                tool_result_content = (
-                    f"Tool '{tool_response.tool_name}' returned: {tool_response.result}"
-                    if tool_response.success
-                    else f"Tool '{tool_response.tool_name}' failed: {tool_response.error_message}"
-                )
-
-                # Recursive Loop
-                await self._generate_llm_response(
-                    tool_result_message={
-                        "role": "function",
-                        "content": tool_result_content
-                    }
-                )
-                return
+                function_calls.append(chunk.function_call)
+                continue
 
             # Case B: Text Content
             if chunk.has_text:
@@ -186,12 +263,44 @@ class LLMProcessor(FrameProcessor):
                 # Smart heuristic for sentence splitting (Punctuation + Space or End of Line)
                 # Adds logical pause for TTS
                 if len(sentence_buffer) > 10 and re.search(r'[.?!]\s+$', sentence_buffer):
-                    await self.push_frame(TextFrame(text=sentence_buffer, trace_id=self.trace_id))
+                    await self._emit(TextFrame(text=sentence_buffer, trace_id=self.trace_id), spec)
                     sentence_buffer = ""
 
+        if function_calls:
+            # Tools have side effects (and hold audio): only for a committed turn
+            if spec is not None:
+                await spec.released.wait()
+
+            tool_responses = await self._execute_tools(function_calls)
+
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": f"[TOOL_CALL: {', '.join(call.name for call in function_calls)}]"
+            })
+
+            # Recursive Loop: all results in one follow-up request
+            await self._generate_llm_response(
+                tool_result_messages=[
+                    {
+                        "role": "function",
+                        "content": (
+                            f"Tool '{tool_response.tool_name}' returned: {tool_response.result}"
+                            if tool_response.success
+                            else f"Tool '{tool_response.tool_name}' failed: {tool_response.error_message}"
+                        )
+                    }
+                    for tool_response in tool_responses
+                ]
+            )
+            return
+
         # Flush remaining text
         if sentence_buffer.strip():
-            await self.push_frame(TextFrame(text=sentence_buffer, trace_id=self.trace_id))
+            await self._emit(TextFrame(text=sentence_buffer, trace_id=self.trace_id), spec)
+
+        # Speculative output stays held until the turn commits
+        if spec is not None:
+            await spec.released.wait()
 
         # Update History
         if full_response_buffer.strip():
@@ -206,50 +315,68 @@ class LLMProcessor(FrameProcessor):
             # Send SystemFrame to trigger architecture shutdown flow
             await self.push_frame(EndTaskFrame(), FrameDirection.DOWNSTREAM)
 
-    async def _execute_tool(self, function_call: LLMFunctionCall):
+    async def _execute_tools(self, function_calls: list[LLMFunctionCall]) -> list[ToolResponse]:
         """
-        Execute tool via ExecuteToolUseCase.
+        Execute the tools of one completion via ExecuteToolUseCase (concurrently).
         """
         if not self.execute_tool:
             logger.error(f"[LLM] trace={self.trace_id} No ExecuteToolUseCase configured")
-            from app.domain.models.tool_models import ToolResponse
-            return ToolResponse(
-                tool_name=function_call.name,
-                result=None,
-                success=False,
-                error_message="Tool execution not configured"
-            )
+            return [
+                ToolResponse(
+                    tool_name=function_call.name,
+                    result=None,
+                    success=False,
+                    error_message="Tool execution not configured"
+                )
+                for function_call in function_calls
+            ]
 
         # Dynamic Config
         tool_url = getattr(self.config, 'tool_server_url', None)
         tool_secret = getattr(self.config, 'tool_server_secret', None)
         tool_timeout = getattr(self.config, 'tool_timeout_ms', 5000) / 1000.0
 
-        tool_request = ToolRequest(
-            tool_name=function_call.name,
-            arguments=function_call.arguments,
-            trace_id=self.trace_id,
-            timeout_seconds=tool_timeout,
-            context={
-                "server_url": tool_url,
-                "server_secret": tool_secret
-            }
-        )
+        tool_requests = [
+            ToolRequest(
+                tool_name=function_call.name,
+                arguments=function_call.arguments,
+                trace_id=self.trace_id,
+                timeout_seconds=tool_timeout,
+                context={
+                    "server_url": tool_url,
+                    "server_secret": tool_secret
+                }
+            )
+            for function_call in function_calls
+        ]
 
-        logger.info(f"🔧 [LLM] Executing tool: {tool_request.tool_name}")
+        logger.info(f"🔧 [LLM] Executing tools: {[r.tool_name for r in tool_requests]}")
 
-        # Hold Audio UX
-        if self.hold_audio_player:
+        # Hold Audio UX (one hold for the whole batch; none if every result is cached)
+        hold = self.hold_audio_player is not None and not all(
+            self.execute_tool.is_cached(request) for request in tool_requests
+        )
+        if hold:
             await self.hold_audio_player.start()
 
         try:
-            tool_response = await self.execute_tool.execute(tool_request)
+            tool_responses = await self.execute_tool.execute_many(tool_requests)
         finally:
-            if self.hold_audio_player:
+            if hold:
                 await self.hold_audio_player.stop()
 
-        logger.info(f"🔧 [LLM] Tool result success={tool_response.success}")
-        return tool_response
+        logger.info(f"🔧 [LLM] Tool results success={[r.success for r in tool_responses]}")
+        return tool_responses
+
+    def _compile_tools(self) -> list[dict] | None:
+        """Tool schemas in OpenAI format (tools are fixed for the call)."""
+        if not self.execute_tool or self.execute_tool.tool_count == 0:
+            return None
+        return [
+            tool_def.to_openai_format()
+            for tool_def in self.execute_tool.get_tool_definitions()
+        ]
 
     def _build_system_prompt(self):
-        return PromptBuilder.build_system_prompt(self.config, self.context)
+        # Context (CRM / campaign data) can change during the call: rendered per request
+        return self._prompt.render(self.context)
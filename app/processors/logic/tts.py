@@ -37,6 +37,17 @@ class TTSProcessor(FrameProcessor):
             self._is_running = True
             self._worker_task = asyncio.create_task(self._worker())
             logger.info("🔊 [TTS] Worker started")
+            await self._warm_up()
+
+    async def _warm_up(self):
+        """Pre-opens the TTS connection for the configured voice (if the port supports it)."""
+        warm_up = getattr(self.tts_port, 'warm_up', None)
+        if warm_up is None:
+            return
+        try:
+            await warm_up(getattr(self.config, 'voice_name', 'en-US-JennyNeural'))
+        except Exception as e:
+            logger.warning(f"⚠️ [TTS] Warm-up failed: {e}")
 
     async def process_frame(self, frame: Frame, direction: int):
         if direction == FrameDirection.DOWNSTREAM:
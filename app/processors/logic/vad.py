@@ -1,13 +1,11 @@
 import logging
 import time
-from pathlib import Path
 from typing import Any
 
-import numpy as np
-
+from app.core.audio.ring_buffer import PCMRingBuffer
 from app.core.frames import AudioFrame, Frame, UserStartedSpeakingFrame, UserStoppedSpeakingFrame
 from app.core.processor import FrameDirection, FrameProcessor
-from app.core.vad.model import SileroOnnxModel
+from app.core.vad.service import get_vad_service
 from app.domain.use_cases import DetectTurnEndUseCase
 
 logger = logging.getLogger(__name__)
@@ -23,9 +21,8 @@ class VADProcessor(FrameProcessor):
         self.config = config
         self.control_channel = control_channel
 
-        # VAD State
+        # VAD State (per-call stream on the shared, batched Silero session)
         self.vad_model = None
-        self.buffer = bytearray()
         self.speaking = False
         self.silence_frames = 0
         self.speech_frames = 0
@@ -62,6 +59,11 @@ class VADProcessor(FrameProcessor):
         # Calculate Chunk Duration (Silero requirement)
         # 512 samples @ 16k = 32ms. 256 samples @ 8k = 32ms.
         self.chunk_duration_ms = 32
+        self.window_samples = 512 if self.target_sr == 16000 else 256
+
+        # Inbound PCM ring (2s): windows are read as views, no per-frame reallocation
+        self.ring = PCMRingBuffer(capacity=self.target_sr * 2, max_window=self.window_samples)
+        self.reader = self.ring.reader()
 
         # Confirmation window
         self.confirmation_window_ms = getattr(self.config, 'vad_confirmation_window_ms', 200)
@@ -71,20 +73,13 @@ class VADProcessor(FrameProcessor):
         self._init_model()
 
     def _init_model(self):
-        """Locate and load Silero ONNX model."""
+        """Open this call's stream on the process-wide Silero service (no per-call model load)."""
         try:
-            # Try standard relative path first
-            model_path = Path("app/core/vad/data/silero_vad.onnx")
-
-            # If strictly checking relative to CWD
-            if not model_path.exists():
-                 # Try absolute construct
-                 model_path = Path.cwd() / "app" / "core" / "vad" / "data" / "silero_vad.onnx"
-
-            if model_path.exists():
-                self.vad_model = SileroOnnxModel(str(model_path))
+            service = get_vad_service()
+            if service is not None:
+                self.vad_model = service.open_stream(self.target_sr)
             else:
-                 logger.warning(f"⚠️ Silero ONNX model not found at {model_path}. VAD disabled.")
+                logger.warning("⚠️ Silero ONNX model not available. VAD disabled.")
 
         except Exception as e:
             logger.error(f"Could not init SileroVAD: {e}. VAD will be disabled.")
@@ -103,23 +98,14 @@ class VADProcessor(FrameProcessor):
         if not self.vad_model:
             return
 
-        # 1. Add to buffer
-        self.buffer.extend(frame.data)
-
-        # 2. Process in correct chunk sizes (Silero Requirement)
-        required_samples = 512 if self.target_sr == 16000 else 256
-        chunk_size = required_samples * 2
-
-        while len(self.buffer) >= chunk_size:
-            chunk_bytes = self.buffer[:chunk_size]
-            self.buffer = self.buffer[chunk_size:]
-
-            # Convert bytes to float32 numpy array
-            audio_int16 = np.frombuffer(chunk_bytes, dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
+        # 1. Add to ring
+        self.ring.write(frame.data)
 
+        # 2. Process in correct window sizes (Silero Requirement)
+        while (audio_int16 := self.reader.read(self.window_samples)) is not None:
+            # int16 view into the ring; scaling to float32 and inference run on the offload pool
             try:
-                confidence = self.vad_model(audio_float32, self.target_sr)
+                confidence = await self.vad_model.infer(audio_int16)
             except Exception as e:
                 logger.error(f"VAD Inference Error: {e}")
                 confidence = 0.0
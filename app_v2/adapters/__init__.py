@@ -9,7 +9,9 @@ from app_v2.adapters.outbounds import (
     ConfigAdapter,
     GroqLLMAdapter,
     GroqWhisperSTTAdapter,
+    GroqWhisperStreamingSTTAdapter,
     AzureTTSAdapter,
+    CachedTTSAdapter,
 )
 from app_v2.adapters.inbounds import WebSocketTransport
 
@@ -17,6 +19,8 @@ __all__ = [
     "ConfigAdapter",
     "GroqLLMAdapter",
     "GroqWhisperSTTAdapter",
+    "GroqWhisperStreamingSTTAdapter",
     "AzureTTSAdapter",
+    "CachedTTSAdapter",
     "WebSocketTransport",
 ]
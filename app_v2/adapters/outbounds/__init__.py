@@ -1,15 +1,19 @@
 """
-Adaptadores outbound V2 — STT, LLM, TTS, Config.
+Adaptadores outbound V2 — STT (one-shot y streaming), LLM, TTS (+ caché de frases), Config.
 """
 
 from app_v2.adapters.outbounds.config_adapter import ConfigAdapter
 from app_v2.adapters.outbounds.stt_groq_adapter import GroqWhisperSTTAdapter
+from app_v2.adapters.outbounds.stt_groq_streaming_adapter import GroqWhisperStreamingSTTAdapter
 from app_v2.adapters.outbounds.llm_groq_adapter import GroqLLMAdapter
 from app_v2.adapters.outbounds.tts_azure_adapter import AzureTTSAdapter
+from app_v2.adapters.outbounds.tts_cache import CachedTTSAdapter
 
 __all__ = [
     "ConfigAdapter",
     "GroqWhisperSTTAdapter",
+    "GroqWhisperStreamingSTTAdapter",
     "GroqLLMAdapter",
     "AzureTTSAdapter",
+    "CachedTTSAdapter",
 ]
@@ -0,0 +1,281 @@
+"""
+Pool de SpeechSynthesizer de Azure compartido por el proceso.
+
+Cada synthesizer se crea con su propio SpeechConfig (voz y formato fijos, sin mutar una
+config compartida) y escribe en un PushAudioOutputStream en memoria. Se toma en exclusiva
+con acquire/release y se reutiliza entre frases y llamadas; la clave es
+(voz, formato de salida, región).
+
+Referencia legacy: app/adapters/outbound/tts/azure_tts_adapter.py (un _synthesizer por
+adapter, creado con la voz de la primera petición).
+Decisión: Pool de proceso (get_synthesizer_pool) porque los adapters se crean por llamada.
+Acotado en synthesizers ociosos (por clave y total, se descarta el menos usado) con
+expiración por inactividad; warm() crea synthesizers y pre-abre su conexión fuera del
+camino crítico. Crear o cerrar un synthesizer bloquea (SDK nativo): acquire lo hace en
+un executor y release cierra los descartados en un executor, nunca en el event loop.
+Lo comparten el AzureTTSAdapter V2 y el legacy (app/adapters/outbound/tts/).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+
+import azure.cognitiveservices.speech as speechsdk
+
+logger = logging.getLogger(__name__)
+
+# Formatos de salida soportados → formato Raw de Azure y bytes por muestra.
+OUTPUT_FORMATS: dict[str, tuple[speechsdk.SpeechSynthesisOutputFormat, int]] = {
+    "pcm_16k": (speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm, 2),
+    "mulaw_8k": (speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoMULaw, 1),
+    "alaw_8k": (speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoALaw, 1),
+}
+
+# Synthesizers ociosos que se conservan por clave y en total.
+MAX_IDLE_PER_KEY = 4
+MAX_IDLE_TOTAL = 32
+
+# Segundos sin uso tras los que un synthesizer ocioso se descarta.
+IDLE_TTL_S = 300.0
+
+
+@dataclass(frozen=True)
+class SynthesizerKey:
+    """Clave del pool: voz, formato de salida y región (la credencial no se muestra)."""
+    voice: str
+    output_format: str
+    region: str
+    api_key: str = field(repr=False)
+
+
+class _AudioSink(speechsdk.audio.PushAudioOutputStreamCallback):
+    """Callback del stream de salida: reenvía cada fragmento al destino de la síntesis en curso."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.target: Callable[[bytes], None] | None = None
+
+    def write(self, audio_buffer: memoryview) -> int:
+        target = self.target
+        if target is not None:
+            target(bytes(audio_buffer))
+        return audio_buffer.nbytes
+
+    def close(self) -> None:
+        pass
+
+
+class PooledSynthesizer:
+    """SpeechSynthesizer con su propio SpeechConfig y stream de salida en memoria."""
+
+    def __init__(self, key: SynthesizerKey) -> None:
+        output_format, self.sample_width = OUTPUT_FORMATS[key.output_format]
+        speech_config = speechsdk.SpeechConfig(subscription=key.api_key, region=key.region)
+        speech_config.set_speech_synthesis_output_format(output_format)
+        speech_config.speech_synthesis_voice_name = key.voice
+        self.key = key
+        self.sink = _AudioSink()
+        self.synthesizer = speechsdk.SpeechSynthesizer(
+            speech_config=speech_config,
+            audio_config=speechsdk.audio.AudioOutputConfig(
+                stream=speechsdk.audio.PushAudioOutputStream(self.sink)
+            ),
+        )
+        self.last_used = time.monotonic()
+        self._connection: speechsdk.Connection | None = None
+
+    def preconnect(self) -> None:
+        """Abre la conexión al servicio antes de la primera síntesis."""
+        self._connection = speechsdk.Connection.from_speech_synthesizer(self.synthesizer)
+        self._connection.open(True)
+
+    def close(self) -> None:
+        """Cierra la conexión (al descartarse del pool)."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _speak_blocking(self, ssml: str) -> None:
+        result = self.synthesizer.speak_ssml_async(ssml).get()
+        if result.reason == speechsdk.ResultReason.Canceled:
+            det = result.cancellation_details
+            raise RuntimeError(f"Azure TTS canceled: {det.reason} - {det.error_details}")
+        if result.reason != speechsdk.ResultReason.SynthesizingAudioCompleted:
+            raise RuntimeError(f"Azure TTS unexpected reason: {result.reason}")
+
+    async def speak_stream(self, ssml: str) -> AsyncIterator[bytes]:
+        """
+        Sintetiza SSML entregando fragmentos en cuanto Azure los produce.
+
+        Los fragmentos se alinean a muestra completa. Si el consumidor corta antes, la
+        síntesis se detiene y se espera su fin, así el synthesizer queda libre al salir.
+
+        Raises:
+            RuntimeError: Síntesis cancelada por Azure o con resultado inesperado.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        # El callback corre en un hilo del SDK; los fragmentos se encolan en el loop en orden.
+        self.sink.target = lambda chunk: loop.call_soon_threadsafe(queue.put_nowait, chunk)
+        job = loop.run_in_executor(None, self._speak_blocking, ssml)
+        job.add_done_callback(lambda _: queue.put_nowait(None))
+        carry = b""
+        try:
+            while (chunk := await queue.get()) is not None:
+                if carry:
+                    chunk = carry + chunk
+                cut = len(chunk) - len(chunk) % self.sample_width
+                chunk, carry = chunk[:cut], chunk[cut:]
+                if chunk:
+                    yield chunk
+            await job
+        finally:
+            if not job.done():
+                self.synthesizer.stop_speaking_async()
+                await asyncio.wait([job])
+            self.sink.target = None
+
+
+class SynthesizerPool:
+    """
+    Pool acotado y thread-safe de PooledSynthesizer por SynthesizerKey.
+
+    Un synthesizer tomado con acquire no se comparte hasta que vuelve con release.
+    """
+
+    def __init__(
+        self,
+        max_idle_per_key: int = MAX_IDLE_PER_KEY,
+        max_idle_total: int = MAX_IDLE_TOTAL,
+        idle_ttl_s: float = IDLE_TTL_S,
+        factory: Callable[[SynthesizerKey], PooledSynthesizer] = PooledSynthesizer,
+    ) -> None:
+        """
+        Args:
+            max_idle_per_key: Máximo de synthesizers ociosos por clave.
+            max_idle_total: Máximo de synthesizers ociosos en todo el pool.
+            idle_ttl_s: Segundos sin uso tras los que se descarta un ocioso.
+            factory: Constructor de synthesizers (inyectable en tests).
+        """
+        self._max_idle_per_key = max_idle_per_key
+        self._max_idle_total = max_idle_total
+        self._idle_ttl_s = idle_ttl_s
+        self._factory = factory
+        self._idle: dict[SynthesizerKey, list[PooledSynthesizer]] = {}
+        self._lock = threading.Lock()
+
+    def idle_count(self, key: SynthesizerKey | None = None) -> int:
+        """Synthesizers ociosos para una clave (o en total)."""
+        with self._lock:
+            if key is not None:
+                return len(self._idle.get(key, ()))
+            return sum(len(entries) for entries in self._idle.values())
+
+    async def acquire(self, key: SynthesizerKey) -> PooledSynthesizer:
+        """Toma un synthesizer ocioso de la clave o crea uno (en un executor) si no hay."""
+        with self._lock:
+            evicted = self._expire_locked(time.monotonic())
+            entries = self._idle.get(key)
+            entry = entries.pop() if entries else None
+        self._close_off_loop(evicted)
+        if entry is None:
+            logger.debug("Synthesizer pool miss: %s", key)
+            entry = await asyncio.get_running_loop().run_in_executor(None, self._factory, key)
+        return entry
+
+    def release(self, entry: PooledSynthesizer) -> None:
+        """Devuelve un synthesizer al pool (o lo descarta si se supera el límite)."""
+        entry.sink.target = None
+        entry.last_used = time.monotonic()
+        with self._lock:
+            entries = self._idle.setdefault(entry.key, [])
+            evicted = [entry] if len(entries) >= self._max_idle_per_key else []
+            if not evicted:
+                entries.append(entry)
+                evicted = self._evict_over_total_locked()
+        self._close_off_loop(evicted)
+
+    def warm(self, key: SynthesizerKey, count: int = 1) -> None:
+        """
+        Deja al menos count synthesizers ociosos de la clave con la conexión abierta.
+
+        Bloqueante (crea synthesizers y abre conexiones): llamar desde un executor.
+        """
+        missing = min(count, self._max_idle_per_key) - self.idle_count(key)
+        for _ in range(missing):
+            entry = self._factory(key)
+            try:
+                entry.preconnect()
+            except Exception as e:
+                logger.warning("Synthesizer preconnect failed (%s): %s", key, e)
+            self.release(entry)
+
+    def clear(self) -> None:
+        """Descarta todos los synthesizers ociosos."""
+        with self._lock:
+            evicted = [entry for entries in self._idle.values() for entry in entries]
+            self._idle.clear()
+        self._close(evicted)
+
+    def _expire_locked(self, now: float) -> list[PooledSynthesizer]:
+        expired: list[PooledSynthesizer] = []
+        for key in list(self._idle):
+            entries = self._idle[key]
+            keep = [e for e in entries if now - e.last_used < self._idle_ttl_s]
+            if len(keep) != len(entries):
+                expired.extend(e for e in entries if now - e.last_used >= self._idle_ttl_s)
+                if keep:
+                    self._idle[key] = keep
+                else:
+                    del self._idle[key]
+        return expired
+
+    def _evict_over_total_locked(self) -> list[PooledSynthesizer]:
+        evicted: list[PooledSynthesizer] = []
+        total = sum(len(entries) for entries in self._idle.values())
+        while total > self._max_idle_total:
+            key, oldest = min(
+                ((k, e) for k, entries in self._idle.items() for e in entries),
+                key=lambda item: item[1].last_used,
+            )
+            self._idle[key].remove(oldest)
+            if not self._idle[key]:
+                del self._idle[key]
+            evicted.append(oldest)
+            total -= 1
+        return evicted
+
+    def _close_off_loop(self, entries: list[PooledSynthesizer]) -> None:
+        """Cierra en un executor si hay event loop; en línea desde hilos (warm)."""
+        if not entries:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._close(entries)
+            return
+        loop.run_in_executor(None, self._close, entries)
+
+    @staticmethod
+    def _close(entries: list[PooledSynthesizer]) -> None:
+        for entry in entries:
+            try:
+                entry.close()
+            except Exception as e:
+                logger.debug("Synthesizer close failed: %s", e)
+
+
+_pool: SynthesizerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_synthesizer_pool() -> SynthesizerPool:
+    """Pool de synthesizers del proceso (compartido por todas las llamadas)."""
+    global _pool  # noqa: PLW0603 - pool de proceso
+    with _pool_lock:
+        if _pool is None:
+            _pool = SynthesizerPool()
+        return _pool
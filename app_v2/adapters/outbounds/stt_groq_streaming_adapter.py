@@ -0,0 +1,201 @@
+"""
+GroqWhisperStreamingSTTAdapter — StreamingSTTPort con Whisper por fragmentos solapados.
+
+Whisper no tiene API de streaming: el enunciado se transcribe por fragmentos de
+chunk_ms a medida que llega el audio (cada fragmento empieza overlap_ms antes del
+final del anterior, para que ninguna palabra quede cortada en los dos). Cada
+fragmento transcrito se une al texto acumulado eliminando las palabras repetidas
+del solape y se emite como hipótesis parcial. Al cerrar el turno solo falta
+transcribir la cola (audio desde el último fragmento), así la latencia final
+depende de la cola y no de la duración del enunciado.
+
+Si un fragmento falla, finish() transcribe el enunciado completo de una vez
+(mismo resultado que el adapter one-shot).
+
+Referencia legacy: app/adapters/outbound/stt/azure_stt_adapter.py (eventos
+recognizing/recognized del push stream de Azure).
+Decisión: Sin Azure SDK en V2 (dependencias mínimas, Decisión de Fase 3): streaming
+sobre el mismo GroqWhisperSTTAdapter.transcribe_audio (WAV, umbral de silencio).
+"""
+
+import asyncio
+import contextlib
+import logging
+import re
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from app_v2.adapters.outbounds.stt_groq_adapter import GroqWhisperSTTAdapter
+from app_v2.domain.ports import StreamingSTTPort, STTConfig, STTHypothesis, STTStream
+
+logger = logging.getLogger(__name__)
+
+# Duración de cada fragmento enviado a Whisper durante el enunciado.
+CHUNK_MS = 3_000
+
+# Audio compartido entre fragmentos consecutivos.
+OVERLAP_MS = 800
+
+# Palabras comparadas al unir fragmentos (el solape son ~2-3 palabras habladas).
+MAX_OVERLAP_WORDS = 8
+
+_WORD_CHARS = re.compile(r"[^\w]+")
+
+
+def _normalize(word: str) -> str:
+    return _WORD_CHARS.sub("", word.lower())
+
+
+def merge_overlap(text: str, addition: str) -> str:
+    """
+    Une la transcripción de un fragmento al texto acumulado.
+
+    Las palabras del inicio de addition que repiten el final de text (audio
+    solapado) se descartan; si la última palabra de text quedó cortada (prefijo de
+    la primera de addition) se sustituye.
+
+    Args:
+        text: Texto acumulado.
+        addition: Transcripción del siguiente fragmento.
+
+    Returns:
+        Texto unido.
+    """
+    words, new = text.split(), addition.split()
+    if not words or not new:
+        return " ".join(words or new)
+    tail = [_normalize(w) for w in words[-MAX_OVERLAP_WORDS:]]
+    head = [_normalize(w) for w in new[:MAX_OVERLAP_WORDS]]
+    for size in range(min(len(tail), len(head)), 0, -1):
+        if tail[-size:] == head[:size]:
+            return " ".join(words + new[size:])
+    if tail[-1] and head[0].startswith(tail[-1]):
+        words = words[:-1]
+    return " ".join(words + new)
+
+
+class WhisperChunkStream(STTStream):
+    """
+    Enunciado en curso: lanza un fragmento cada chunk_ms y une los resultados en orden.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[bytes, STTConfig], Awaitable[str]],
+        config: STTConfig,
+        on_hypothesis: Callable[[STTHypothesis], Awaitable[None]] | None = None,
+        chunk_ms: int = CHUNK_MS,
+        overlap_ms: int = OVERLAP_MS,
+    ) -> None:
+        """
+        Args:
+            transcribe: Transcripción one-shot (audio, config) → texto.
+            config: Configuración STT del enunciado.
+            on_hypothesis: Opcional; recibe cada parcial y la final.
+            chunk_ms: Duración de cada fragmento.
+            overlap_ms: Solape entre fragmentos consecutivos (< chunk_ms).
+        """
+        if not 0 <= overlap_ms < chunk_ms:
+            raise ValueError("overlap_ms must be in [0, chunk_ms)")
+        bytes_per_ms = config.sample_rate * config.channels * 2 / 1000
+        sample_bytes = 2 * config.channels
+        self._chunk_bytes = int(chunk_ms * bytes_per_ms) // sample_bytes * sample_bytes
+        self._overlap_bytes = int(overlap_ms * bytes_per_ms) // sample_bytes * sample_bytes
+        self._transcribe = transcribe
+        self._config = config
+        self._on_hypothesis = on_hypothesis
+        self._audio = bytearray()
+        self._chunk_start = 0
+        self._chunks: deque[asyncio.Task[str]] = deque()
+        self._text = ""
+        self._failed = False
+        self._closed = False
+
+    @property
+    def text(self) -> str:
+        """Transcripción parcial acumulada."""
+        return self._text
+
+    async def push_audio(self, audio: bytes) -> None:
+        if self._closed:
+            return
+        self._audio.extend(audio)
+        while not self._failed and len(self._audio) - self._chunk_start >= self._chunk_bytes:
+            end = self._chunk_start + self._chunk_bytes
+            self._start_chunk(self._chunk_start, end)
+            self._chunk_start = end - self._overlap_bytes
+        await self._commit(wait=False)
+
+    async def finish(self) -> str:
+        if self._closed:
+            return self._text
+        self._closed = True
+        # Cola: audio nuevo desde el último fragmento (incluye el solape como contexto)
+        if not self._failed and len(self._audio) - self._chunk_start > self._overlap_bytes:
+            self._start_chunk(self._chunk_start, len(self._audio))
+        await self._commit(wait=True)
+        if self._failed:
+            logger.warning("Streaming STT chunk failed; transcribing the full utterance")
+            self._text = (await self._transcribe(bytes(self._audio), self._config)).strip()
+        if self._on_hypothesis is not None:
+            await self._on_hypothesis(STTHypothesis(text=self._text, is_final=True))
+        return self._text
+
+    async def cancel(self) -> None:
+        self._closed = True
+        chunks, self._chunks = list(self._chunks), deque()
+        for task in chunks:
+            task.cancel()
+        for task in chunks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+    def _start_chunk(self, start: int, end: int) -> None:
+        audio = bytes(self._audio[start:end])
+        self._chunks.append(asyncio.create_task(self._transcribe(audio, self._config)))
+
+    async def _commit(self, wait: bool) -> None:
+        """Une los fragmentos terminados, en orden; con wait espera a todos."""
+        while self._chunks and (wait or self._chunks[0].done()):
+            task = self._chunks.popleft()
+            try:
+                text = await task
+            except Exception as e:
+                logger.warning("Streaming STT chunk error: %s", e)
+                self._failed = True
+                continue
+            if self._failed or not text.strip():
+                continue
+            self._text = merge_overlap(self._text, text.strip())
+            if not self._closed and self._on_hypothesis is not None:
+                await self._on_hypothesis(STTHypothesis(text=self._text))
+
+
+class GroqWhisperStreamingSTTAdapter(GroqWhisperSTTAdapter, StreamingSTTPort):
+    """
+    Groq Whisper con streaming por fragmentos solapados (y transcribe_audio one-shot).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "whisper-large-v3",
+        chunk_ms: int = CHUNK_MS,
+        overlap_ms: int = OVERLAP_MS,
+    ) -> None:
+        super().__init__(api_key=api_key, model=model)
+        self._chunk_ms = chunk_ms
+        self._overlap_ms = overlap_ms
+
+    def open_stream(
+        self,
+        config: STTConfig,
+        on_hypothesis: Callable[[STTHypothesis], Awaitable[None]] | None = None,
+    ) -> STTStream:
+        return WhisperChunkStream(
+            self.transcribe_audio,
+            config,
+            on_hypothesis,
+            chunk_ms=self._chunk_ms,
+            overlap_ms=self._overlap_ms,
+        )
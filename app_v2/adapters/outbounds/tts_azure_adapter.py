@@ -1,21 +1,25 @@
 """
 AzureTTSAdapter — Implementación de TTSPort con Azure Speech SDK.
 
-Síntesis one-shot (texto → audio bytes). Formato configurable (16kHz PCM para browser).
+Síntesis en memoria: cada SpeechSynthesizer escribe en un PushAudioOutputStream cuyo
+callback reenvía los fragmentos al event loop a medida que Azure los produce.
+synthesize_stream los entrega en cuanto llegan; synthesize los concatena.
 
 Referencia legacy: app/adapters/outbound/tts/azure_tts_adapter.py.
-Decisión: Solo synthesize; formato de salida por constructor (pcm_16k | mulaw_8k).
-Salida vía archivo temporal para compatibilidad multiplataforma (result.audio_data no siempre disponible).
+Decisión: Formato de salida por constructor (pcm_16k | mulaw_8k); sin archivo temporal
+(Paso 14). Synthesizers del pool de proceso por (voz, formato, región) (Paso 15): cada uno
+se toma en exclusiva durante una síntesis; warm_up pre-abre la conexión de la voz.
 """
 
 import asyncio
-import contextlib
 import logging
-import os
-import tempfile
-
-import azure.cognitiveservices.speech as speechsdk
+from collections.abc import AsyncIterator
 
+from app_v2.adapters.outbounds.azure_synthesizer_pool import (
+    SynthesizerKey,
+    SynthesizerPool,
+    get_synthesizer_pool,
+)
 from app_v2.domain.ports import TTSRequest, TTSPort
 
 logger = logging.getLogger(__name__)
@@ -37,7 +41,7 @@ def _build_ssml(request: TTSRequest) -> str:
 
 class AzureTTSAdapter(TTSPort):
     """
-    TTS vía Azure Speech SDK (SSML, bloque completo).
+    TTS vía Azure Speech SDK (SSML, audio en memoria por fragmentos).
     """
 
     def __init__(
@@ -45,32 +49,37 @@ class AzureTTSAdapter(TTSPort):
         api_key: str,
         region: str,
         output_format: str = "pcm_16k",
+        pool: SynthesizerPool | None = None,
     ) -> None:
         """
         Args:
             api_key: Azure Speech key.
             region: Azure region (ej. eastus).
             output_format: "pcm_16k" (browser) o "mulaw_8k" (telephony).
+            pool: Pool de synthesizers; por defecto el del proceso.
         """
-        self._speech_config = speechsdk.SpeechConfig(subscription=api_key, region=region)
-        if output_format == "pcm_16k":
-            self._speech_config.set_speech_synthesis_output_format(
-                speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm
-            )
-        else:
-            self._speech_config.set_speech_synthesis_output_format(
-                speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoMULaw
-            )
+        self._api_key = api_key
+        self._region = region
+        self._output_format = "pcm_16k" if output_format == "pcm_16k" else "mulaw_8k"
+        self._pool = pool or get_synthesizer_pool()
 
-    def _get_synthesizer(self, voice_name: str, output_path: str) -> speechsdk.SpeechSynthesizer:
-        self._speech_config.speech_synthesis_voice_name = voice_name
-        audio_config = speechsdk.audio.AudioOutputConfig(filename=output_path)
-        return speechsdk.SpeechSynthesizer(
-            speech_config=self._speech_config,
-            audio_config=audio_config,
+    def _key(self, voice_id: str) -> SynthesizerKey:
+        return SynthesizerKey(
+            voice=voice_id,
+            output_format=self._output_format,
+            region=self._region,
+            api_key=self._api_key,
         )
 
+    async def warm_up(self, voice_id: str) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._pool.warm, self._key(voice_id))
+
     async def synthesize(self, request: TTSRequest) -> bytes:
+        chunks = [chunk async for chunk in self.synthesize_stream(request)]
+        return b"".join(chunks)
+
+    async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
         logger.debug(
             "TTS request: voice_id=%s language=%s text_len=%s",
             request.voice_id,
@@ -78,23 +87,9 @@ class AzureTTSAdapter(TTSPort):
             len(request.text),
         )
         ssml = _build_ssml(request)
-        fd, path = tempfile.mkstemp(suffix=".raw")
-        os.close(fd)
+        entry = await self._pool.acquire(self._key(request.voice_id))
         try:
-            loop = asyncio.get_running_loop()
-
-            def _blocking() -> None:
-                syn = self._get_synthesizer(request.voice_id, path)
-                result = syn.speak_ssml_async(ssml).get()
-                if result.reason == speechsdk.ResultReason.Canceled:
-                    det = result.cancellation_details
-                    raise RuntimeError(f"Azure TTS canceled: {det.reason} - {det.error_details}")
-                if result.reason != speechsdk.ResultReason.SynthesizingAudioCompleted:
-                    raise RuntimeError(f"Azure TTS unexpected reason: {result.reason}")
-
-            await loop.run_in_executor(None, _blocking)
-            with open(path, "rb") as f:
-                return f.read()
+            async for chunk in entry.speak_stream(ssml):
+                yield chunk
         finally:
-            with contextlib.suppress(FileNotFoundError, OSError):
-                os.unlink(path)
+            self._pool.release(entry)
@@ -0,0 +1,313 @@
+"""
+Caché de frases TTS — audio sintetizado direccionado por contenido.
+
+Muchas frases del bot se repiten entre llamadas (saludo, disculpa, muletillas,
+confirmaciones). La clave es un hash de (texto normalizado, voz, estilo, velocidad,
+tono, volumen, formato de salida); el audio se guarda en un LRU en memoria acotado
+por bytes y, opcionalmente, en un segundo nivel (AudioCachePort: disco o Redis).
+
+CachedTTSAdapter envuelve cualquier TTSPort: en acierto entrega el audio sin llamar
+al proveedor; en fallo sintetiza, entrega por fragmentos y guarda la frase completa.
+Single-flight: si la misma frase ya se está sintetizando (prefetch del saludo mientras
+otra llamada lo habla), se espera esa síntesis en lugar de lanzar otra.
+
+Referencia legacy: app/services/cache.py (Redis con TTL para metadatos de voces).
+Decisión: Caché de proceso (get_phrase_cache) porque los adapters se crean por llamada;
+solo se cachean frases de hasta MAX_PHRASE_CHARS y solo síntesis completas.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+from app_v2.domain.ports import AudioCachePort, TTSPort, TTSRequest
+
+logger = logging.getLogger(__name__)
+
+# Tamaño máximo del LRU en memoria.
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Frases más largas no se cachean (respuestas del LLM poco repetibles).
+MAX_PHRASE_CHARS = 200
+
+# Entradas máximas del nivel en disco (se borran las más antiguas al superarlo).
+DISK_MAX_ENTRIES = 2000
+
+
+def normalize_text(text: str) -> str:
+    """Normaliza espacios (el tono de la frase depende de mayúsculas y puntuación)."""
+    return " ".join(text.split())
+
+
+def phrase_key(
+    text: str,
+    voice_id: str,
+    output_format: str,
+    style: str | None = None,
+    speed: float = 1.0,
+    pitch: float = 0,
+    volume: float = 100,
+    language: str = "",
+) -> str:
+    """
+    Clave de contenido de una frase sintetizada.
+
+    Returns:
+        Hash SHA-256 hexadecimal.
+    """
+    parts = (
+        normalize_text(text),
+        voice_id,
+        style or "",
+        f"{float(speed):g}",
+        f"{float(pitch):g}",
+        f"{float(volume):g}",
+        output_format,
+        language,
+    )
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class DiskAudioCache(AudioCachePort):
+    """
+    Nivel en disco: un archivo por clave, escritura atómica (tmp + replace).
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int = DISK_MAX_ENTRIES) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max_entries
+        self._writes = 0
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{key}.audio"
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, audio: bytes) -> None:
+        await asyncio.to_thread(self._write, key, audio)
+
+    def _read(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, audio: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            Path(tmp).replace(self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._writes += 1
+        # Poda periódica: evita listar el directorio en cada escritura.
+        if self._writes % max(1, self._max_entries // 10) == 0:
+            self._prune()
+
+    def _prune(self) -> None:
+        files = sorted(self._dir.glob("*.audio"), key=lambda p: p.stat().st_mtime)
+        for path in files[: max(0, len(files) - self._max_entries)]:
+            path.unlink(missing_ok=True)
+
+
+class PhraseCache:
+    """
+    LRU en memoria acotado por bytes con segundo nivel opcional.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        tier: AudioCachePort | None = None,
+        max_phrase_chars: int = MAX_PHRASE_CHARS,
+    ) -> None:
+        """
+        Args:
+            max_bytes: Capacidad del LRU en memoria.
+            tier: Segundo nivel (disco/Redis); None = solo memoria.
+            max_phrase_chars: Longitud máxima de texto cacheable.
+        """
+        self._max_bytes = max_bytes
+        self._tier = tier
+        self._max_phrase_chars = max_phrase_chars
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        # Síntesis en curso por clave → audio completo (None si falló o se cortó)
+        self._inflight: dict[str, asyncio.Future[bytes | None]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def cacheable(self, text: str) -> bool:
+        """True si la frase entra en la caché por longitud."""
+        return 0 < len(text.strip()) <= self._max_phrase_chars
+
+    async def get(self, key: str) -> bytes | None:
+        """Busca en memoria y luego en el segundo nivel (promoviendo a memoria)."""
+        audio = self._entries.get(key)
+        if audio is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return audio
+        if self._tier is not None:
+            try:
+                audio = await self._tier.get(key)
+            except Exception as e:
+                logger.warning("TTS cache tier get failed: %s", e)
+                audio = None
+            if audio:
+                self._remember(key, audio)
+                self.hits += 1
+                return audio
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, audio: bytes) -> None:
+        """Guarda en memoria y en el segundo nivel (un fallo del nivel solo se registra)."""
+        if not audio:
+            return
+        self._remember(key, audio)
+        if self._tier is not None:
+            try:
+                await self._tier.set(key, audio)
+            except Exception as e:
+                logger.warning("TTS cache tier set failed: %s", e)
+
+    async def stream(
+        self, key: str, synthesize: Callable[[], AsyncIterator[bytes]]
+    ) -> AsyncIterator[bytes]:
+        """
+        Audio de la frase: de la caché, de la síntesis en curso de otro llamador o de
+        synthesize() (entregado por fragmentos y guardado al terminar).
+
+        Si la síntesis en curso falla o su consumidor la corta, quien esperaba
+        sintetiza por su cuenta.
+        """
+        while True:
+            pending = self._inflight.get(key)
+            if pending is not None:
+                audio = await asyncio.shield(pending)
+                if audio:
+                    self.coalesced += 1
+            else:
+                audio = await self.get(key)
+                if audio is None and key in self._inflight:
+                    continue  # otra síntesis empezó mientras se leía el segundo nivel
+            if audio:
+                yield audio
+                return
+            if pending is None:
+                break
+
+        future: asyncio.Future[bytes | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        audio = None
+        try:
+            chunks: list[bytes] = []
+            async for chunk in synthesize():
+                chunks.append(chunk)
+                yield chunk
+            # Solo llega aquí si la síntesis terminó (sin corte del consumidor ni error).
+            audio = b"".join(chunks)
+            await self.put(key, audio)
+        finally:
+            self._inflight.pop(key, None)
+            future.set_result(audio)
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        if len(audio) > self._max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = audio
+        self._bytes += len(audio)
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+
+class CachedTTSAdapter(TTSPort):
+    """
+    TTSPort con caché de frases delante de otro TTSPort.
+    """
+
+    def __init__(self, inner: TTSPort, cache: PhraseCache, output_format: str) -> None:
+        """
+        Args:
+            inner: TTSPort real (p. ej. AzureTTSAdapter).
+            cache: Caché de frases (normalmente get_phrase_cache()).
+            output_format: Formato de audio del inner (forma parte de la clave).
+        """
+        self._inner = inner
+        self._cache = cache
+        self._output_format = output_format
+
+    def _key(self, request: TTSRequest) -> str | None:
+        if not self._cache.cacheable(request.text):
+            return None
+        return phrase_key(
+            request.text,
+            request.voice_id,
+            self._output_format,
+            speed=request.speed,
+            pitch=request.pitch,
+            volume=request.volume,
+            language=request.language,
+        )
+
+    async def _synthesize_whole(self, request: TTSRequest) -> AsyncIterator[bytes]:
+        yield await self._inner.synthesize(request)
+
+    async def synthesize(self, request: TTSRequest) -> bytes:
+        key = self._key(request)
+        if key is None:
+            return await self._inner.synthesize(request)
+        chunks = [chunk async for chunk in self._cache.stream(key, lambda: self._synthesize_whole(request))]
+        return b"".join(chunks)
+
+    async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
+        key = self._key(request)
+        if key is None:
+            async for chunk in self._inner.synthesize_stream(request):
+                yield chunk
+            return
+        async for chunk in self._cache.stream(key, lambda: self._inner.synthesize_stream(request)):
+            yield chunk
+
+    async def warm_up(self, voice_id: str) -> None:
+        await self._inner.warm_up(voice_id)
+
+    async def prefetch(self, requests: list[TTSRequest]) -> None:
+        for request in requests:
+            if self._key(request) is not None:
+                await self.synthesize(request)
+
+
+_phrase_cache: PhraseCache | None = None
+
+
+def get_phrase_cache(
+    tier: AudioCachePort | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> PhraseCache:
+    """
+    Caché de frases del proceso.
+
+    Args:
+        tier: Segundo nivel; solo se usa en la primera llamada (creación).
+        max_bytes: Capacidad del LRU; solo se usa en la primera llamada.
+    """
+    global _phrase_cache  # noqa: PLW0603 - caché de proceso
+    if _phrase_cache is None:
+        _phrase_cache = PhraseCache(max_bytes=max_bytes, tier=tier)
+    return _phrase_cache
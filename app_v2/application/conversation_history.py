@@ -0,0 +1,142 @@
+"""
+ConversationHistory — Historial de la llamada con presupuesto de tokens.
+
+Guarda el transcript completo (persistencia al stop) pero cada solicitud al LLM
+recibe solo una ventana: el system prompt fijo, un resumen de los turnos antiguos
+(si hay summarizer) y los mensajes más recientes que caben en token_budget. Así los
+tokens de prompt (y el TTFT) dejan de crecer con la duración de la llamada.
+
+Tokens: estimación local (~4 caracteres por token + formato por mensaje), sin
+tokenizer; basta para un presupuesto con margen.
+
+Resumen: cuando la ventana deja mensajes fuera, se lanza una tarea en segundo plano
+que los resume (junto con el resumen anterior). Mientras no termina, la ventana
+simplemente omite esos mensajes; el turno nunca espera al resumen.
+
+Referencia legacy: app/processors/logic/aggregator.py (_commit_turn: recorte a
+context_window mensajes, del in-place).
+Decisión: Presupuesto en tokens estimados en lugar de número de mensajes (los turnos
+de una llamada de ventas varían mucho de longitud); el transcript completo no se recorta.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable, Iterator
+
+from app_v2.domain.ports import LLMMessage
+
+logger = logging.getLogger(__name__)
+
+# Caracteres por token (BPE de Llama en español, aproximado por exceso de tokens).
+CHARS_PER_TOKEN = 4
+# Tokens de formato por mensaje (rol y separadores del chat template).
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_PREFIX = "Resumen de la conversación anterior: "
+
+Summarizer = Callable[[str, list[LLMMessage]], Awaitable[str]]
+
+
+def estimate_tokens(message: LLMMessage) -> int:
+    """Tokens estimados de un mensaje (sin tokenizer)."""
+    return len(message.content) // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS
+
+
+class ConversationHistory:
+    """
+    Transcript de la llamada y ventana de contexto para el LLM.
+
+    Iterar devuelve el transcript completo (system prompt incluido).
+    """
+
+    def __init__(
+        self,
+        system_prompt: str = "",
+        token_budget: int = 0,
+        summarizer: Summarizer | None = None,
+    ) -> None:
+        """
+        Args:
+            system_prompt: Siempre al inicio de la ventana.
+            token_budget: Tokens estimados por solicitud (0 = sin límite).
+            summarizer: Opcional; (resumen previo, mensajes) → resumen nuevo.
+        """
+        self._system = LLMMessage(role="system", content=system_prompt) if system_prompt else None
+        self._messages: list[LLMMessage] = []
+        self._tokens: list[int] = []
+        self.token_budget = token_budget
+        self._summarizer = summarizer
+        self._summary: LLMMessage | None = None
+        self._summarized = 0  # mensajes cubiertos por el resumen
+        self._start = 0  # primer mensaje de la ventana (no retrocede)
+        self._summary_task: asyncio.Task | None = None
+
+    def append(self, message: LLMMessage) -> None:
+        self._messages.append(message)
+        self._tokens.append(estimate_tokens(message))
+
+    def __iter__(self) -> Iterator[LLMMessage]:
+        if self._system is not None:
+            yield self._system
+        yield from self._messages
+
+    def __len__(self) -> int:
+        return len(self._messages) + (self._system is not None)
+
+    def __getitem__(self, index: int) -> LLMMessage:
+        return list(self)[index]
+
+    @property
+    def summary(self) -> str:
+        """Resumen de los turnos fuera de la ventana ("" si aún no hay)."""
+        return self._summary.content.removeprefix(SUMMARY_PREFIX) if self._summary else ""
+
+    def window(self) -> list[LLMMessage]:
+        """
+        Mensajes para la siguiente solicitud: system, resumen y los más recientes.
+
+        El último mensaje entra siempre, aunque supere el presupuesto por sí solo.
+        """
+        head = [m for m in (self._system, self._summary) if m is not None]
+        if self.token_budget <= 0:
+            return head + self._messages
+
+        budget = self.token_budget - sum(estimate_tokens(m) for m in head)
+        start, used = len(self._messages), 0
+        while start > self._start and used + self._tokens[start - 1] <= budget:
+            start -= 1
+            used += self._tokens[start]
+        if self._messages:
+            start = min(start, len(self._messages) - 1)
+        self._start = start
+
+        if start > self._summarized:
+            self._schedule_summary(start)
+        return head + self._messages[start:]
+
+    def _schedule_summary(self, upto: int) -> None:
+        if self._summarizer is None or (self._summary_task and not self._summary_task.done()):
+            return
+        self._summary_task = asyncio.create_task(self._refresh_summary(upto))
+
+    async def _refresh_summary(self, upto: int) -> None:
+        """Incorpora messages[_summarized:upto] al resumen (fuera del camino crítico)."""
+        dropped = self._messages[self._summarized : upto]
+        try:
+            text = (await self._summarizer(self.summary, dropped)).strip()
+        except Exception as e:
+            # Sin resumen nuevo: la ventana sigue omitiendo esos turnos; se reintenta
+            logger.warning("History summary failed: %s", e)
+            return
+        if text:
+            self._summary = LLMMessage(role="system", content=SUMMARY_PREFIX + text)
+            self._summarized = upto
+            logger.debug("History summarized up to message %d (%d chars)", upto, len(text))
+
+    async def close(self) -> None:
+        """Cancela el resumen en curso (fin de la llamada)."""
+        if self._summary_task is not None:
+            self._summary_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._summary_task
@@ -5,18 +5,38 @@ Carga configuración, construye el pipeline (STT → LLM → TTS) y expone
 process_audio(audio_bytes) para cada fragmento de audio del usuario.
 Envía el audio de respuesta por AudioTransport.
 
+Turnos: los fragmentos se acumulan en un TurnAccumulator por llamada; el pipeline
+(construido una sola vez en start) se ejecuta una vez por enunciado, al detectar
+fin de turno por silencio (energía o VADPort) o por inactividad del cliente.
+
+Streaming (CallConfig.response_streaming): el LLM emite frases a medida que genera y
+cada frase se sintetiza y envía al transport en cuanto está lista (Pipeline.stream).
+
+STT en streaming (StreamingSTTPort): mientras el enunciado está abierto su audio se envía
+a un STTStream (parciales al panel en vivo); al cerrar el turno solo se espera la
+transcripción final y el pipeline arranca con el TextFrame del usuario.
+
+TTS: start() pre-abre la voz (TTSPort.warm_up) y prepara en segundo plano el saludo y la
+disculpa configurados (TTSPort.prefetch; con CachedTTSAdapter quedan en la caché de frases).
+
 Política de errores (Fase 1): ante error crítico (config, STT, LLM, TTS) se intenta
 enviar mensaje de disculpa por TTS y se cierra la sesión; se lanza CriticalCallError
 para que el entry point registre el error y aplique paro global si corresponde.
 
+Historial (Paso 20): ConversationHistory guarda el transcript completo; cada solicitud al
+LLM lleva el system prompt, un resumen de turnos antiguos (generado en segundo plano con
+CallConfig.history_summary_model) y los turnos recientes dentro de history_token_budget.
+
 Persistencia (Fase 2): si se inyecta CallPersistencePort y stream_id, al inicio se
 crea el registro de llamada y al stop() se guardan transcripciones (user/assistant)
 y se cierra la llamada en BD.
 
 Referencia legacy: app/core/orchestrator_v2.py (idea de config + pipeline + transport).
-Docs: docs/POLITICAS_Y_FLUJOS.md, docs/APP_V2_BUILD_LOG.md Pasos 5 y 6.
+Docs: docs/POLITICAS_Y_FLUJOS.md, docs/APP_V2_BUILD_LOG.md Pasos 5, 6, 19 y 20.
 """
 
+import asyncio
+import contextlib
 import logging
 import time
 
@@ -29,15 +49,23 @@ from app_v2.domain.ports import (
     ExtractionPort,
     LLMMessage,
     LLMPort,
+    LLMRequest,
+    STTConfig,
+    STTHypothesis,
     STTPort,
+    STTStream,
+    StreamingSTTPort,
     TTSPort,
     TTSRequest,
+    VADPort,
 )
 from app_v2.domain.value_objects import VoiceConfig
+from app_v2.application.conversation_history import ConversationHistory
 from app_v2.application.errors import CriticalCallError
 from app_v2.application.frames import AudioFrame, Frame, TextFrame
 from app_v2.application.pipeline import Pipeline
 from app_v2.application.processors import LLMProcessor, STTProcessor, TTSProcessor
+from app_v2.application.turn_accumulator import TurnAccumulator
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +87,7 @@ class Orchestrator:
         stream_id: str | None = None,
         persistence_port: CallPersistencePort | None = None,
         extraction_port: ExtractionPort | None = None,
+        vad_port: VADPort | None = None,
     ) -> None:
         self._transport = transport
         self._stt = stt_port
@@ -70,10 +99,20 @@ class Orchestrator:
         self._stream_id = stream_id
         self._persistence_port = persistence_port
         self._extraction_port = extraction_port
+        self._vad_port = vad_port
         self._config: CallConfig | None = None
-        self._conversation_history: list[LLMMessage] = []
+        self._conversation_history = ConversationHistory()
         self._call_db_id: int | None = None
         self._last_tts_sent_at: float | None = None
+        self._pipeline: Pipeline | None = None
+        self._turns: TurnAccumulator | None = None
+        self._turn_lock = asyncio.Lock()
+        self._turn_timeout_task: asyncio.Task | None = None
+        self._last_audio_at = 0.0
+        self._deferred_error: CriticalCallError | None = None
+        self._prefetch_task: asyncio.Task | None = None
+        self._stt_stream: STTStream | None = None
+        self._stt_streamed = 0  # bytes del enunciado abierto ya enviados al STTStream
 
     async def start(self) -> None:
         """
@@ -95,12 +134,24 @@ class Orchestrator:
             await self._transport.close()
             raise CriticalCallError(f"config_load_failed: {e!s}") from e
 
-        if self._config.system_prompt:
-            self._conversation_history = [
-                LLMMessage(role="system", content=self._config.system_prompt),
-            ]
-        else:
-            self._conversation_history = []
+        self._conversation_history = ConversationHistory(
+            system_prompt=self._config.system_prompt,
+            token_budget=self._config.history_token_budget,
+            summarizer=self._summarize_history if self._config.history_summary_model else None,
+        )
+
+        self._pipeline = Pipeline([
+            STTProcessor(self._stt, self._config),
+            LLMProcessor(self._llm, self._config, self._conversation_history),
+            TTSProcessor(self._tts, self._config),
+        ])
+        self._turns = TurnAccumulator(self._config, self._vad_port)
+        try:
+            voice = VoiceConfig.from_call_config(self._config)
+            await self._tts.warm_up(voice.to_tts_params()["voice_id"])
+        except Exception as e:
+            logger.warning("TTS warm-up failed: %s", e)
+        self._prefetch_task = asyncio.create_task(self._prefetch_phrases())
 
         if self._persistence_port and self._stream_id:
             self._call_db_id = await self._persistence_port.create_call(
@@ -108,6 +159,44 @@ class Orchestrator:
                 self._client_type,
             )
 
+    def _tts_request(self, text: str) -> TTSRequest:
+        """TTSRequest con la voz de la llamada (VoiceConfig desde CallConfig)."""
+        params = VoiceConfig.from_call_config(self._config).to_tts_params()
+        return TTSRequest(
+            text=text.strip(),
+            voice_id=params["voice_id"],
+            language=params["language"],
+            speed=params["speed"],
+            pitch=params["pitch"],
+            volume=params["volume"],
+        )
+
+    async def _prefetch_phrases(self) -> None:
+        """Prepara en la caché TTS el saludo y la disculpa configurados (en segundo plano)."""
+        texts = [self._config.first_message, self._config.apology_message]
+        try:
+            await self._tts.prefetch([self._tts_request(t) for t in texts if t.strip()])
+        except Exception as e:
+            logger.warning("TTS prefetch failed: %s", e)
+
+    async def _summarize_history(self, previous: str, messages: list[LLMMessage]) -> str:
+        """Resume los turnos que salen de la ventana (ConversationHistory, en segundo plano)."""
+        transcript = "\n".join(f"{m.role}: {m.content}" for m in messages)
+        if previous:
+            transcript = f"Resumen previo: {previous}\n{transcript}"
+        request = LLMRequest(
+            messages=[LLMMessage(role="user", content=transcript)],
+            model=self._config.history_summary_model,
+            temperature=0.0,
+            max_tokens=200,
+            system_prompt=(
+                "Resume la conversación en español en un párrafo breve. Conserva nombres, "
+                "datos, cifras, acuerdos y preguntas pendientes del cliente."
+            ),
+        )
+        parts = [chunk.text async for chunk in self._llm.generate_stream(request) if chunk.text]
+        return "".join(parts)
+
     async def _apologize_and_close(self) -> None:
         """
         Intenta enviar mensaje de disculpa por TTS y cierra el transport.
@@ -115,16 +204,7 @@ class Orchestrator:
         """
         if self._config and self._config.apology_message.strip():
             try:
-                voice = VoiceConfig.from_call_config(self._config)
-                params = voice.to_tts_params()
-                request = TTSRequest(
-                    text=self._config.apology_message.strip(),
-                    voice_id=params["voice_id"],
-                    language=params["language"],
-                    speed=params["speed"],
-                    pitch=params["pitch"],
-                    volume=params["volume"],
-                )
+                request = self._tts_request(self._config.apology_message)
                 audio_bytes = await self._tts.synthesize(request)
                 if audio_bytes:
                     await self._transport.send_audio(
@@ -150,15 +230,19 @@ class Orchestrator:
 
     async def process_audio(self, audio_bytes: bytes) -> None:
         """
-        Procesa un bloque de audio del usuario: STT → LLM → TTS y envía el audio resultante.
+        Acumula un fragmento de audio del usuario; al cerrar el turno ejecuta
+        STT → LLM → TTS sobre el enunciado completo y envía el audio resultante.
         Para cliente browser, emite también transcripción en vivo (user/assistant) al panel.
         Ante error crítico: disculpa por TTS, cierre y CriticalCallError.
 
         Args:
-            audio_bytes: Audio del usuario (formato según config: sample_rate, etc.).
+            audio_bytes: Audio del usuario (PCM 16-bit al sample_rate de config).
         """
-        if self._config is None:
+        if self._config is None or self._turns is None:
             return
+        if self._deferred_error is not None:
+            error, self._deferred_error = self._deferred_error, None
+            raise error
         # Protección anti-eco: rechazar audio entrante poco después de enviar TTS
         if self._last_tts_sent_at is not None:
             elapsed = time.time() - self._last_tts_sent_at
@@ -168,34 +252,142 @@ class Orchestrator:
                     elapsed,
                 )
                 return
+        self._last_audio_at = time.monotonic()
+        # Un fragmento largo puede cerrar varios enunciados: un turno por cada uno, en orden
+        for utterance in await self._turns.feed(audio_bytes):
+            await self._run_turn(utterance)
+        if self._turns.in_speech:
+            await self._stream_turn_audio()
+            if self._turn_timeout_task is None:
+                self._turn_timeout_task = asyncio.create_task(self._watch_turn_timeout())
+
+    def _stt_config(self) -> STTConfig:
+        return STTConfig(language=self._config.stt_language, sample_rate=self._config.sample_rate)
+
+    async def _stream_turn_audio(self) -> None:
+        """Con StreamingSTTPort, envía al STT el audio nuevo del enunciado abierto."""
+        if not isinstance(self._stt, StreamingSTTPort):
+            return
+        if self._stt_stream is None:
+            self._stt_stream = self._stt.open_stream(self._stt_config(), self._on_partial_transcript)
+            self._stt_streamed = 0
+        audio = self._turns.utterance
+        if len(audio) > self._stt_streamed:
+            chunk = bytes(audio[self._stt_streamed :])
+            self._stt_streamed = len(audio)
+            await self._stt_stream.push_audio(chunk)
+
+    async def _on_partial_transcript(self, hypothesis: STTHypothesis) -> None:
+        """Transcripción parcial del usuario al panel en vivo (solo browser; la final va por el pipeline)."""
+        if hypothesis.is_final or self._client_type != "browser":
+            return
+        await self._transport.send_json(
+            {"type": "transcript", "role": "user", "text": hypothesis.text, "partial": True}
+        )
+
+    async def _turn_input(self, utterance: bytes) -> Frame | None:
+        """
+        Frame inicial del turno: AudioFrame (STT dentro del pipeline) o, si el enunciado
+        se transcribió en streaming, TextFrame con la transcripción final.
+        """
+        stream, self._stt_stream = self._stt_stream, None
+        if stream is None:
+            return AudioFrame(data=utterance, sample_rate=self._config.sample_rate)
+        if len(utterance) > self._stt_streamed:
+            await stream.push_audio(utterance[self._stt_streamed :])
+        text = (await stream.finish()).strip()
+        if not text:
+            return None
+        return TextFrame(text=text, role="user")
+
+    async def _watch_turn_timeout(self) -> None:
+        """
+        Cierra el turno si el cliente deja de enviar audio con voz en curso
+        (p. ej. el simulador no envía silencio). Una tarea por turno abierto.
+        """
+        if self._config is None or self._turns is None:
+            return
+        timeout = self._config.silence_timeout_ms / 1000
         try:
-            stt_p = STTProcessor(self._stt, self._config)
-            llm_p = LLMProcessor(self._llm, self._config, self._conversation_history)
-            tts_p = TTSProcessor(self._tts, self._config)
-            pipeline = Pipeline([stt_p, llm_p, tts_p])
-            initial = AudioFrame(
-                data=audio_bytes,
-                sample_rate=self._config.sample_rate,
+            while self._turns.in_speech:
+                remaining = self._last_audio_at + timeout - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    continue
+                utterance = self._turns.flush()
+                if utterance is None:
+                    continue
+                try:
+                    await self._run_turn(utterance)
+                except CriticalCallError as e:
+                    self._deferred_error = e
+                    break
+        finally:
+            self._turn_timeout_task = None
+
+    async def _run_turn(self, utterance: bytes) -> None:
+        """Ejecuta el pipeline sobre un enunciado completo (un turno a la vez)."""
+        if self._config is None or self._pipeline is None:
+            return
+        async with self._turn_lock:
+            try:
+                initial = await self._turn_input(utterance)
+                if initial is None:
+                    return
+                if self._config.response_streaming:
+                    await self._run_turn_streaming(initial)
+                    return
+                result = await self._pipeline.run(initial, on_frame=self._emit_transcript_live)
+                if result is not None and isinstance(result, AudioFrame):
+                    await self._send_audio_frame(result)
+            except CriticalCallError:
+                raise
+            except Exception as e:
+                logger.error("Critical error in process_audio: %s", e)
+                await self._apologize_and_close()
+                raise CriticalCallError(str(e)) from e
+
+    async def _run_turn_streaming(self, initial: Frame) -> None:
+        """
+        Envía el audio de cada frase en cuanto el TTS la produce.
+        La transcripción en vivo del asistente se emite completa al final del turno.
+        """
+        if self._pipeline is None:
+            return
+        reply: list[str] = []
+
+        async def on_frame(frame: Frame) -> None:
+            if isinstance(frame, TextFrame) and frame.role == "assistant":
+                reply.append(frame.text)
+                return
+            await self._emit_transcript_live(frame)
+
+        async for result in self._pipeline.stream(initial, on_frame=on_frame):
+            if isinstance(result, AudioFrame):
+                await self._send_audio_frame(result)
+        if reply:
+            await self._emit_transcript_live(
+                TextFrame(text=" ".join(reply), role="assistant", trace_id=initial.trace_id)
             )
-            result = await pipeline.run(initial, on_frame=self._emit_transcript_live)
-            if result is not None and isinstance(result, AudioFrame):
-                await self._transport.send_audio(
-                    result.data,
-                    sample_rate=result.sample_rate,
-                )
-                self._last_tts_sent_at = time.time()
-        except CriticalCallError:
-            raise
-        except Exception as e:
-            logger.error("Critical error in process_audio: %s", e)
-            await self._apologize_and_close()
-            raise CriticalCallError(str(e)) from e
+
+    async def _send_audio_frame(self, frame: AudioFrame) -> None:
+        await self._transport.send_audio(frame.data, sample_rate=frame.sample_rate)
+        self._last_tts_sent_at = time.time()
 
     async def stop(self) -> None:
         """
         Persiste transcripciones y cierra la llamada en BD si hay CallPersistencePort;
         luego cierra el transport.
         """
+        for task in (self._turn_timeout_task, self._prefetch_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        if self._stt_stream is not None:
+            stream, self._stt_stream = self._stt_stream, None
+            await stream.cancel()
+        await self._conversation_history.close()
         if self._persistence_port and self._call_db_id is not None:
             items = [
                 (m.role, m.content)
@@ -6,9 +6,13 @@ es la entrada del siguiente. Sin cola, sin prioridades, sin backpressure en Fase
 
 Opcional: on_frame(frame) se invoca después de cada paso con el frame resultante,
 para permitir emisión en vivo (ej. transcripción en el panel del simulador).
+
+Modo streaming (stream): un procesador con process_stream puede emitir varios frames
+por entrada (ej. LLM por frases); cada frame avanza al siguiente procesador en cuanto
+se emite, de modo que el TTS sintetiza la primera frase mientras el LLM sigue generando.
 """
 
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 
 from app_v2.application.frames import Frame
 from app_v2.application.processor import Processor
@@ -46,3 +50,50 @@ class Pipeline:
             if current is not None and on_frame is not None:
                 await on_frame(current)
         return current
+
+    async def stream(
+        self,
+        frame: Frame,
+        on_frame: Callable[[Frame], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[Frame]:
+        """
+        Ejecuta el frame en modo streaming.
+
+        Los procesadores con process_stream pueden emitir varios frames; los demás
+        emiten el resultado de process (si no es None). Cada frame emitido se propaga
+        por el resto de la cadena antes de pedir el siguiente.
+
+        Args:
+            frame: Frame inicial (normalmente AudioFrame).
+            on_frame: Opcional; se llama con cada frame emitido por cada paso.
+
+        Yields:
+            Frames producidos por el último procesador, en orden.
+        """
+        async for result in self._stream_from(0, frame, on_frame):
+            yield result
+
+    async def _stream_from(
+        self,
+        index: int,
+        frame: Frame,
+        on_frame: Callable[[Frame], Awaitable[None]] | None,
+    ) -> AsyncIterator[Frame]:
+        if index == len(self._processors):
+            yield frame
+            return
+        processor = self._processors[index]
+        process_stream = getattr(processor, "process_stream", None)
+        outputs = process_stream(frame) if process_stream is not None else _single(processor, frame)
+        async for output in outputs:
+            if on_frame is not None:
+                await on_frame(output)
+            async for result in self._stream_from(index + 1, output, on_frame):
+                yield result
+
+
+async def _single(processor: Processor, frame: Frame) -> AsyncIterator[Frame]:
+    """Adapta process(frame) a un iterador de cero o un frame."""
+    result = await processor.process(frame)
+    if result is not None:
+        yield result
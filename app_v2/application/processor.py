@@ -6,9 +6,11 @@ Pipeline ejecuta los procesadores en secuencia.
 
 Referencia legacy: app/core/processor.py (FrameProcessor, process_frame).
 Decisión: Método único process(frame) -> Frame | None; sin dirección UPSTREAM/DOWNSTREAM en Fase 2.
+Paso 13: process_stream(frame) opcional para emitir varios frames por entrada (Pipeline.stream).
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from app_v2.application.frames import Frame
 
@@ -32,3 +34,20 @@ class Processor(ABC):
             Siguiente frame para la cadena, o None si se descarta.
         """
         ...
+
+    async def process_stream(self, frame: Frame) -> AsyncIterator[Frame]:
+        """
+        Procesa el frame emitiendo cero o más frames (modo streaming).
+
+        Por defecto emite el resultado de process; los procesadores que generan
+        salida incremental (ej. LLM por frases) lo sobrescriben.
+
+        Args:
+            frame: Frame de entrada.
+
+        Yields:
+            Frames para el siguiente procesador.
+        """
+        result = await self.process(frame)
+        if result is not None:
+            yield result
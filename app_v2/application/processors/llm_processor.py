@@ -1,44 +1,90 @@
 """
 LLMProcessor — Convierte TextFrame (user) en TextFrame (assistant).
 
-Usa LLMPort.generate_stream; en Fase 2 se recolecta toda la respuesta en un solo texto.
-Mantiene conversation_history (inyectada) actualizada.
+Usa LLMPort.generate_stream. process recolecta toda la respuesta en un solo texto;
+process_stream (Paso 13) emite un TextFrame por frase/cláusula en cuanto se completa,
+para que el TTS empiece a sintetizar antes de que termine la generación.
+Mantiene conversation_history (inyectada) actualizada con la respuesta completa; si es
+un ConversationHistory (Paso 20) la solicitud lleva solo su ventana con presupuesto de tokens.
 
-Referencia legacy: app/processors/logic/llm.py (idea de history + stream).
-Decisión: history mutable compartida con el orquestador; sin tools; collect completo.
+Referencia legacy: app/processors/logic/llm.py (history + stream; heurística de frases
+"len > 10 y [.?!] + espacio").
+Decisión: history mutable compartida con el orquestador; sin tools; corte por frase
+(. ? ! …) y, en respuestas largas, por cláusula (, ; :).
 """
 
+import re
+from collections.abc import AsyncIterator
+
 from app_v2.domain.ports import CallConfig, LLMMessage, LLMPort, LLMRequest
+from app_v2.application.conversation_history import ConversationHistory
 from app_v2.application.frames import Frame, TextFrame
 
+# Fin de frase seguido de espacio (admite comillas/paréntesis de cierre).
+_SENTENCE_END = re.compile(r"[.?!…]+[\"'»)\]]*\s")
+# Fin de cláusula seguido de espacio.
+_CLAUSE_END = re.compile(r"[,;:]\s")
+
+# Longitud mínima para emitir una frase (legacy: len(sentence_buffer) > 10).
+MIN_SENTENCE_CHARS = 10
+# Longitud mínima para cortar por cláusula (evita fragmentos cortos con prosodia pobre).
+MIN_CLAUSE_CHARS = 40
+
+
+def pop_clause(buffer: str) -> tuple[str, str] | None:
+    """
+    Extrae la primera frase (o cláusula larga) completa del buffer.
+
+    Args:
+        buffer: Texto acumulado del stream del LLM.
+
+    Returns:
+        (frase, resto) o None si aún no hay un corte válido.
+    """
+    for pattern, min_chars in (
+        (_SENTENCE_END, MIN_SENTENCE_CHARS),
+        (_CLAUSE_END, MIN_CLAUSE_CHARS),
+    ):
+        for match in pattern.finditer(buffer):
+            if match.end() >= min_chars:
+                return buffer[: match.end()].strip(), buffer[match.end() :]
+    return None
+
 
 class LLMProcessor:
     """
-    Procesador LLM: texto usuario → texto asistente (vía stream recolectado).
+    Procesador LLM: texto usuario → texto asistente (recolectado o por frases).
     """
 
     def __init__(
         self,
         llm_port: LLMPort,
         config: CallConfig,
-        conversation_history: list[LLMMessage],
+        conversation_history: list[LLMMessage] | ConversationHistory,
     ) -> None:
         self._llm = llm_port
         self._config = config
         self._history = conversation_history
 
-    async def process(self, frame: Frame) -> Frame | None:
-        if not isinstance(frame, TextFrame) or frame.role != "user":
-            return frame
+    def _request_for(self, frame: TextFrame) -> LLMRequest:
+        """Añade el mensaje del usuario al historial y construye la solicitud."""
         self._history.append(LLMMessage(role="user", content=frame.text))
-        messages = list(self._history)
-        request = LLMRequest(
+        if isinstance(self._history, ConversationHistory):
+            messages = self._history.window()
+        else:
+            messages = list(self._history)
+        return LLMRequest(
             messages=messages,
             model=self._config.llm_model,
             temperature=self._config.temperature,
             max_tokens=self._config.max_tokens,
             system_prompt=None,
         )
+
+    async def process(self, frame: Frame) -> Frame | None:
+        if not isinstance(frame, TextFrame) or frame.role != "user":
+            return frame
+        request = self._request_for(frame)
         collected: list[str] = []
         async for chunk in self._llm.generate_stream(request):
             if chunk.text:
@@ -53,3 +99,34 @@ class LLMProcessor:
             trace_id=frame.trace_id,
             timestamp=frame.timestamp,
         )
+
+    async def process_stream(self, frame: Frame) -> AsyncIterator[Frame]:
+        if not isinstance(frame, TextFrame) or frame.role != "user":
+            yield frame
+            return
+        request = self._request_for(frame)
+        collected: list[str] = []
+        buffer = ""
+        async for chunk in self._llm.generate_stream(request):
+            if not chunk.text:
+                continue
+            collected.append(chunk.text)
+            buffer += chunk.text
+            while (split := pop_clause(buffer)) is not None:
+                clause, buffer = split
+                yield TextFrame(
+                    text=clause,
+                    role="assistant",
+                    trace_id=frame.trace_id,
+                    timestamp=frame.timestamp,
+                )
+        if buffer.strip():
+            yield TextFrame(
+                text=buffer.strip(),
+                role="assistant",
+                trace_id=frame.trace_id,
+                timestamp=frame.timestamp,
+            )
+        response_text = "".join(collected).strip()
+        if response_text:
+            self._history.append(LLMMessage(role="assistant", content=response_text))
@@ -3,11 +3,14 @@ TTSProcessor — Convierte TextFrame (assistant) en AudioFrame.
 
 Usa TTSPort.synthesize con TTSRequest construido desde CallConfig (vía VoiceConfig).
 Solo procesa TextFrame con role assistant; el resto se devuelve sin cambio.
+process_stream (Paso 14) usa TTSPort.synthesize_stream y emite un AudioFrame por fragmento.
 
 Referencia legacy: app/processors/logic/tts.py (idea de config → TTSRequest).
 Decisión: VoiceConfig.from_call_config(config); TTSRequest con text + to_tts_params().
 """
 
+from collections.abc import AsyncIterator
+
 from app_v2.domain.ports import CallConfig, TTSRequest, TTSPort
 from app_v2.domain.value_objects import VoiceConfig
 from app_v2.application.frames import AudioFrame, Frame, TextFrame
@@ -22,14 +25,10 @@ class TTSProcessor:
         self._tts = tts_port
         self._config = config
 
-    async def process(self, frame: Frame) -> Frame | None:
-        if not isinstance(frame, TextFrame) or frame.role != "assistant":
-            return frame
-        if not frame.text or not frame.text.strip():
-            return None
+    def _request_for(self, frame: TextFrame) -> TTSRequest:
         voice = VoiceConfig.from_call_config(self._config)
         params = voice.to_tts_params()
-        request = TTSRequest(
+        return TTSRequest(
             text=frame.text.strip(),
             voice_id=params["voice_id"],
             language=params["language"],
@@ -37,6 +36,13 @@ class TTSProcessor:
             pitch=params["pitch"],
             volume=params["volume"],
         )
+
+    async def process(self, frame: Frame) -> Frame | None:
+        if not isinstance(frame, TextFrame) or frame.role != "assistant":
+            return frame
+        if not frame.text or not frame.text.strip():
+            return None
+        request = self._request_for(frame)
         audio_bytes = await self._tts.synthesize(request)
         if not audio_bytes:
             return None
@@ -46,3 +52,17 @@ class TTSProcessor:
             trace_id=frame.trace_id,
             timestamp=frame.timestamp,
         )
+
+    async def process_stream(self, frame: Frame) -> AsyncIterator[Frame]:
+        if not isinstance(frame, TextFrame) or frame.role != "assistant":
+            yield frame
+            return
+        if not frame.text or not frame.text.strip():
+            return
+        async for chunk in self._tts.synthesize_stream(self._request_for(frame)):
+            yield AudioFrame(
+                data=chunk,
+                sample_rate=self._config.sample_rate,
+                trace_id=frame.trace_id,
+                timestamp=frame.timestamp,
+            )
@@ -0,0 +1,188 @@
+"""
+TurnAccumulator — Acumula el audio entrante y detecta el fin de enunciado.
+
+Recibe los fragmentos de audio tal como llegan (p. ej. 20 ms en telephony) y solo
+devuelve el enunciado completo cuando detecta fin de turno: voz seguida de
+silence_timeout_ms de silencio. Así el orquestador ejecuta un único
+STT → LLM → TTS por turno del usuario en lugar de uno por paquete.
+
+Detección por energía (RMS) por defecto; si se inyecta un VADPort (p. ej. Silero)
+se usa su probabilidad de voz por ventana.
+
+Referencia legacy: app/processors/logic/vad.py (ventanas, min_speech_frames, silencio).
+Decisión: Buffer de enunciado preasignado por llamada y pre-roll circular de ventanas;
+el audio es PCM 16-bit mono al sample_rate de CallConfig.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+
+from app_v2.domain.ports import CallConfig, VADPort
+
+# Ventana de análisis para el detector por energía.
+ENERGY_WINDOW_MS = 20
+
+# RMS normalizado (0-1) a partir del cual una ventana cuenta como voz (detector por energía).
+ENERGY_SPEECH_RMS = 0.02
+
+# Probabilidad mínima de VADPort para considerar voz (mismo umbral que el VAD legacy).
+VAD_SPEECH_THRESHOLD = 0.5
+
+# Voz continua mínima para abrir un turno (evita chasquidos; legacy: min_speech_frames).
+MIN_SPEECH_MS = 60
+
+# Audio previo al inicio de voz que se conserva para no recortar la primera sílaba.
+PREROLL_MS = 200
+
+# Duración máxima de un enunciado; al llenarse el buffer se despacha el turno.
+MAX_TURN_MS = 15_000
+
+
+class TurnAccumulator:
+    """
+    Acumulador de turno por llamada: feed(audio) devuelve los enunciados que cierra.
+    """
+
+    def __init__(
+        self,
+        config: CallConfig,
+        vad_port: VADPort | None = None,
+        max_turn_ms: int = MAX_TURN_MS,
+    ) -> None:
+        """
+        Args:
+            config: CallConfig (sample_rate y silence_timeout_ms).
+            vad_port: Detector de voz opcional; sin él se usa energía (RMS).
+            max_turn_ms: Capacidad del buffer de enunciado en milisegundos.
+        """
+        self._sample_rate = config.sample_rate
+        self._silence_timeout_ms = config.silence_timeout_ms
+        self._vad = vad_port
+        if vad_port is not None:
+            window_samples = vad_port.window_samples(self._sample_rate)
+        else:
+            window_samples = self._sample_rate * ENERGY_WINDOW_MS // 1000
+        self._window_bytes = window_samples * 2
+        self._window_ms = window_samples * 1000 / self._sample_rate
+        self._min_speech_windows = max(1, math.ceil(MIN_SPEECH_MS / self._window_ms))
+
+        capacity = (self._sample_rate * 2 * max_turn_ms) // 1000
+        capacity -= capacity % self._window_bytes
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._length = 0
+        self._speech_end = 0
+        self._pending = bytearray()
+        self._preroll: deque[bytes] = deque(maxlen=max(1, int(PREROLL_MS // self._window_ms)))
+
+        self._in_speech = False
+        self._speech_windows = 0
+        self._silence_ms = 0.0
+
+    @property
+    def in_speech(self) -> bool:
+        """True si hay un enunciado abierto (voz detectada y turno sin cerrar)."""
+        return self._in_speech
+
+    @property
+    def utterance(self) -> memoryview:
+        """Audio del enunciado abierto hasta ahora (pre-roll incluido); vista válida hasta el próximo feed."""
+        return self._view[: self._length]
+
+    async def feed(self, audio: bytes) -> list[bytes]:
+        """
+        Añade audio entrante y evalúa las ventanas completas.
+
+        Args:
+            audio: PCM 16-bit mono (cualquier longitud).
+
+        Returns:
+            PCM de cada enunciado que este fragmento cierra, en orden (un fragmento
+            largo puede cerrar varios); lista vacía si ninguno.
+        """
+        self._pending.extend(audio)
+        window_bytes = self._window_bytes
+        usable = len(self._pending) - len(self._pending) % window_bytes
+        utterances: list[bytes] = []
+        for offset in range(0, usable, window_bytes):
+            window = bytes(self._pending[offset : offset + window_bytes])
+            done = self._process_window(window, await self._is_speech(window))
+            if done is not None:
+                utterances.append(done)
+        del self._pending[:usable]
+        return utterances
+
+    def flush(self) -> bytes | None:
+        """
+        Cierra el turno abierto (p. ej. por inactividad del cliente).
+
+        Returns:
+            PCM del enunciado si había voz acumulada; None si no.
+        """
+        if not self._in_speech:
+            return None
+        return self._take()
+
+    def reset(self) -> None:
+        """Descarta el audio acumulado y el estado de detección."""
+        self._length = 0
+        self._speech_end = 0
+        self._pending.clear()
+        self._preroll.clear()
+        self._in_speech = False
+        self._speech_windows = 0
+        self._silence_ms = 0.0
+        if self._vad is not None:
+            self._vad.reset()
+
+    async def _is_speech(self, window: bytes) -> bool:
+        if self._vad is not None:
+            return await self._vad.speech_probability(window, self._sample_rate) >= VAD_SPEECH_THRESHOLD
+        samples = np.frombuffer(window, dtype=np.int16).astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples * samples))) / 32768.0
+        return rms >= ENERGY_SPEECH_RMS
+
+    def _process_window(self, window: bytes, speech: bool) -> bytes | None:
+        if not self._in_speech:
+            self._preroll.append(window)
+            if not speech:
+                self._speech_windows = 0
+                return None
+            self._speech_windows += 1
+            if self._speech_windows < self._min_speech_windows:
+                return None
+            self._in_speech = True
+            self._silence_ms = 0.0
+            for pre in self._preroll:
+                self._append(pre)
+            self._preroll.clear()
+            self._speech_end = self._length
+            return None
+
+        self._append(window)
+        if speech:
+            self._silence_ms = 0.0
+            self._speech_end = self._length
+        else:
+            self._silence_ms += self._window_ms
+            if self._silence_ms >= self._silence_timeout_ms:
+                return self._take()
+        if self._length + self._window_bytes > len(self._buffer):
+            return self._take()
+        return None
+
+    def _append(self, window: bytes) -> None:
+        end = self._length + len(window)
+        if end > len(self._buffer):
+            return
+        self._view[self._length : end] = window
+        self._length = end
+
+    def _take(self) -> bytes | None:
+        utterance = bytes(self._view[: self._speech_end])
+        pending = bytes(self._pending)
+        self.reset()
+        self._pending.extend(pending)
+        return utterance or None
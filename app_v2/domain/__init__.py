@@ -6,6 +6,7 @@ Véase app_v2/domain/README.md.
 """
 
 from app_v2.domain.ports import (
+    AudioCachePort,
     AudioTransport,
     CallConfig,
     ConfigPort,
@@ -14,14 +15,19 @@ from app_v2.domain.ports import (
     LLMPort,
     LLMRequest,
     STTConfig,
+    STTHypothesis,
     STTPort,
+    STTStream,
+    StreamingSTTPort,
     TTSRequest,
     TTSPort,
+    VADPort,
 )
 from app_v2.domain.models import LLMChunk
 from app_v2.domain.value_objects import VoiceConfig
 
 __all__ = [
+    "AudioCachePort",
     "AudioTransport",
     "CallConfig",
     "ConfigPort",
@@ -31,8 +37,12 @@ __all__ = [
     "LLMPort",
     "LLMRequest",
     "STTConfig",
+    "STTHypothesis",
     "STTPort",
+    "STTStream",
+    "StreamingSTTPort",
     "TTSRequest",
     "TTSPort",
+    "VADPort",
     "VoiceConfig",
 ]
@@ -0,0 +1,45 @@
+"""
+Port: AudioCachePort.
+
+Interface para un almacén de audio sintetizado direccionado por contenido
+(segundo nivel de la caché de frases TTS: disco, Redis).
+
+Referencia legacy: app/domain/ports/cache_port.py (get/set con TTL; valores JSON).
+Decisión: Valores en bytes (audio crudo) y claves opacas calculadas por la caché de
+frases; la expiración o el límite de tamaño es responsabilidad de cada implementación.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class AudioCachePort(ABC):
+    """
+    Port para almacenes de audio por clave.
+
+    Implementaciones: DiskAudioCache (app_v2/adapters/outbounds/tts_cache.py),
+    RedisAudioCache (app/adapters/outbound/cache).
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """
+        Obtiene el audio de una clave.
+
+        Args:
+            key: Clave de la frase (hash hexadecimal).
+
+        Returns:
+            Audio en bytes o None si no existe.
+        """
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, audio: bytes) -> None:
+        """
+        Guarda el audio de una clave.
+
+        Args:
+            key: Clave de la frase (hash hexadecimal).
+            audio: Audio en bytes (formato del adapter TTS).
+        """
+        ...
@@ -35,6 +35,8 @@ class CallConfig:
     system_prompt: str = ""
     first_message: str = ""
     first_message_mode: str = "speak-first"  # "speak-first" | "wait-for-user"
+    history_token_budget: int = 3000  # tokens estimados por solicitud; 0 = historial completo
+    history_summary_model: str = "llama-3.1-8b-instant"  # resume turnos fuera de la ventana; "" = sin resumen
 
     # TTS / Voz
     voice_name: str = "es-MX-DaliaNeural"
@@ -43,6 +45,7 @@ class CallConfig:
     voice_pitch: int = 0
     voice_volume: int = 100
     voice_style: str = "default"
+    response_streaming: bool = True  # LLM → TTS por frases; False = respuesta completa
 
     # STT
     stt_language: str = "es-MX"
@@ -2,13 +2,17 @@
 Port: STTPort.
 
 Interface para proveedores de Speech-to-Text.
-Para el primer flujo V2 se usa transcripción "completa" (audio → texto), no streaming.
+STTPort: transcripción "completa" (audio → texto). StreamingSTTPort (Paso 19): además
+abre un STTStream por enunciado que acepta audio incremental y emite hipótesis
+parciales y final (STTHypothesis).
 
-Referencia legacy: app/domain/ports/stt_port.py.
-Decisión: Solo transcribe_audio async; no STTRecognizer ni streaming en Fase 1.
+Referencia legacy: app/domain/ports/stt_port.py (STTRecognizer, eventos recognizing/recognized).
+Decisión: Streaming como variante opcional del port (subclase); el orquestador la usa si
+el adapter inyectado la implementa y si no, transcribe_audio como en Fase 1.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 
@@ -28,8 +32,8 @@ class STTPort(ABC):
     """
     Port para proveedores de Speech-to-Text.
 
-    En Fase 1: transcripción de un bloque de audio a texto completo.
-    Streaming puede añadirse en fases posteriores.
+    Transcripción de un bloque de audio a texto completo.
+    Variante incremental con parciales: StreamingSTTPort.
     """
 
     @abstractmethod
@@ -48,3 +52,74 @@ class STTPort(ABC):
             Excepciones del adapter en caso de fallo del proveedor.
         """
         ...
+
+
+@dataclass(frozen=True)
+class STTHypothesis:
+    """
+    Hipótesis de un STTStream.
+
+    Atributos:
+        text: Transcripción del enunciado hasta el momento (acumulada, no incremental).
+        is_final: True solo en la hipótesis de cierre (finish).
+    """
+    text: str
+    is_final: bool = False
+
+
+class STTStream(ABC):
+    """
+    Reconocimiento incremental de un enunciado (una instancia por turno).
+    """
+
+    @abstractmethod
+    async def push_audio(self, audio: bytes) -> None:
+        """
+        Añade audio del enunciado en curso.
+
+        Args:
+            audio: PCM 16-bit (formato según STTConfig), a continuación del ya enviado.
+        """
+        ...
+
+    @abstractmethod
+    async def finish(self) -> str:
+        """
+        Cierra el enunciado y espera la transcripción final.
+
+        Returns:
+            Texto final (vacío si no se reconoció voz).
+
+        Raises:
+            Excepciones del adapter en caso de fallo del proveedor.
+        """
+        ...
+
+    @abstractmethod
+    async def cancel(self) -> None:
+        """Descarta el enunciado (barge-in, fin de llamada) sin esperar resultados."""
+        ...
+
+
+class StreamingSTTPort(STTPort):
+    """
+    STTPort con reconocimiento incremental y resultados parciales.
+    """
+
+    @abstractmethod
+    def open_stream(
+        self,
+        config: STTConfig,
+        on_hypothesis: Callable[[STTHypothesis], Awaitable[None]] | None = None,
+    ) -> STTStream:
+        """
+        Abre el reconocimiento de un enunciado.
+
+        Args:
+            config: Configuración STT (idioma, sample rate, etc.).
+            on_hypothesis: Opcional; se llama con cada hipótesis parcial y con la final.
+
+        Returns:
+            STTStream del enunciado.
+        """
+        ...
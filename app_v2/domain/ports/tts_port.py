@@ -2,14 +2,17 @@
 Port: TTSPort.
 
 Interface para proveedores de Text-to-Speech.
-Síntesis de texto a audio (un bloque).
+Síntesis de texto a audio (un bloque o por fragmentos).
 
 Referencia legacy: app/domain/ports/tts_port.py.
-Decisión: Solo synthesize(request) -> bytes en Fase 1; sin synthesize_ssml ni
+Decisión: synthesize(request) -> bytes obligatorio; synthesize_stream (Paso 14) con
+implementación por defecto de un solo fragmento; warm_up (Paso 15) y prefetch (Paso 16)
+opcionales, sin efecto por defecto. Sin synthesize_ssml ni
 get_available_voices/get_voice_styles en el contrato inicial.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 
@@ -32,7 +35,8 @@ class TTSPort(ABC):
     """
     Port para proveedores de Text-to-Speech.
 
-    En Fase 1: synthesize devuelve audio completo en bytes.
+    synthesize devuelve audio completo en bytes; synthesize_stream lo entrega por
+    fragmentos (los adapters con salida incremental lo sobrescriben).
     """
 
     @abstractmethod
@@ -47,3 +51,39 @@ class TTSPort(ABC):
             Audio en bytes (formato según el adapter/proveedor).
         """
         ...
+
+    async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
+        """
+        Sintetiza texto a audio entregando fragmentos a medida que están disponibles.
+
+        Por defecto produce un único fragmento con el resultado de synthesize.
+
+        Args:
+            request: Texto, voz, idioma y parámetros de expresión.
+
+        Yields:
+            Fragmentos de audio en bytes (mismo formato que synthesize).
+        """
+        audio = await self.synthesize(request)
+        if audio:
+            yield audio
+
+    async def warm_up(self, voice_id: str) -> None:  # noqa: B027 - hook opcional
+        """
+        Prepara la voz antes del primer turno (p. ej. pre-abrir la conexión).
+
+        Por defecto no hace nada.
+
+        Args:
+            voice_id: Voz que usará la llamada.
+        """
+
+    async def prefetch(self, requests: list[TTSRequest]) -> None:  # noqa: B027 - hook opcional
+        """
+        Sintetiza por adelantado frases previsibles (saludo, disculpa) para tenerlas en caché.
+
+        Por defecto no hace nada (sin caché no hay dónde guardarlas).
+
+        Args:
+            requests: Frases a preparar.
+        """
@@ -0,0 +1,53 @@
+"""
+Port: VADPort.
+
+Interface para detección de actividad de voz (VAD) sobre PCM 16-bit mono.
+El acumulador de turnos (application) la usa para decidir el fin de enunciado.
+
+Referencia legacy: app/core/vad/model.py (SileroOnnxModel), app/processors/logic/vad.py.
+Decisión: Ventana fija por sample rate y probabilidad de voz [0, 1] async (la
+implementación puede agrupar ventanas de varias llamadas en una inferencia);
+la implementación Silero vive en app/ (reutiliza SileroOnnxModel) y se inyecta.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class VADPort(ABC):
+    """
+    Port para detectores de actividad de voz.
+
+    Implementaciones: SileroVADAdapter (app/adapters/outbound/vad).
+    """
+
+    @abstractmethod
+    def window_samples(self, sample_rate: int) -> int:
+        """
+        Número de muestras por ventana de inferencia.
+
+        Args:
+            sample_rate: 8000 (telephony) o 16000 (browser).
+
+        Returns:
+            Muestras que debe tener cada ventana pasada a speech_probability.
+        """
+        ...
+
+    @abstractmethod
+    async def speech_probability(self, pcm_window: bytes, sample_rate: int) -> float:
+        """
+        Probabilidad de voz de una ventana.
+
+        Args:
+            pcm_window: PCM 16-bit mono con exactamente window_samples muestras.
+            sample_rate: Sample rate del audio.
+
+        Returns:
+            Probabilidad en [0, 1].
+        """
+        ...
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Reinicia el estado recurrente (entre turnos)."""
+        ...
@@ -0,0 +1,163 @@
+"""
+Micro-benchmark for app.core.audio_utils (G.711 codec + mixing).
+
+Measures the per-20 ms-frame cost of the operations on the telephony hot path
+(decode, mix with background, encode) for:
+  - the previous per-sample struct loop implementation (baseline)
+  - the vectorized NumPy implementation (bytes API and *_into API)
+  - the fused G.711 path (mix_g711 / mix_g711_into / gain_g711)
+  - audioop, when the interpreter still ships it (< 3.13)
+
+Usage:
+    python scripts/bench_audio_utils.py [--frames 2000]
+"""
+import argparse
+import struct
+import sys
+import timeit
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+# Add the repo root to path (independent of the working directory)
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core import audio_utils
+
+FRAME_SAMPLES = 160  # 20 ms @ 8 kHz
+
+# Python list tables, as the previous module built them at import time
+_ULAW_TO_PCM_LIST = audio_utils._ULAW_TO_PCM.tolist()
+_PCM_TO_ULAW_LIST = audio_utils._PCM_TO_ULAW.tolist()
+
+
+def _struct_ulaw2lin(fragment: bytes) -> bytes:
+    return b"".join(struct.pack("<h", _ULAW_TO_PCM_LIST[b]) for b in fragment)
+
+
+def _struct_lin2ulaw(fragment: bytes) -> bytes:
+    result = bytearray()
+    for i in range(0, len(fragment), 2):
+        sample = struct.unpack_from("<h", fragment, i)[0]
+        result.append(_PCM_TO_ULAW_LIST[sample & 0xFFFF])
+    return bytes(result)
+
+
+def _struct_mix(tts: bytes, bg: bytes) -> bytes:
+    result = bytearray()
+    for i in range(0, min(len(tts), len(bg)), 2):
+        val = struct.unpack_from("<h", tts, i)[0] + int(struct.unpack_from("<h", bg, i)[0] * 0.15)
+        result.extend(struct.pack("<h", -32768 if val < -32768 else 32767 if val > 32767 else val))
+    return bytes(result)
+
+
+def _bench(label: str, fn, frames: int, baseline_us: float | None = None) -> float:
+    per_frame_us = timeit.timeit(fn, number=frames) / frames * 1e6
+    speedup = f"  x{baseline_us / per_frame_us:,.1f}" if baseline_us else ""
+    print(f"  {label:<34} {per_frame_us:9.2f} us/frame{speedup}")
+    return per_frame_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=2000, help="frames per measurement")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    tts_ulaw = rng.integers(0, 256, FRAME_SAMPLES, dtype=np.uint8).tobytes()
+    bg_ulaw = rng.integers(0, 256, FRAME_SAMPLES, dtype=np.uint8).tobytes()
+    tts_pcm = audio_utils.ulaw2lin(tts_ulaw, 2)
+    bg_pcm = audio_utils.ulaw2lin(bg_ulaw, 2)
+
+    pcm_out = bytearray(2 * FRAME_SAMPLES)
+    bg_out = bytearray(2 * FRAME_SAMPLES)
+    code_out = bytearray(FRAME_SAMPLES)
+
+    def decode_mix_encode_numpy() -> bytes:
+        tts = audio_utils.ulaw2lin(tts_ulaw, 2)
+        bg = audio_utils.mul(audio_utils.ulaw2lin(bg_ulaw, 2), 2, 0.15)
+        return audio_utils.lin2ulaw(audio_utils.add(tts, bg, 2), 2)
+
+    def decode_mix_encode_into() -> bytearray:
+        audio_utils.ulaw2lin_into(tts_ulaw, pcm_out)
+        audio_utils.ulaw2lin_into(bg_ulaw, bg_out)
+        mixed = audio_utils.add(pcm_out, audio_utils.mul(bg_out, 2, 0.15), 2)
+        audio_utils.lin2ulaw_into(mixed, code_out)
+        return code_out
+
+    def decode_mix_encode_fused_into() -> int:
+        return audio_utils.mix_g711_into(tts_ulaw, bg_ulaw, code_out, codec="ulaw", background_gain=0.15)
+
+    def decode_mix_encode_struct() -> bytes:
+        return _struct_lin2ulaw(_struct_mix(_struct_ulaw2lin(tts_ulaw), _struct_ulaw2lin(bg_ulaw)))
+
+    frames = args.frames
+    print(f"G.711 micro-benchmark: {FRAME_SAMPLES} samples/frame, {frames} frames per run\n")
+
+    print("ulaw2lin")
+    base = _bench("struct loop (previous)", lambda: _struct_ulaw2lin(tts_ulaw), frames)
+    _bench("numpy", lambda: audio_utils.ulaw2lin(tts_ulaw, 2), frames, base)
+    _bench("numpy *_into (preallocated)", lambda: audio_utils.ulaw2lin_into(tts_ulaw, pcm_out), frames, base)
+
+    print("lin2ulaw")
+    base = _bench("struct loop (previous)", lambda: _struct_lin2ulaw(tts_pcm), frames)
+    _bench("numpy", lambda: audio_utils.lin2ulaw(tts_pcm, 2), frames, base)
+    _bench("numpy *_into (preallocated)", lambda: audio_utils.lin2ulaw_into(tts_pcm, code_out), frames, base)
+
+    print("mix (add + mul 0.15)")
+    base = _bench("struct loop (previous)", lambda: _struct_mix(tts_pcm, bg_pcm), frames)
+    _bench(
+        "numpy",
+        lambda: audio_utils.add(tts_pcm, audio_utils.mul(bg_pcm, 2, 0.15), 2),
+        frames,
+        base,
+    )
+
+    print("decode -> mix -> encode (one outbound frame)")
+    base = _bench("struct loop (previous)", decode_mix_encode_struct, frames)
+    _bench("numpy", decode_mix_encode_numpy, frames, base)
+    _bench("numpy *_into (preallocated)", decode_mix_encode_into, frames, base)
+    _bench(
+        "fused mix_g711",
+        lambda: audio_utils.mix_g711(tts_ulaw, bg_ulaw, codec="ulaw", background_gain=0.15),
+        frames,
+        base,
+    )
+    _bench("fused mix_g711_into (preallocated)", decode_mix_encode_fused_into, frames, base)
+
+    print("background only (decode -> gain -> encode)")
+    base = _bench("struct loop (previous)", lambda: _struct_lin2ulaw(_struct_mix(bytes(len(bg_pcm)), bg_pcm)), frames)
+    _bench(
+        "numpy",
+        lambda: audio_utils.lin2ulaw(audio_utils.mul(audio_utils.ulaw2lin(bg_ulaw, 2), 2, 0.15), 2),
+        frames,
+        base,
+    )
+    _bench("fused gain_g711 (bytes.translate)", lambda: audio_utils.gain_g711(bg_ulaw, 0.15), frames, base)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            import audioop
+        except ImportError:
+            audioop = None
+    if audioop is not None:
+        print("audioop (reference, C)")
+        _bench(
+            "audioop decode -> mix -> encode",
+            lambda: audioop.lin2ulaw(
+                audioop.add(
+                    audioop.ulaw2lin(tts_ulaw, 2),
+                    audioop.mul(audioop.ulaw2lin(bg_ulaw, 2), 2, 0.15),
+                    2,
+                ),
+                2,
+            ),
+            frames,
+            base,
+        )
+
+
+if __name__ == "__main__":
+    main()
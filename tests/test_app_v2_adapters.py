@@ -1,13 +1,22 @@
 """
 Tests de los adaptadores V2.
 
-ConfigAdapter con loader inyectado. Resto de adapters requieren credenciales (no mockeados aquí).
+ConfigAdapter con loader inyectado; SynthesizerPool con factory falsa; caché de frases TTS
+sobre un TTSPort falso; STT en streaming sobre una transcripción falsa. Resto de adapters
+requieren credenciales (no mockeados aquí).
 """
 
+import asyncio
+import threading
+from types import SimpleNamespace
+
 import pytest
 
-from app_v2.domain import CallConfig, ConfigPortError
-from app_v2.adapters import ConfigAdapter
+from app_v2.domain import CallConfig, ConfigPortError, STTConfig, TTSPort, TTSRequest
+from app_v2.adapters import CachedTTSAdapter, ConfigAdapter
+from app_v2.adapters.outbounds.stt_groq_streaming_adapter import WhisperChunkStream, merge_overlap
+from app_v2.adapters.outbounds.azure_synthesizer_pool import SynthesizerKey, SynthesizerPool
+from app_v2.adapters.outbounds.tts_cache import DiskAudioCache, PhraseCache, phrase_key
 
 
 async def _loader(client_type: str, agent_id: int) -> CallConfig:
@@ -39,3 +48,273 @@ async def test_config_adapter_raises_on_loader_failure():
     with pytest.raises(ConfigPortError) as exc_info:
         await adapter.get_config_for_call("browser", 1)
     assert "Failed to load config" in str(exc_info.value)
+
+
+class FakeSynthesizer:
+    """Sustituto de PooledSynthesizer: registra preconnect/close."""
+
+    def __init__(self, key: SynthesizerKey) -> None:
+        self.key = key
+        self.sink = SimpleNamespace(target=None)
+        self.last_used = 0.0
+        self.connected = False
+        self.closed = False
+
+    def preconnect(self) -> None:
+        self.connected = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _key(voice: str = "es-MX-DaliaNeural", output_format: str = "mulaw_8k") -> SynthesizerKey:
+    return SynthesizerKey(voice=voice, output_format=output_format, region="eastus", api_key="k")
+
+
+async def _closed(entry: FakeSynthesizer) -> bool:
+    """Los descartados se cierran en un executor: espera (acotada) a que ocurra."""
+    for _ in range(100):
+        if entry.closed:
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_pool_reuses_released_and_never_shares_in_use():
+    pool = SynthesizerPool(factory=FakeSynthesizer)
+    first = await pool.acquire(_key())
+    second = await pool.acquire(_key())
+    assert first is not second
+    pool.release(first)
+    assert await pool.acquire(_key()) is first
+    # Otra voz u otro formato no reutilizan el synthesizer
+    pool.release(first)
+    assert await pool.acquire(_key(output_format="pcm_16k")) is not first
+    assert await pool.acquire(_key(voice="es-MX-JorgeNeural")) is not first
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_pool_bounds_idle_and_expires():
+    pool = SynthesizerPool(max_idle_per_key=1, max_idle_total=2, idle_ttl_s=60, factory=FakeSynthesizer)
+    a1, a2 = await pool.acquire(_key("a")), await pool.acquire(_key("a"))
+    pool.release(a1)
+    pool.release(a2)
+    assert pool.idle_count(_key("a")) == 1 and await _closed(a2)
+
+    b, c = await pool.acquire(_key("b")), await pool.acquire(_key("c"))
+    pool.release(b)
+    pool.release(c)
+    # Límite total: se descarta el ocioso menos usado (a1)
+    assert pool.idle_count() == 2 and await _closed(a1)
+
+    b.last_used -= 120
+    await pool.acquire(_key("c"))
+    assert await _closed(b) and pool.idle_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_pool_builds_on_a_miss_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    built_on = []
+
+    def factory(key: SynthesizerKey) -> FakeSynthesizer:
+        built_on.append(threading.get_ident())
+        return FakeSynthesizer(key)
+
+    pool = SynthesizerPool(factory=factory)
+    await pool.acquire(_key())
+    assert built_on and built_on[0] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_pool_warm_preconnects():
+    pool = SynthesizerPool(factory=FakeSynthesizer)
+    pool.warm(_key(), count=2)
+    assert pool.idle_count(_key()) == 2
+    warmed = await pool.acquire(_key())
+    assert warmed.connected
+    pool.warm(_key(), count=1)
+    assert pool.idle_count(_key()) == 1
+
+
+class CountingTTSPort(TTSPort):
+    """TTS falso por fragmentos que cuenta las síntesis."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    async def synthesize(self, request: TTSRequest) -> bytes:
+        return b"".join([chunk async for chunk in self.synthesize_stream(request)])
+
+    async def synthesize_stream(self, request: TTSRequest):
+        self.calls += 1
+        for word in request.text.split():
+            await asyncio.sleep(self.delay)
+            yield word.encode("utf-8")
+
+
+def test_phrase_key_normalizes_whitespace_and_separates_voice_and_format():
+    base = phrase_key("Hola,  buenos días ", "es-MX-DaliaNeural", "pcm_16k")
+    assert base == phrase_key("Hola, buenos días", "es-MX-DaliaNeural", "pcm_16k")
+    assert base != phrase_key("Hola, buenos días", "es-MX-JorgeNeural", "pcm_16k")
+    assert base != phrase_key("Hola, buenos días", "es-MX-DaliaNeural", "mulaw_8k")
+    assert base != phrase_key("Hola, buenos días", "es-MX-DaliaNeural", "pcm_16k", speed=1.2)
+
+
+@pytest.mark.asyncio
+async def test_phrase_cache_lru_is_bounded_by_bytes():
+    cache = PhraseCache(max_bytes=10)
+    await cache.put("a", b"12345")
+    await cache.put("b", b"12345")
+    assert await cache.get("a") == b"12345"
+    await cache.put("c", b"12345")
+    # "b" era el menos usado
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None and await cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_cached_tts_adapter_serves_repeated_phrase_without_provider():
+    inner = CountingTTSPort()
+    tts = CachedTTSAdapter(inner, PhraseCache(), output_format="pcm_16k")
+    request = TTSRequest(text="Hola, le atiendo", voice_id="es-MX-DaliaNeural")
+
+    first = [chunk async for chunk in tts.synthesize_stream(request)]
+    second = [chunk async for chunk in tts.synthesize_stream(request)]
+
+    assert first == [b"Hola,", b"le", b"atiendo"]
+    assert second == [b"Hola,leatiendo"]
+    assert await tts.synthesize(request) == b"Hola,leatiendo"
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_tts_adapter_coalesces_concurrent_identical_phrases():
+    inner = CountingTTSPort(delay=0.01)
+    cache = PhraseCache()
+    tts = CachedTTSAdapter(inner, cache, output_format="pcm_16k")
+    request = TTSRequest(text="Hola, le atiendo", voice_id="es-MX-DaliaNeural")
+
+    async def speak():
+        return b"".join([chunk async for chunk in tts.synthesize_stream(request)])
+
+    # Prefetch del saludo y dos llamadas hablándolo a la vez: una sola síntesis
+    results = await asyncio.gather(tts.prefetch([request]), speak(), speak())
+
+    assert results[1:] == [b"Hola,leatiendo", b"Hola,leatiendo"]
+    assert inner.calls == 1
+    assert cache.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_tts_adapter_waiter_synthesizes_if_the_first_is_cut():
+    inner = CountingTTSPort(delay=0.01)
+    tts = CachedTTSAdapter(inner, PhraseCache(), output_format="pcm_16k")
+    request = TTSRequest(text="Hola, le atiendo", voice_id="es-MX-DaliaNeural")
+
+    first = tts.synthesize_stream(request)
+    await first.__anext__()
+    waiter = asyncio.create_task(tts.synthesize(request))
+    await asyncio.sleep(0.02)
+    await first.aclose()  # barge-in: la síntesis en curso no se completa
+
+    assert await waiter == b"Hola,leatiendo"
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_tts_adapter_skips_interrupted_and_long_phrases():
+    inner = CountingTTSPort()
+    cache = PhraseCache(max_phrase_chars=30)
+    tts = CachedTTSAdapter(inner, cache, output_format="pcm_16k")
+    request = TTSRequest(text="Hola, le atiendo", voice_id="es-MX-DaliaNeural")
+
+    stream = tts.synthesize_stream(request)
+    await stream.__anext__()
+    await stream.aclose()
+    long_request = TTSRequest(text="palabra " * 10, voice_id="es-MX-DaliaNeural")
+    await tts.synthesize(long_request)
+    await tts.synthesize(long_request)
+
+    assert cache.hits == 0
+    assert inner.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_tts_adapter_prefetch_and_disk_tier(tmp_path):
+    inner = CountingTTSPort()
+    request = TTSRequest(text="Buenos días, habla Andrea", voice_id="es-MX-DaliaNeural")
+    tts = CachedTTSAdapter(inner, PhraseCache(tier=DiskAudioCache(tmp_path)), output_format="mulaw_8k")
+    await tts.prefetch([request])
+    await tts.prefetch([request])
+    assert inner.calls == 1
+
+    # Otro proceso (LRU vacío) recupera la frase del disco
+    fresh = CachedTTSAdapter(inner, PhraseCache(tier=DiskAudioCache(tmp_path)), output_format="mulaw_8k")
+    assert await fresh.synthesize(request) == "Buenosdías,hablaAndrea".encode()
+    assert inner.calls == 1
+
+
+def test_merge_overlap_drops_repeated_and_cut_words():
+    assert merge_overlap("quiero agendar una", "una cita para mañana") == "quiero agendar una cita para mañana"
+    assert merge_overlap("hola, buenos", "Buenos días.") == "hola, buenos días."
+    assert merge_overlap("necesito ca", "cambiar mi plan") == "necesito cambiar mi plan"
+    assert merge_overlap("", "hola") == "hola"
+
+
+class FakeWhisper:
+    """Transcripción falsa: el audio son bytes de palabras separadas por espacios."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[bytes] = []
+        self.fail = fail
+
+    async def __call__(self, audio: bytes, config: STTConfig) -> str:
+        first = not self.calls
+        self.calls.append(audio)
+        await asyncio.sleep(0)
+        if self.fail and first:
+            raise RuntimeError("STT failed: 500")
+        return audio.decode().strip()
+
+
+def _words_stream(whisper, hypotheses):
+    async def on_hypothesis(h):
+        hypotheses.append(h)
+
+    # 1 byte/ms: fragmentos de 12 bytes con 4 de solape
+    config = STTConfig(sample_rate=500)
+    return WhisperChunkStream(whisper, config, on_hypothesis, chunk_ms=12, overlap_ms=4)
+
+
+@pytest.mark.asyncio
+async def test_streaming_stt_transcribes_overlapping_chunks_and_only_the_tail_at_finish():
+    whisper, hypotheses = FakeWhisper(), []
+    stream = _words_stream(whisper, hypotheses)
+
+    for word in "uno dos tre cua cin sei ":
+        await stream.push_audio(word.encode())
+    await asyncio.sleep(0.01)
+    await stream.push_audio(b"")
+    partials = [h.text for h in hypotheses]
+    text = await stream.finish()
+
+    assert whisper.calls[:2] == [b"uno dos tre ", b"tre cua cin "]
+    assert whisper.calls[-1] == b"cin sei "  # cola: solape + audio nuevo
+    assert partials and partials[-1] == "uno dos tre cua cin"
+    assert text == "uno dos tre cua cin sei"
+    assert hypotheses[-1].is_final and hypotheses[-1].text == text
+
+
+@pytest.mark.asyncio
+async def test_streaming_stt_falls_back_to_full_utterance_when_a_chunk_fails():
+    whisper, hypotheses = FakeWhisper(fail=True), []
+    stream = _words_stream(whisper, hypotheses)
+
+    await stream.push_audio(b"uno dos tre cua cin")
+    text = await stream.finish()
+
+    assert whisper.calls[-1] == b"uno dos tre cua cin"
+    assert text == "uno dos tre cua cin"
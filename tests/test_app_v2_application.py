@@ -5,9 +5,18 @@ Verifican el flujo Orchestrator → Pipeline → Processors con mocks.
 Sin dependencias de app/ ni de proveedores reales.
 """
 
+import asyncio
+import math
+
+import numpy as np
 import pytest
 
 from app_v2.application import Orchestrator
+from app_v2.application.conversation_history import ConversationHistory, estimate_tokens
+from app_v2.application.frames import TextFrame
+from app_v2.application.processors import LLMProcessor
+from app_v2.application.processors.llm_processor import pop_clause
+from app_v2.application.turn_accumulator import TurnAccumulator
 from app_v2.application.verification_mocks import (
     MockAudioTransport,
     MockConfigPort,
@@ -15,6 +24,147 @@ from app_v2.application.verification_mocks import (
     MockSTTPort,
     MockTTSPort,
 )
+from app_v2.domain import (
+    CallConfig,
+    LLMChunk,
+    LLMMessage,
+    LLMPort,
+    StreamingSTTPort,
+    STTHypothesis,
+    STTStream,
+)
+
+PACKET_MS = 20
+
+
+def _tone(ms: int, sample_rate: int = 16000) -> bytes:
+    """PCM 16-bit con un tono de 200 Hz (supera el umbral de energía)."""
+    n = sample_rate * ms // 1000
+    t = np.arange(n) / sample_rate
+    return (np.sin(2 * math.pi * 200 * t) * 8000).astype(np.int16).tobytes()
+
+
+def _silence(ms: int, sample_rate: int = 16000) -> bytes:
+    return b"\x00\x00" * (sample_rate * ms // 1000)
+
+
+def _packets(audio: bytes, sample_rate: int = 16000) -> list[bytes]:
+    size = sample_rate * PACKET_MS // 1000 * 2
+    return [audio[i : i + size] for i in range(0, len(audio), size)]
+
+
+class CountingSTTPort(MockSTTPort):
+    """STT fijo que registra el audio recibido en cada llamada."""
+
+    def __init__(self, fixed_text: str = "hola") -> None:
+        super().__init__(fixed_text)
+        self.calls: list[bytes] = []
+
+    async def transcribe_audio(self, audio_bytes, config):
+        self.calls.append(audio_bytes)
+        return await super().transcribe_audio(audio_bytes, config)
+
+
+class RecordingSTTStream(STTStream):
+    """STTStream falso: emite un parcial por fragmento y una transcripción final fija."""
+
+    def __init__(self, on_hypothesis) -> None:
+        self.audio = bytearray()
+        self.on_hypothesis = on_hypothesis
+        self.cancelled = False
+
+    async def push_audio(self, audio):
+        self.audio.extend(audio)
+        await self.on_hypothesis(STTHypothesis(text="hola"))
+
+    async def finish(self):
+        return "hola, quiero una cita"
+
+    async def cancel(self):
+        self.cancelled = True
+
+
+class StreamingCountingSTTPort(CountingSTTPort, StreamingSTTPort):
+    """STT en streaming que registra los streams abiertos."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.streams: list[RecordingSTTStream] = []
+
+    def open_stream(self, config, on_hypothesis=None):
+        stream = RecordingSTTStream(on_hypothesis)
+        self.streams.append(stream)
+        return stream
+
+
+class JsonRecordingTransport(MockAudioTransport):
+    """Transport que registra los mensajes JSON (transcripción en vivo)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent_json: list[dict] = []
+
+    async def send_json(self, data: dict) -> None:
+        self.sent_json.append(data)
+
+
+class TokenLLMPort(LLMPort):
+    """LLM que emite la respuesta token a token y registra el audio ya enviado."""
+
+    def __init__(self, tokens: list[str], transport: MockAudioTransport | None = None) -> None:
+        self.tokens = tokens
+        self.transport = transport
+        self.sent_before_finish: int | None = None
+
+    async def generate_stream(self, request):
+        for token in self.tokens:
+            yield LLMChunk(text=token)
+        if self.transport is not None:
+            self.sent_before_finish = len(self.transport.sent_audio)
+        yield LLMChunk(text="", finish_reason="stop")
+
+
+class EchoTTSPort(MockTTSPort):
+    """TTS que devuelve el texto recibido como bytes (para aserciones por frase)."""
+
+    async def synthesize(self, request):
+        return request.text.encode("utf-8")
+
+
+class ChunkedTTSPort(MockTTSPort):
+    """TTS incremental: entrega cada palabra del texto como un fragmento."""
+
+    async def synthesize_stream(self, request):
+        for word in request.text.split():
+            yield word.encode("utf-8")
+
+
+class PrefetchRecordingTTSPort(MockTTSPort):
+    """TTS que registra las frases pedidas en prefetch."""
+
+    def __init__(self) -> None:
+        self.prefetched: list[str] = []
+
+    async def prefetch(self, requests):
+        self.prefetched.extend(r.text for r in requests)
+
+
+class GreetingConfigPort(MockConfigPort):
+    """Config con saludo configurado."""
+
+    async def get_config_for_call(self, client_type: str = "browser", agent_id: int = 1) -> CallConfig:
+        cfg = await super().get_config_for_call(client_type, agent_id)
+        cfg.first_message = "Hola, soy Andrea. ¿En qué le ayudo?"
+        return cfg
+
+
+class ShortSilenceConfigPort(MockConfigPort):
+    """Config con silence_timeout_ms corto para tests de inactividad."""
+
+    async def get_config_for_call(self, client_type="browser", agent_id=1):
+        config = await super().get_config_for_call(client_type, agent_id)
+        config.silence_timeout_ms = 100
+        return config
 
 
 @pytest.fixture
@@ -44,7 +194,8 @@ async def test_orchestrator_process_audio_sends_audio(mock_ports):
         client_type="browser",
     )
     await orch.start()
-    await orch.process_audio(b"\x00\x00\x00\x00")
+    for packet in _packets(_tone(300) + _silence(1100)):
+        await orch.process_audio(packet)
     await orch.stop()
     assert len(mock_ports["transport"].sent_audio) == 1
     assert mock_ports["transport"].sent_audio[0] == b"\x00\x00\x00\x00\x00\x00"
@@ -65,3 +216,309 @@ async def test_orchestrator_start_loads_config(mock_ports):
     assert orch._config is not None
     assert orch._config.client_type == "browser"
     assert orch._config.system_prompt == "Eres un asistente."
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_runs_pipeline_once_per_utterance(mock_ports):
+    stt = CountingSTTPort()
+    orch = Orchestrator(
+        transport=mock_ports["transport"],
+        stt_port=stt,
+        llm_port=mock_ports["llm"],
+        tts_port=mock_ports["tts"],
+        config_port=mock_ports["config"],
+        client_type="browser",
+    )
+    await orch.start()
+    speech = _tone(500)
+    for packet in _packets(_silence(200) + speech + _silence(1100)):
+        await orch.process_audio(packet)
+    await orch.stop()
+    assert len(stt.calls) == 1
+    # Incluye la voz completa y descarta el silencio final
+    assert speech in stt.calls[0]
+    assert not stt.calls[0].endswith(_silence(100))
+    assert len(mock_ports["transport"].sent_audio) == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_ignores_silence_only_audio(mock_ports):
+    stt = CountingSTTPort()
+    orch = Orchestrator(
+        transport=mock_ports["transport"],
+        stt_port=stt,
+        llm_port=mock_ports["llm"],
+        tts_port=mock_ports["tts"],
+        config_port=mock_ports["config"],
+        client_type="browser",
+    )
+    await orch.start()
+    for packet in _packets(_silence(2000)):
+        await orch.process_audio(packet)
+    await orch.stop()
+    assert stt.calls == []
+    assert mock_ports["transport"].sent_audio == []
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_closes_turn_when_client_stops_sending(mock_ports):
+    stt = CountingSTTPort()
+    orch = Orchestrator(
+        transport=mock_ports["transport"],
+        stt_port=stt,
+        llm_port=mock_ports["llm"],
+        tts_port=mock_ports["tts"],
+        config_port=ShortSilenceConfigPort(),
+        client_type="browser",
+    )
+    await orch.start()
+    # El simulador no envía silencio: la voz se corta sin ventanas silenciosas
+    for packet in _packets(_tone(300)):
+        await orch.process_audio(packet)
+    assert stt.calls == []
+    await asyncio.sleep(0.3)
+    await orch.stop()
+    assert len(stt.calls) == 1
+    assert len(mock_ports["transport"].sent_audio) == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_utterance_to_streaming_stt(mock_ports):
+    stt = StreamingCountingSTTPort()
+    transport = JsonRecordingTransport()
+    orch = Orchestrator(
+        transport=transport,
+        stt_port=stt,
+        llm_port=mock_ports["llm"],
+        tts_port=mock_ports["tts"],
+        config_port=mock_ports["config"],
+        client_type="browser",
+    )
+    await orch.start()
+    speech = _tone(500)
+    for packet in _packets(_silence(200) + speech + _silence(1100)):
+        await orch.process_audio(packet)
+    await orch.stop()
+
+    # El audio fue al STTStream mientras el usuario hablaba; sin transcripción one-shot
+    assert stt.calls == []
+    assert len(stt.streams) == 1 and speech in stt.streams[0].audio
+    partials = [m for m in transport.sent_json if m.get("partial")]
+    assert partials and partials[0] == {"type": "transcript", "role": "user", "text": "hola", "partial": True}
+    assert {"type": "transcript", "role": "user", "text": "hola, quiero una cita"} in transport.sent_json
+    assert [m.content for m in orch._conversation_history if m.role == "user"] == ["hola, quiero una cita"]
+    assert len(transport.sent_audio) == 1
+
+
+@pytest.mark.asyncio
+async def test_turn_accumulator_keeps_preroll_and_trims_trailing_silence():
+    config = CallConfig(client_type="twilio", sample_rate=8000, silence_timeout_ms=200)
+    turns = TurnAccumulator(config)
+    lead = _silence(100, 8000)
+    speech = _tone(200, 8000)
+    utterances = [u for p in _packets(lead + speech + _silence(400, 8000), 8000) for u in await turns.feed(p)]
+    assert len(utterances) == 1
+    assert utterances[0].endswith(speech)
+    assert len(utterances[0]) > len(speech)
+    assert not turns.in_speech
+
+
+@pytest.mark.asyncio
+async def test_turn_accumulator_returns_every_utterance_closed_by_one_feed():
+    config = CallConfig(client_type="twilio", sample_rate=8000, silence_timeout_ms=200)
+    turns = TurnAccumulator(config)
+    first, second = _tone(200, 8000), _tone(300, 8000)
+    utterances = await turns.feed(first + _silence(300, 8000) + second + _silence(300, 8000))
+    assert len(utterances) == 2
+    assert utterances[0].endswith(first)
+    assert utterances[1].endswith(second)
+    assert await turns.feed(_silence(100, 8000)) == []
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_runs_one_turn_per_utterance_in_a_single_packet(mock_ports):
+    stt = CountingSTTPort()
+    orch = Orchestrator(
+        transport=mock_ports["transport"],
+        stt_port=stt,
+        llm_port=mock_ports["llm"],
+        tts_port=mock_ports["tts"],
+        config_port=mock_ports["config"],
+        client_type="browser",
+    )
+    await orch.start()
+    first, second = _tone(300), _tone(400)
+    await orch.process_audio(first + _silence(1100) + second + _silence(1100))
+    await orch.stop()
+    assert len(stt.calls) == 2
+    assert first in stt.calls[0] and second in stt.calls[1]
+    assert len(mock_ports["transport"].sent_audio) == 2
+
+
+def test_pop_clause_splits_on_sentence_and_long_clause():
+    assert pop_clause("Hola") is None
+    assert pop_clause("Claro que sí. Déj") == ("Claro que sí.", "Déj")
+    # Frase demasiado corta: espera al siguiente corte
+    assert pop_clause("Sí. Claro") is None
+    long_clause = "Entonces revisé su cuenta con mucho cuidado, y "
+    assert pop_clause(long_clause) == (
+        "Entonces revisé su cuenta con mucho cuidado,",
+        "y ",
+    )
+
+
+@pytest.mark.asyncio
+async def test_llm_processor_streams_clauses_and_updates_history():
+    history = []
+    llm = TokenLLMPort(["Buenos días", ". ¿En qué", " puedo ayudarle", "? Estoy aquí"])
+    processor = LLMProcessor(llm, CallConfig(client_type="browser"), history)
+    frames = [f async for f in processor.process_stream(TextFrame(text="hola", role="user"))]
+    assert [f.text for f in frames] == [
+        "Buenos días.",
+        "¿En qué puedo ayudarle?",
+        "Estoy aquí",
+    ]
+    assert all(f.role == "assistant" for f in frames)
+    assert [m.role for m in history] == ["user", "assistant"]
+    assert history[-1].content == "Buenos días. ¿En qué puedo ayudarle? Estoy aquí"
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_audio_per_clause(mock_ports):
+    transport = mock_ports["transport"]
+    llm = TokenLLMPort(["Buenos días", ". ¿En qué puedo", " ayudarle", "? Dígame"], transport)
+    orch = Orchestrator(
+        transport=transport,
+        stt_port=mock_ports["stt"],
+        llm_port=llm,
+        tts_port=EchoTTSPort(),
+        config_port=mock_ports["config"],
+        client_type="browser",
+    )
+    await orch.start()
+    for packet in _packets(_tone(300) + _silence(1100)):
+        await orch.process_audio(packet)
+    await orch.stop()
+    assert transport.sent_audio == [
+        "Buenos días.".encode(),
+        "¿En qué puedo ayudarle?".encode(),
+        "Dígame".encode(),
+    ]
+    # Las dos primeras frases se enviaron antes de que el LLM terminara
+    assert llm.sent_before_finish == 2
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_sends_tts_chunks_as_they_arrive(mock_ports):
+    transport = mock_ports["transport"]
+    orch = Orchestrator(
+        transport=transport,
+        stt_port=mock_ports["stt"],
+        llm_port=TokenLLMPort(["Hola, le atiendo enseguida."], transport),
+        tts_port=ChunkedTTSPort(),
+        config_port=mock_ports["config"],
+        client_type="browser",
+    )
+    await orch.start()
+    for packet in _packets(_tone(300) + _silence(1100)):
+        await orch.process_audio(packet)
+    await orch.stop()
+    assert transport.sent_audio == [b"Hola,", b"le", b"atiendo", b"enseguida."]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_start_prefetches_greeting_and_apology(mock_ports):
+    tts = PrefetchRecordingTTSPort()
+    orch = Orchestrator(
+        transport=mock_ports["transport"],
+        stt_port=mock_ports["stt"],
+        llm_port=mock_ports["llm"],
+        tts_port=tts,
+        config_port=GreetingConfigPort(),
+        client_type="browser",
+    )
+    await orch.start()
+    await asyncio.sleep(0)
+    await orch.stop()
+    assert tts.prefetched == [
+        "Hola, soy Andrea. ¿En qué le ayudo?",
+        CallConfig.apology_message,
+    ]
+
+
+def _turn(i: int) -> list[LLMMessage]:
+    return [
+        LLMMessage(role="user", content=f"Pregunta {i} sobre el plan de pagos " * 4),
+        LLMMessage(role="assistant", content=f"Respuesta {i} con los detalles del plan " * 4),
+    ]
+
+
+def test_history_window_pins_system_prompt_and_respects_token_budget():
+    history = ConversationHistory(system_prompt="Eres Andrea.", token_budget=200)
+    for i in range(30):
+        for message in _turn(i):
+            history.append(message)
+
+    window = history.window()
+    assert window[0] == LLMMessage(role="system", content="Eres Andrea.")
+    assert sum(estimate_tokens(m) for m in window) <= 200
+    assert window[-1].content.startswith("Respuesta 29")
+    # El transcript completo sigue disponible para persistencia
+    assert len(history) == 61 and history[1].content.startswith("Pregunta 0")
+
+    history.append(LLMMessage(role="user", content="x" * 2000))
+    assert history.window()[-1].content == "x" * 2000  # el último mensaje entra siempre
+
+
+@pytest.mark.asyncio
+async def test_history_summarizes_dropped_turns_in_the_background():
+    release = asyncio.Event()
+    calls = []
+
+    async def summarizer(previous, messages):
+        calls.append((previous, [m.content[:11] for m in messages]))
+        await release.wait()
+        return "El cliente pregunta por el plan de pagos."
+
+    history = ConversationHistory(system_prompt="Eres Andrea.", token_budget=150, summarizer=summarizer)
+    for i in range(6):
+        for message in _turn(i):
+            history.append(message)
+
+    first = history.window()  # no espera al resumen
+    assert [m.role for m in first].count("system") == 1
+    await asyncio.sleep(0)
+    assert len(calls) == 1 and calls[0][0] == ""
+    dropped = len(calls[0][1])
+
+    release.set()
+    await asyncio.sleep(0)
+    window = history.window()
+    assert window[1].role == "system"
+    assert window[1].content.endswith("El cliente pregunta por el plan de pagos.")
+    assert sum(estimate_tokens(m) for m in window) <= 150
+    assert dropped == 12 - (len(first) - 1)  # los mensajes que no cupieron en la ventana
+    await history.close()
+
+
+@pytest.mark.asyncio
+async def test_llm_requests_stay_flat_on_long_calls():
+    class RecordingLLMPort(MockLLMPort):
+        def __init__(self):
+            super().__init__("Claro, con gusto le explico los detalles del plan. " * 3)
+            self.prompt_tokens: list[int] = []
+
+        async def generate_stream(self, request):
+            self.prompt_tokens.append(sum(estimate_tokens(m) for m in request.messages))
+            async for chunk in super().generate_stream(request):
+                yield chunk
+
+    llm = RecordingLLMPort()
+    history = ConversationHistory(system_prompt="Eres Andrea.", token_budget=300)
+    processor = LLMProcessor(llm, CallConfig(client_type="browser"), history)
+    for i in range(40):
+        await processor.process(TextFrame(text=f"Pregunta {i} sobre mi plan de pagos", role="user"))
+
+    assert max(llm.prompt_tokens[10:]) <= 300
+    assert llm.prompt_tokens[-1] - llm.prompt_tokens[10] < 50
+    assert len(history) == 81
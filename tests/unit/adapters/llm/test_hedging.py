@@ -0,0 +1,115 @@
+"""
+Hedged requests in LLMWithFallback: a backup starts when the primary has no
+first chunk after the hedge delay; the first stream to emit wins.
+"""
+import asyncio
+
+import pytest
+
+from app.adapters.outbound.llm.llm_with_fallback import HEDGE_MIN_SAMPLES, LLMWithFallback
+from app.domain.ports import LLMException, LLMMessage, LLMPort, LLMRequest
+
+
+class DelayedLLM(LLMPort):
+    """Emits its tokens after first_token_delay; records models and cancellations."""
+
+    def __init__(self, name: str, first_token_delay: float, fail: bool = False):
+        self.name = name
+        self.first_token_delay = first_token_delay
+        self.fail = fail
+        self.models = []
+        self.cancelled = 0
+
+    async def generate_stream(self, request: LLMRequest):
+        self.models.append(request.model)
+        try:
+            await asyncio.sleep(self.first_token_delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise LLMException(f"{self.name} failed", retryable=True, provider=self.name)
+        for token in [f"{self.name}-", "response"]:
+            yield token
+
+    async def get_available_models(self):
+        return []
+
+    async def is_model_safe_for_voice(self, model: str) -> bool:
+        return True
+
+
+def _request() -> LLMRequest:
+    return LLMRequest(messages=[LLMMessage(role="user", content="hola")], model="big-model")
+
+
+async def _collect(wrapper: LLMWithFallback) -> str:
+    return "".join([token async for token in wrapper.generate_stream(_request())])
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_does_not_hedge():
+    primary, backup = DelayedLLM("groq", 0.0), DelayedLLM("backup", 0.0)
+    wrapper = LLMWithFallback(primary, [], hedge_backup=backup, hedge_max_delay_s=0.05)
+
+    assert await _collect(wrapper) == "groq-response"
+    assert backup.models == []
+    assert wrapper.hedge_stats.hedge_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled_when_backup_wins():
+    primary, backup = DelayedLLM("groq", 1.0), DelayedLLM("backup", 0.0)
+    wrapper = LLMWithFallback(
+        primary, [], hedge_backup=backup, hedge_model="small-model", hedge_max_delay_s=0.02
+    )
+
+    assert await _collect(wrapper) == "backup-response"
+    assert backup.models == ["small-model"]
+    assert primary.cancelled == 1
+    assert wrapper.hedge_stats.hedged == 1
+    assert wrapper.hedge_stats.backup_win_rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_primary_still_wins_if_it_emits_before_backup():
+    primary, backup = DelayedLLM("groq", 0.03), DelayedLLM("backup", 1.0)
+    wrapper = LLMWithFallback(primary, [], hedge_backup=backup, hedge_max_delay_s=0.01)
+
+    assert await _collect(wrapper) == "groq-response"
+    assert backup.cancelled == 1
+    assert wrapper.hedge_stats.hedged == 1
+    assert wrapper.hedge_stats.backup_wins == 0
+
+
+@pytest.mark.asyncio
+async def test_backup_covers_a_primary_failing_after_the_hedge():
+    primary, backup = DelayedLLM("groq", 0.03, fail=True), DelayedLLM("backup", 0.05)
+    wrapper = LLMWithFallback(primary, [], hedge_backup=backup, hedge_max_delay_s=0.01)
+
+    assert await _collect(wrapper) == "backup-response"
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_failure_uses_regular_fallbacks():
+    primary = DelayedLLM("groq", 0.0, fail=True)
+    backup, fallback = DelayedLLM("backup", 0.0), DelayedLLM("openai", 0.0)
+    wrapper = LLMWithFallback(primary, [fallback], hedge_backup=backup, hedge_max_delay_s=0.05)
+
+    assert await _collect(wrapper) == "openai-response"
+    assert backup.models == []
+
+
+def test_hedge_delay_tracks_primary_ttft_percentile():
+    wrapper = LLMWithFallback(
+        DelayedLLM("groq", 0.0), [], hedge_backup=DelayedLLM("backup", 0.0),
+        hedge_percentile=90.0, hedge_min_delay_s=0.1, hedge_max_delay_s=2.0,
+    )
+    assert wrapper.hedge_delay() == 2.0  # not enough samples yet
+
+    wrapper._primary_ttfts.extend(0.2 + i * 0.01 for i in range(HEDGE_MIN_SAMPLES * 5))
+    assert wrapper.hedge_delay() == pytest.approx(0.2 + 90 * 0.01)
+
+    wrapper._primary_ttfts.clear()
+    wrapper._primary_ttfts.extend([0.01] * HEDGE_MIN_SAMPLES)
+    assert wrapper.hedge_delay() == 0.1  # clamped to the minimum
@@ -0,0 +1,141 @@
+"""
+Multiple tool calls per completion: GroqLLMAdapter assembles streamed tool_call
+deltas by index; LLMProcessor runs the tools together and sends all results in
+one follow-up request.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.adapters.outbound.llm.groq_llm_adapter import GroqLLMAdapter
+from app.domain.models.llm_models import LLMChunk, LLMFunctionCall
+from app.domain.models.tool_models import ToolResponse
+from app.domain.ports import LLMMessage, LLMRequest
+from app.processors.logic.llm import LLMProcessor
+
+
+def _tool_delta(index, id=None, name=None, arguments=None):
+    function = SimpleNamespace(name=name, arguments=arguments)
+    return SimpleNamespace(index=index, id=id, function=function)
+
+
+def _chunk(tool_calls=None, content=None, finish_reason=None):
+    delta = SimpleNamespace(tool_calls=tool_calls, content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)])
+
+
+class FakeCompletions:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def create(self, **params):
+        async def stream():
+            for chunk in self.chunks:
+                yield chunk
+        return stream()
+
+
+@pytest.mark.asyncio
+async def test_groq_adapter_assembles_interleaved_tool_calls_by_index():
+    adapter = GroqLLMAdapter(SimpleNamespace(api_key="test", model="llama-3.3-70b-versatile"))
+    adapter.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions([
+        _chunk([_tool_delta(0, id="call_a", name="check_availability", arguments='{"day": ')]),
+        _chunk([_tool_delta(1, id="call_b", name="get_customer", arguments="")]),
+        _chunk([_tool_delta(0, arguments='"lunes"}'), _tool_delta(1, arguments='{"phone": "555"}')]),
+        _chunk(finish_reason="tool_calls"),
+    ])))
+    request = LLMRequest(messages=[LLMMessage(role="user", content="hola")], model="llama-3.3-70b-versatile")
+
+    chunks = [chunk async for chunk in adapter.generate_stream(request)]
+
+    assert [c.function_call for c in chunks] == [
+        LLMFunctionCall(name="check_availability", arguments={"day": "lunes"}, call_id="call_a"),
+        LLMFunctionCall(name="get_customer", arguments={"phone": "555"}, call_id="call_b"),
+    ]
+    assert [c.finish_reason for c in chunks] == [None, "tool_calls"]
+
+
+class ScriptedLLM:
+    """First completion requests two tools; the follow-up answers with text."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def generate_stream(self, request):
+        self.requests.append(request)
+        if len(self.requests) == 1:
+            yield LLMChunk(function_call=LLMFunctionCall(name="check_availability", arguments={}))
+            yield LLMChunk(
+                function_call=LLMFunctionCall(name="get_customer", arguments={}),
+                finish_reason="tool_calls",
+            )
+        else:
+            yield LLMChunk(text="Tiene cita el lunes, señor Pérez.")
+
+
+class BatchTools:
+    tool_count = 2
+
+    def __init__(self, cached=()):
+        self.batches = []
+        self.cached = set(cached)
+
+    def get_tool_definitions(self):
+        return []
+
+    def is_cached(self, request):
+        return request.tool_name in self.cached
+
+    async def execute_many(self, requests):
+        self.batches.append([r.tool_name for r in requests])
+        return [
+            ToolResponse(tool_name=r.tool_name, result=f"{r.tool_name}-ok", success=True)
+            for r in requests
+        ]
+
+
+class CountingHold:
+    def __init__(self):
+        self.starts = 0
+
+    async def start(self):
+        self.starts += 1
+
+    async def stop(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_llm_processor_runs_all_tools_and_sends_results_in_one_follow_up():
+    llm, tools, hold = ScriptedLLM(), BatchTools(), CountingHold()
+    history = []
+    processor = LLMProcessor(
+        llm, SimpleNamespace(), history, execute_tool_use_case=tools, hold_audio_player=hold
+    )
+
+    await processor._handle_user_text("¿tengo cita?")
+
+    assert tools.batches == [["check_availability", "get_customer"]]
+    assert hold.starts == 1
+    assert len(llm.requests) == 2
+    follow_up = [m.content for m in llm.requests[1].messages if m.role == "function"]
+    assert follow_up == [
+        "Tool 'check_availability' returned: check_availability-ok",
+        "Tool 'get_customer' returned: get_customer-ok",
+    ]
+    assert history[-2]["content"] == "[TOOL_CALL: check_availability, get_customer]"
+    assert history[-1] == {"role": "assistant", "content": "Tiene cita el lunes, señor Pérez."}
+
+
+@pytest.mark.asyncio
+async def test_cached_tool_results_skip_hold_audio():
+    llm, hold = ScriptedLLM(), CountingHold()
+    tools = BatchTools(cached={"check_availability", "get_customer"})
+    processor = LLMProcessor(
+        llm, SimpleNamespace(), [], execute_tool_use_case=tools, hold_audio_player=hold
+    )
+
+    await processor._handle_user_text("¿tengo cita?")
+
+    assert tools.batches == [["check_availability", "get_customer"]]
+    assert hold.starts == 0
@@ -0,0 +1,167 @@
+"""
+Unit tests for AzureTTSAdapter.synthesize_stream (incremental audio).
+
+Uses a fake SpeechSynthesizer that writes to the pooled synthesizer's output stream
+from the executor thread, so no Azure credentials or network are needed.
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import azure.cognitiveservices.speech as speechsdk
+import pytest
+
+from app.adapters.outbound.tts.azure_tts_adapter import AzureTTSAdapter
+from app.core.audio_config import AudioConfig
+from app.domain.ports import TTSException, TTSRequest
+from app_v2.adapters.outbounds.azure_synthesizer_pool import PooledSynthesizer, SynthesizerPool
+from app_v2.adapters.outbounds.tts_cache import PhraseCache
+
+
+class FakeSynthesizer:
+    """Writes each chunk to the output stream, pausing until the consumer has seen the first one."""
+
+    def __init__(self, sink, chunks, reason, hold_first):
+        self.sink = sink
+        self.chunks = chunks
+        self.reason = reason
+        self.hold_first = hold_first
+        self.first_chunk_consumed = threading.Event()
+        self.stopped = False
+
+    def speak_ssml_async(self, ssml):
+        return SimpleNamespace(get=self._run)
+
+    def stop_speaking_async(self):
+        self.stopped = True
+        self.first_chunk_consumed.set()
+
+    def _run(self):
+        for i, chunk in enumerate(self.chunks):
+            self.sink.write(memoryview(chunk))
+            if i == 0 and self.hold_first:
+                self.first_chunk_consumed.wait(timeout=2)
+            if self.stopped:
+                break
+        time.sleep(0.01)
+        return SimpleNamespace(
+            reason=self.reason,
+            cancellation_details=SimpleNamespace(reason="Error", error_details="fake"),
+        )
+
+
+def _adapter(chunks, reason=speechsdk.ResultReason.SynthesizingAudioCompleted, hold_first=True):
+    fakes = []
+
+    def factory(key):
+        entry = PooledSynthesizer(key)
+        entry.synthesizer = FakeSynthesizer(entry.sink, chunks, reason, hold_first)
+        fakes.append(entry.synthesizer)
+        return entry
+
+    adapter = AzureTTSAdapter(config=SimpleNamespace(api_key="key", region="eastus"), audio_config=AudioConfig.for_browser())
+    adapter._pool = SynthesizerPool(factory=factory)
+    adapter._phrase_cache = None
+    return adapter, fakes
+
+
+@pytest.mark.asyncio
+async def test_first_chunk_arrives_before_synthesis_completes():
+    adapter, fakes = _adapter([b"aa", b"bb", b"cc"])
+    request = TTSRequest(text="Hola", voice_id="es-MX-DaliaNeural")
+
+    chunks = []
+    async for chunk in adapter.synthesize_stream(request):
+        if not chunks:
+            # Synthesis is still blocked in the executor waiting on the consumer
+            assert not fakes[0].first_chunk_consumed.is_set()
+            fakes[0].first_chunk_consumed.set()
+        chunks.append(chunk)
+
+    assert chunks == [b"aa", b"bb", b"cc"]
+    # The synthesizer went back to the pool for the next sentence
+    assert adapter._pool.idle_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_consumer_stops_synthesis():
+    adapter, fakes = _adapter([b"aa", b"bb", b"cc"])
+    request = TTSRequest(text="Hola", voice_id="es-MX-DaliaNeural")
+    received = asyncio.Event()
+
+    async def consume():
+        async for _ in adapter.synthesize_stream(request):
+            received.set()
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(consume())
+    await received.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # The abandoned generator is finalized by the event loop (asyncgen hooks)
+    for _ in range(50):
+        if adapter._pool.idle_count():
+            break
+        await asyncio.sleep(0.01)
+
+    assert fakes[0].stopped
+    assert adapter._pool.idle_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streams_use_separate_synthesizers():
+    adapter, fakes = _adapter([b"aa", b"bb"], hold_first=False)
+    request = TTSRequest(text="Hola", voice_id="es-MX-DaliaNeural")
+
+    async def collect():
+        return [chunk async for chunk in adapter.synthesize_stream(request)]
+
+    results = await asyncio.gather(collect(), collect())
+
+    assert results == [[b"aa", b"bb"], [b"aa", b"bb"]]
+    assert len(fakes) == 2
+    assert adapter._pool.idle_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_canceled_synthesis_raises_tts_exception():
+    adapter, _ = _adapter([], reason=speechsdk.ResultReason.Canceled)
+    request = TTSRequest(text="Hola", voice_id="es-MX-DaliaNeural")
+
+    with pytest.raises(TTSException) as exc_info:
+        async for _ in adapter.synthesize_stream(request):
+            pass
+    assert exc_info.value.provider == "azure"
+
+
+@pytest.mark.asyncio
+async def test_repeated_phrase_is_served_from_phrase_cache():
+    adapter, fakes = _adapter([b"aa", b"bb"], hold_first=False)
+    adapter._phrase_cache = PhraseCache()
+    request = TTSRequest(text="Claro, un momento", voice_id="es-MX-DaliaNeural", style="cheerful")
+
+    first = [chunk async for chunk in adapter.synthesize_stream(request)]
+    second = [chunk async for chunk in adapter.synthesize_stream(request)]
+    other_style = TTSRequest(text="Claro, un momento", voice_id="es-MX-DaliaNeural", style="sad")
+    await adapter.synthesize(other_style)
+
+    assert first == [b"aa", b"bb"]
+    assert second == [b"aabb"]
+    # One synthesis per distinct (text, voice, style)
+    assert len(fakes) == 1 and adapter._pool.idle_count() == 1
+    assert adapter._phrase_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_phrases_share_one_synthesis():
+    adapter, fakes = _adapter([b"aa", b"bb"], hold_first=False)
+    adapter._phrase_cache = PhraseCache()
+    request = TTSRequest(text="Claro, un momento", voice_id="es-MX-DaliaNeural")
+
+    results = await asyncio.gather(adapter.synthesize(request), adapter.synthesize(request))
+
+    assert results == [b"aabb", b"aabb"]
+    assert len(fakes) == 1
+    assert adapter._phrase_cache.coalesced == 1
@@ -0,0 +1,151 @@
+"""
+Unit tests for local end-of-turn detection: LexicalEndOfTurnAdapter (es-MX rules)
+and ClassifyTurnCompletionUseCase (local first, LLM only when ambiguous).
+"""
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.adapters.outbound.turn import LexicalEndOfTurnAdapter
+from app.domain.models.llm_models import LLMChunk
+from app.domain.ports import EndOfTurnPort
+from app.domain.use_cases import ClassifyTurnCompletionUseCase
+from app.processors.logic.aggregator import ContextAggregator
+
+
+@pytest.fixture
+def detector():
+    return LexicalEndOfTurnAdapter()
+
+
+@pytest.mark.parametrize("text", [
+    "Quiero pagar con",
+    "me gustaría saber si",
+    "Es para el.",  # STT closed a cut-off sentence
+    "y luego fui a la",
+    "es que este",
+    "no sé, o sea",
+    "estaba pensando...",
+])
+def test_trailing_function_words_and_fillers_are_incomplete(detector, text):
+    assert detector.completion_probability(text) <= 0.3
+
+
+@pytest.mark.parametrize("text", [
+    "¿Me puede dar el saldo?",
+    "Quiero agendar una cita para mañana.",
+    "Sí",
+    "no",
+    "Muchas gracias",
+    "de acuerdo",
+])
+def test_punctuated_sentences_and_closed_answers_are_complete(detector, text):
+    assert detector.completion_probability(text) >= 0.7
+
+
+@pytest.mark.parametrize("text", [
+    "¿Qué?",
+    "¿Cómo?",
+    "¿Dónde?",
+    "¿Cuándo?",
+    "¿Y tú?",
+    "Es para mí.",
+    "Se lo di a él.",
+])
+def test_accented_pronouns_and_wh_questions_are_complete(detector, text):
+    # Differ from que/como/donde/cuando/tu/mi/el only by the accent
+    assert detector.completion_probability(text) >= 0.7
+
+
+def test_no_signal_is_ambiguous(detector):
+    assert detector.completion_probability("quiero agendar una cita mañana") == 0.5
+    assert detector.completion_probability("  ") == 0.5
+
+
+def test_scoring_is_well_under_ten_milliseconds(detector):
+    text = "Buenas tardes, quisiera saber cuánto debo de mi tarjeta y si puedo pagar con"
+    start = time.perf_counter()
+    for _ in range(1000):
+        detector.completion_probability(text)
+    assert (time.perf_counter() - start) / 1000 < 0.001
+
+
+class FixedScore(EndOfTurnPort):
+    def __init__(self, score):
+        self.score = score
+
+    @property
+    def name(self):
+        return "fixed"
+
+    def completion_probability(self, text):
+        return self.score
+
+
+@pytest.mark.asyncio
+async def test_llm_fallback_only_for_ambiguous_scores():
+    asked = []
+
+    async def llm(text):
+        asked.append(text)
+        return False
+
+    use_case = ClassifyTurnCompletionUseCase(FixedScore(0.9), llm_fallback=llm)
+    assert await use_case.is_complete("a") is True
+    use_case.detector = FixedScore(0.1)
+    assert await use_case.is_complete("b") is False
+    use_case.detector = FixedScore(0.5)
+    assert await use_case.is_complete("c") is False
+
+    assert asked == ["c"]
+    assert use_case.stats.decisions == 3
+    assert use_case.stats.local_hit_rate == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_failed_fallback_assumes_complete():
+    async def llm(text):
+        raise TimeoutError("groq timeout")
+
+    use_case = ClassifyTurnCompletionUseCase(FixedScore(0.5), llm_fallback=llm)
+
+    assert await use_case.is_complete("quiero") is True
+    assert use_case.stats.fallback_errors == 1
+
+
+@pytest.mark.asyncio
+async def test_without_fallback_ambiguous_scores_lean_on_the_midpoint():
+    use_case = ClassifyTurnCompletionUseCase(FixedScore(0.5))
+    assert await use_case.is_complete("x") is True
+    use_case.detector = FixedScore(0.4)
+    assert await use_case.is_complete("x") is False
+    assert use_case.stats.fallback_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_aggregator_asks_the_llm_port_only_when_the_lexicon_is_unsure():
+    class FakeLLM:
+        def __init__(self):
+            self.requests = []
+
+        async def generate_stream(self, request):
+            self.requests.append(request)
+            yield LLMChunk(text="NO")
+
+    llm = FakeLLM()
+    agg = ContextAggregator(
+        SimpleNamespace(segmentation_strategy="semantic"),
+        [],
+        llm_provider=llm,
+        end_of_turn=LexicalEndOfTurnAdapter(),
+    )
+
+    assert await agg._check_semantic_completion("Quiero pagar con") is False
+    assert await agg._check_semantic_completion("Quiero pagar mi recibo.") is True
+    assert llm.requests == []
+
+    assert await agg._check_semantic_completion("quiero pagar mi recibo") is False
+    assert len(llm.requests) == 1
+    assert llm.requests[0].max_tokens == 5
+    assert agg.turn_classifier.stats.local_hit_rate == pytest.approx(2 / 3)
@@ -0,0 +1,94 @@
+"""
+Unit tests for the inbound telephony media reader (fast-path media parsing).
+"""
+import base64
+import json
+
+import numpy as np
+import pytest
+
+from app.adapters.telephony import media_reader
+from app.adapters.telephony.media_reader import InboundMediaDecoder
+from app.core import audio_utils
+
+G711 = np.random.default_rng(11).integers(0, 256, 160, dtype=np.uint8).tobytes()
+
+
+def _twilio_media(payload: bytes, **dumps_kwargs) -> str:
+    return json.dumps(
+        {
+            "event": "media",
+            "sequenceNumber": "3",
+            "media": {"track": "inbound", "chunk": "1", "timestamp": "5", "payload": base64.b64encode(payload).decode()},
+            "streamSid": "MZ1",
+        },
+        **dumps_kwargs,
+    )
+
+
+def test_media_fast_path_decodes_ulaw_by_default():
+    decoder = InboundMediaDecoder("twilio")
+
+    message = decoder.parse(_twilio_media(G711, separators=(",", ":")))
+
+    assert message.event == "media"
+    assert isinstance(message.audio, memoryview)
+    assert bytes(message.audio) == audio_utils.ulaw2lin(G711, 2)
+    assert decoder.fast_path_hits == 1
+
+
+def test_start_event_selects_alaw():
+    decoder = InboundMediaDecoder("telnyx")
+    start = decoder.parse(json.dumps({"event": "start", "start": {"media_format": {"encoding": "PCMA"}}}))
+    decoder.set_format(start.data["start"])
+
+    message = decoder.parse(
+        json.dumps({"event": "media", "media": {"payload": base64.b64encode(G711).decode()}}, separators=(",", ":"))
+    )
+
+    assert start.event == "start" and start.audio is None
+    assert bytes(message.audio) == audio_utils.alaw2lin(G711, 2)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_unusual_formatting_falls_back_to_json(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(media_reader, "orjson", None)
+    decoder = InboundMediaDecoder("twilio")
+    payload = base64.b64encode(G711).decode()
+
+    spaced = decoder.parse(_twilio_media(G711))  # '"event": "media"' with spaces
+    escaped = decoder.parse('{"event":"media","media":{"payload":"' + payload.replace("/", "\\/") + '"}}')
+
+    assert decoder.fast_path_hits == 0
+    expected = audio_utils.ulaw2lin(G711, 2)
+    assert bytes(spaced.audio) == expected
+    assert bytes(escaped.audio) == expected
+
+
+def test_audio_view_stays_valid_across_messages():
+    decoder = InboundMediaDecoder("twilio")
+    first = decoder.parse(_twilio_media(G711[:80], separators=(",", ":"))).audio
+    second = decoder.parse(_twilio_media(G711[80:], separators=(",", ":"))).audio
+
+    assert len(first) == 160
+    assert bytes(first) + bytes(second) == audio_utils.ulaw2lin(G711, 2)
+    # Consumers accumulate the view directly (TurnAccumulator.feed extends a bytearray)
+    pending = bytearray()
+    pending.extend(first)
+    assert pending == bytes(first)
+
+
+def test_browser_payload_is_already_pcm():
+    pcm = bytes(range(64))
+    message = InboundMediaDecoder("browser").parse(
+        json.dumps({"event": "media", "media": {"payload": base64.b64encode(pcm).decode()}})
+    )
+    assert bytes(message.audio) == pcm
+
+
+def test_empty_or_malformed_payload_has_no_audio():
+    decoder = InboundMediaDecoder("twilio")
+    assert decoder.parse('{"event":"media","media":{"payload":""}}').audio is None
+    assert decoder.parse('{"event":"media","media":{"payload":"abc"}}').audio is None
+    assert decoder.parse('{"event":"stop"}').event == "stop"
@@ -0,0 +1,128 @@
+"""
+Unit tests for the telephony media writer (template encoder + per-transport write queue).
+"""
+import asyncio
+import base64
+import json
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from app.adapters.telephony.media_writer import MediaFrameEncoder, MediaWriter
+from app.adapters.telephony.transport import TelephonyTransport
+from app.adapters.telephony.v2_telephony_transport import V2TelephonyTransport
+
+
+class FakeSocket:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.sent: list[str] = []
+        self.delay = delay
+        self.fail = fail
+        self.application_state = WebSocketState.CONNECTED
+        self.closed = False
+
+    async def send_text(self, text: str) -> None:
+        if self.fail:
+            raise RuntimeError("socket gone")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _payloads(socket: FakeSocket) -> list[bytes]:
+    return [base64.b64decode(json.loads(m)["media"]["payload"]) for m in socket.sent if '"media"' in m]
+
+
+@pytest.mark.parametrize(
+    "protocol,expected",
+    [
+        ("twilio", {"event": "media", "streamSid": "MZ\"1", "media": {"payload": None}}),
+        ("telnyx", {"event": "media", "stream_id": "MZ\"1", "media": {"payload": None, "track": "inbound_track"}}),
+    ],
+)
+def test_encoder_matches_json_dumps(protocol, expected):
+    encoder = MediaFrameEncoder(protocol, 'MZ"1')
+    for audio in (bytes(range(160)), b"\xff" * 7, b"\x00"):
+        expected["media"]["payload"] = base64.b64encode(audio).decode()
+        assert encoder.encode(audio) == json.dumps(expected)
+
+
+@pytest.mark.asyncio
+async def test_writer_does_not_block_caller_and_coalesces_queued_audio():
+    socket = FakeSocket(delay=0.01)
+    writer = MediaWriter(socket.send_text, max_coalesce_bytes=480)
+    writer.set_stream("twilio", "MZ1")
+
+    frames = [bytes([i]) * 160 for i in range(7)]
+    for frame in frames:
+        writer.send_audio(frame)  # returns immediately
+    writer.send_text('{"event": "mark"}')
+    assert socket.sent == []
+
+    assert await writer.flush()
+    # Frames queued behind each other leave in messages of up to 480 bytes, mark last
+    assert [len(p) for p in _payloads(socket)] == [480, 480, 160]
+    assert b"".join(_payloads(socket)) == b"".join(frames)
+    assert socket.sent[-1] == '{"event": "mark"}'
+    assert writer.stats.coalesced_chunks == 4
+
+
+@pytest.mark.asyncio
+async def test_writer_bounds_pending_audio_dropping_oldest():
+    socket = FakeSocket(delay=0.01)
+    writer = MediaWriter(socket.send_text, coalesce=False, max_pending_audio_bytes=320)
+    writer.set_stream("twilio", "MZ1")
+
+    for i in range(5):
+        writer.send_audio(bytes([i]) * 160)
+
+    await writer.flush()
+    assert _payloads(socket) == [bytes([3]) * 160, bytes([4]) * 160]
+    assert writer.stats.dropped_audio_bytes == 480
+
+
+@pytest.mark.asyncio
+async def test_failed_send_marks_v2_transport_closed():
+    socket = FakeSocket(fail=True)
+    transport = V2TelephonyTransport(socket, protocol="twilio")
+    transport.set_stream_id("MZ1")
+
+    await transport.send_audio(b"\x00" * 160)
+    await asyncio.sleep(0)
+
+    assert not transport.is_connected()
+
+
+@pytest.mark.asyncio
+async def test_v2_close_flushes_queued_audio_first():
+    socket = FakeSocket(delay=0.005)
+    transport = V2TelephonyTransport(socket, protocol="telnyx")
+    transport.set_stream_id("call-1")
+
+    await transport.send_audio(b"\x01" * 800)
+    await transport.send_audio(b"\x02" * 800)
+    await transport.close()
+
+    assert b"".join(_payloads(socket)) == b"\x01" * 800 + b"\x02" * 800
+    assert socket.closed
+
+
+@pytest.mark.asyncio
+async def test_clear_drops_queued_audio_but_keeps_order():
+    socket = FakeSocket(delay=0.01)
+    transport = TelephonyTransport(socket, protocol="twilio")
+    transport.set_stream_id("MZ1")
+
+    await transport.send_audio(b"\x05" * 160)
+    await asyncio.sleep(0)  # first frame in flight
+    for _ in range(3):
+        await transport.send_audio(b"\x06" * 160)
+    await transport.send_json({"event": "clear"})
+    await transport.writer.flush()
+
+    # Only the frame already in flight reached the socket, then the clear
+    assert _payloads(socket) == [b"\x05" * 160]
+    assert json.loads(socket.sent[-1]) == {"event": "clear", "streamSid": "MZ1"}
@@ -0,0 +1,92 @@
+"""
+Unit tests for pre-processed background loops (app.core.audio.background_loops)
+and their use in AudioStreamer / AudioManager.
+"""
+import struct
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from app.core import audio_utils
+from app.core.audio.background_loops import BackgroundLoop, get_background_loop
+from app.core.audio_streamer import BG_GAIN, AudioStreamer
+from app.core.managers import AudioManager
+
+
+def _alaw_wav(payload: bytes) -> bytes:
+    """Minimal 8kHz mono A-law RIFF/WAVE file (format tag 6)."""
+    fmt = struct.pack("<HHIIHHH", 6, 1, 8000, 8000, 1, 8, 0)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"fact" + struct.pack("<II", 4, len(payload))
+    body += b"data" + struct.pack("<I", len(payload)) + payload
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+@pytest.fixture
+def bg_file(tmp_path):
+    payload = np.random.default_rng(5).integers(0, 256, 1000, dtype=np.uint8).tobytes()
+    path = tmp_path / "ambience.wav"
+    path.write_bytes(_alaw_wav(payload))
+    return path, payload
+
+
+def test_loop_is_preprocessed_once_and_shared(bg_file):
+    path, payload = bg_file
+
+    loop = get_background_loop(path, BG_GAIN, "ulaw")
+
+    assert loop is get_background_loop(str(path), BG_GAIN, "ulaw")
+    assert loop is not get_background_loop(path, BG_GAIN, "alaw")
+    assert loop.samples == len(payload)
+    # Attenuated PCM and encoded loop match the per-frame DSP they replace
+    quiet_pcm = audio_utils.mul(audio_utils.alaw2lin(payload, 2), 2, BG_GAIN)
+    assert loop.pcm(0, 160) == quiet_pcm[:320]
+    assert loop.encoded_loop == audio_utils.gain_g711(payload, BG_GAIN, codec="ulaw", source_codec="alaw")
+
+
+def test_slices_wrap_around_loop_end():
+    encoded = bytes(range(200))
+    loop = BackgroundLoop.from_encoded(encoded, "alaw")
+
+    assert loop.encoded(150, 160) == encoded[150:] + encoded[:110]
+    assert loop.pcm(150, 160) == audio_utils.alaw2lin(encoded[150:] + encoded[:110], 2)
+    assert loop.advance(150, 160) == 110
+    with pytest.raises(ValueError):
+        loop.encoded(0, 1000)
+
+
+def test_missing_file_returns_none(tmp_path):
+    assert get_background_loop(tmp_path / "missing.wav", BG_GAIN) is None
+
+
+def test_streamer_mixes_over_shared_loop(bg_file):
+    path, payload = bg_file
+    streamer = AudioStreamer(websocket=None, client_type="twilio")
+    streamer.bg_loop = get_background_loop(path, BG_GAIN, streamer.codec)
+    tts = np.random.default_rng(9).integers(0, 256, 160, dtype=np.uint8).tobytes()
+
+    silence_frame = streamer._mix_audio(None)
+    mixed_frame = streamer._mix_audio(tts)
+
+    assert silence_frame == streamer.bg_loop.encoded(0, 160)
+    # Same result as the fused decode-gain-mix-encode over the raw A-law background
+    assert mixed_frame == audio_utils.mix_g711(
+        tts, payload[160:320], codec="ulaw", background_codec="alaw", background_gain=BG_GAIN
+    )
+    assert streamer.bg_loop_index == 320
+
+
+@pytest.mark.asyncio
+async def test_audio_manager_plays_loop_slices_in_outbound_codec(bg_file):
+    path, payload = bg_file
+    manager = AudioManager(AsyncMock(), "twilio")
+
+    await manager.load_background_audio(str(path))
+    # 7 ticks of silence: background fill, coalesced into messages of up to 5 frames
+    payloads = manager.playout.collect(7)
+
+    expected = audio_utils.gain_g711(payload, 1.0, codec="ulaw", source_codec="alaw")
+    assert [len(p) for p in payloads] == [800, 320]
+    assert b"".join(payloads) == expected + expected[:120]
+    assert manager.bg_loop is get_background_loop(path, 1.0, "ulaw")
@@ -0,0 +1,89 @@
+"""
+Unit tests for the CPU offload pool (app.core.cpu_offload).
+"""
+import asyncio
+import operator
+import threading
+
+import pytest
+
+from app.core.cpu_offload import CPUOffloadPool
+
+
+@pytest.fixture
+def pool():
+    pool = CPUOffloadPool(threads=1, max_pending=2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_off_the_event_loop_thread(pool):
+    loop_thread = threading.get_ident()
+
+    worker_thread = await pool.run(threading.get_ident)
+
+    assert worker_thread != loop_thread
+    assert pool.stats.submitted == pool.stats.completed == 1
+    assert pool.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_disabled_pool_runs_inline():
+    pool = CPUOffloadPool(threads=0)
+
+    assert not pool.enabled
+    assert await pool.run(threading.get_ident) == threading.get_ident()
+    assert await pool.run_process(operator.add, 2, 3) == 5
+
+
+@pytest.mark.asyncio
+async def test_submission_is_bounded(pool):
+    release = threading.Event()
+    jobs = [asyncio.create_task(pool.run(release.wait)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+
+    # Two slots: the third submitter waits instead of queueing
+    assert pool.pending == 2
+    assert pool.stats.blocked_submits == 1
+
+    release.set()
+    assert await asyncio.gather(*jobs) == [True, True, True]
+    assert pool.stats.max_pending == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_caller_cancels_a_queued_job(pool):
+    release = threading.Event()
+    ran = []
+    busy = asyncio.create_task(pool.run(release.wait))
+    queued = asyncio.create_task(pool.run(ran.append, "late"))
+    await asyncio.sleep(0.05)
+
+    queued.cancel()
+    await asyncio.sleep(0.01)  # the cancellation reaches the executor queue
+    release.set()
+    await busy
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    await pool.run(int)
+
+    assert ran == []
+    assert pool.stats.cancelled == 1
+    assert pool.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_the_caller(pool):
+    with pytest.raises(ZeroDivisionError):
+        await pool.run(operator.truediv, 1, 0)
+    assert pool.stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_picklable_jobs():
+    pool = CPUOffloadPool(threads=1, processes=1)
+    try:
+        assert await pool.run_process(operator.mul, 6, 7) == 42
+    finally:
+        pool.shutdown()
@@ -0,0 +1,48 @@
+"""
+Unit tests for the slotted, low-allocation Frame model.
+"""
+import uuid
+
+import pytest
+
+from app.core.frames import EMPTY_METADATA, AudioFrame, CancelFrame, TextFrame
+
+
+def test_frames_are_slotted():
+    frame = AudioFrame(data=b"\x00" * 320, sample_rate=8000)
+    assert not hasattr(frame, "__dict__")
+    with pytest.raises(AttributeError):
+        frame.unknown = 1
+
+
+def test_ids_are_lazy_unique_and_uuid_shaped():
+    frame = TextFrame(text="hi", trace_id="turn-1")
+    assert frame._id is None and frame._span_id is None
+
+    ids = {frame.id, frame.span_id, TextFrame(text="x").id, TextFrame(text="y").trace_id}
+    assert len(ids) == 4
+    assert frame.id == frame.id  # stable once generated
+    for value in ids:
+        uuid.UUID(value)
+    assert frame.name == "TextFrame"
+
+
+def test_default_metadata_is_shared_and_read_only():
+    a, b = CancelFrame(), AudioFrame(data=b"", sample_rate=8000)
+    assert a.metadata is b.metadata is EMPTY_METADATA
+    with pytest.raises(TypeError):
+        a.metadata["key"] = "value"
+    assert TextFrame(text="x", metadata={"k": 1}).metadata == {"k": 1}
+
+
+def test_to_dict_handles_memoryview_audio():
+    buffer = bytearray(b"\x01\x02" * 160)
+    frame = AudioFrame(data=memoryview(buffer)[:160], sample_rate=8000, trace_id="t")
+
+    summary = frame.to_dict()
+    full = frame.to_dict(include_binary=True)
+
+    assert summary["data"] == "<bytes len=160>"
+    assert full["data"] == bytes(buffer[:160])
+    assert summary["trace_id"] == "t" and summary["name"] == "AudioFrame"
+    assert summary["metadata"] == {}
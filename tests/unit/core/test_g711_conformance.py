@@ -0,0 +1,142 @@
+"""
+G.711 conformance tests for the NumPy DSP layer (app.core.audio_utils / AudioProcessor).
+
+Checks the tables against the ITU-T G.711 reconstruction levels (closed form per
+segment), fixed reference vectors (G.191 g711 reference coder, as shipped by
+audioop) and the fused decode-mix-encode path against the step-by-step pipeline.
+These run without audioop, so they keep guarding the codec on Python 3.13+.
+"""
+import numpy as np
+import pytest
+
+from app.core import audio_utils
+from app.core.audio_processor import AudioProcessor
+
+ALL_CODES = bytes(range(256))
+ALL_PCM = np.arange(-32768, 32768, dtype=np.int16).tobytes()
+
+# (16-bit input, expected code) — reference coder output
+ULAW_ENCODE_VECTORS = [
+    (0, 0xFF), (1, 0xFF), (-1, 0x7E), (7, 0xFE), (-16, 0x7D), (31, 0xFB),
+    (255, 0xE7), (-256, 0x67), (1023, 0xCD), (4095, 0xAF), (8191, 0x9F),
+    (16383, 0x8F), (32124, 0x80), (32767, 0x80), (-32767, 0x00), (-32768, 0x00),
+]
+ALAW_ENCODE_VECTORS = [
+    (0, 0xD5), (1, 0xD5), (-1, 0x55), (15, 0xD5), (16, 0xD4), (-17, 0x54),
+    (31, 0xD4), (32, 0xD7), (255, 0xDA), (256, 0xC5), (-256, 0x5A), (-257, 0x45),
+    (4095, 0x9A), (4096, 0x85), (32256, 0xAA), (32767, 0xAA), (-32768, 0x2A),
+]
+# (code, expected 16-bit output)
+ULAW_DECODE_VECTORS = [
+    (0x00, -32124), (0x0F, -16764), (0x10, -15996), (0x7E, -8), (0x7F, 0),
+    (0x80, 32124), (0x8F, 16764), (0xEF, 132), (0xF0, 120), (0xFE, 8), (0xFF, 0),
+]
+ALAW_DECODE_VECTORS = [
+    (0x2A, -32256), (0x55, -8), (0xD5, 8), (0xD4, 24), (0xC5, 264),
+    (0xAA, 32256), (0x80, 5504), (0x00, -5504), (0x7F, -848), (0xFF, 848),
+]
+
+
+def _decode(codec: str, codes: bytes) -> np.ndarray:
+    return np.frombuffer(getattr(audio_utils, f"{codec}2lin")(codes, 2), dtype=np.int16).astype(np.int32)
+
+
+def _encode(codec: str, samples: list[int]) -> bytes:
+    return getattr(audio_utils, f"lin2{codec}")(np.array(samples, dtype=np.int16).tobytes(), 2)
+
+
+class TestReferenceVectors:
+    @pytest.mark.parametrize(
+        "codec,vectors", [("ulaw", ULAW_ENCODE_VECTORS), ("alaw", ALAW_ENCODE_VECTORS)]
+    )
+    def test_encode(self, codec, vectors):
+        samples, codes = zip(*vectors, strict=True)
+        assert list(_encode(codec, list(samples))) == list(codes)
+
+    @pytest.mark.parametrize(
+        "codec,vectors", [("ulaw", ULAW_DECODE_VECTORS), ("alaw", ALAW_DECODE_VECTORS)]
+    )
+    def test_decode(self, codec, vectors):
+        codes, samples = zip(*vectors, strict=True)
+        assert _decode(codec, bytes(codes)).tolist() == list(samples)
+
+
+class TestReconstructionLevels:
+    def test_ulaw_levels_follow_segment_formula(self):
+        # Positive codes are 0x80..0xFF with all bits inverted: seg = bits 4-6, quant = bits 0-3
+        # 14-bit level = ((2q + 33) << seg) - 33, scaled by 4 to 16-bit
+        levels = _decode("ulaw", ALL_CODES)
+        for code in range(0x80, 0x100):
+            inverted = ~code & 0xFF
+            seg, quant = (inverted >> 4) & 0x07, inverted & 0x0F
+            expected = 4 * (((2 * quant + 33) << seg) - 33)
+            assert levels[code] == expected
+            assert levels[code & 0x7F] == -expected
+
+    def test_alaw_levels_follow_segment_formula(self):
+        # Even bits inverted; 13-bit level = 2q + 1 (seg 0) or (2q + 33) << (seg - 1), scaled by 8
+        levels = _decode("alaw", ALL_CODES)
+        for code in range(0x80, 0x100):
+            value = code ^ 0x55
+            seg, quant = (value >> 4) & 0x07, value & 0x0F
+            level = 2 * quant + 1 if seg == 0 else (2 * quant + 33) << (seg - 1)
+            assert levels[value ^ 0x55] == 8 * level
+            assert levels[(value & 0x7F) ^ 0x55] == -8 * level
+
+    @pytest.mark.parametrize("codec", audio_utils.G711_CODECS)
+    def test_every_code_survives_decode_encode(self, codec):
+        codes = getattr(audio_utils, f"lin2{codec}")(getattr(audio_utils, f"{codec}2lin")(ALL_CODES, 2), 2)
+        expected = bytearray(ALL_CODES)
+        if codec == "ulaw":
+            expected[0x7F] = 0xFF  # negative zero encodes as positive zero
+        assert codes == bytes(expected)
+
+    @pytest.mark.parametrize("codec,peak", [("ulaw", 32124), ("alaw", 32256)])
+    def test_quantization_is_monotonic_and_logarithmic(self, codec, peak):
+        x = np.arange(-32768, 32768, dtype=np.int32)
+        y = _decode(codec, getattr(audio_utils, f"lin2{codec}")(ALL_PCM, 2))
+        assert np.all(np.diff(y) >= 0)
+        # Companding: relative error stays around 1/32 above the linear segments
+        companded = (np.abs(x) >= 1024) & (np.abs(x) <= peak)
+        assert np.max(np.abs(y - x)[companded] / np.abs(x[companded])) < 0.036
+
+
+class TestFusedMix:
+    @pytest.mark.parametrize("codec", audio_utils.G711_CODECS)
+    @pytest.mark.parametrize("background_codec", audio_utils.G711_CODECS)
+    @pytest.mark.parametrize("gain", [0.15, 1.0, 3.0])
+    def test_mix_matches_step_by_step_pipeline(self, codec, background_codec, gain):
+        rng = np.random.default_rng(3)
+        voice = rng.integers(0, 256, 160, dtype=np.uint8).tobytes()
+        background = rng.integers(0, 256, 160, dtype=np.uint8).tobytes()
+        decode = getattr(audio_utils, f"{codec}2lin")
+        decode_bg = getattr(audio_utils, f"{background_codec}2lin")
+        encode = getattr(audio_utils, f"lin2{codec}")
+
+        quiet_bg = audio_utils.mul(decode_bg(background, 2), 2, gain)
+        expected_mix = encode(audio_utils.add(decode(voice, 2), quiet_bg, 2), 2)
+
+        assert audio_utils.mix_g711(voice, background, codec, background_codec, gain) == expected_mix
+        assert audio_utils.gain_g711(background, gain, codec, background_codec) == encode(quiet_bg, 2)
+
+    def test_mix_into_reuses_buffer_and_truncates_to_shorter(self):
+        out = bytearray(160)
+        written = audio_utils.mix_g711_into(b"\x80" * 100, b"\xff" * 160, out, codec="ulaw")
+        assert written == 100
+        # Loud voice plus silence stays at the voice level
+        assert bytes(out[:100]) == b"\x80" * 100
+
+    def test_mix_saturates(self):
+        # Positive peak + positive peak clips to the peak code instead of wrapping
+        assert audio_utils.mix_g711(b"\x80" * 4, b"\x80" * 4, codec="ulaw") == b"\x80" * 4
+        assert audio_utils.mix_g711(b"\xaa" * 4, b"\xaa" * 4, codec="alaw") == b"\xaa" * 4
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown G.711 codec"):
+            audio_utils.mix_g711(b"\x00", b"\x00", codec="pcm")
+
+    def test_audio_processor_facade_uses_shared_tables(self):
+        assert AudioProcessor.lin2ulaw(ALL_PCM, 2) == audio_utils.lin2ulaw(ALL_PCM, 2)
+        assert AudioProcessor.lin2alaw(ALL_PCM, 2) == audio_utils.lin2alaw(ALL_PCM, 2)
+        assert AudioProcessor.alaw2lin(ALL_CODES, 2) == audio_utils.alaw2lin(ALL_CODES, 2)
+        assert AudioProcessor.mix_g711(b"\x80", b"\xd5", codec="ulaw", background_codec="alaw") == b"\x80"
@@ -0,0 +1,121 @@
+"""
+Unit tests for Pipeline channel mode (per-processor bounded inboxes).
+"""
+import asyncio
+
+import pytest
+
+from app.core.frame_channel import FrameChannel
+from app.core.frames import AudioFrame, CancelFrame, Frame, TextFrame
+from app.core.pipeline import Pipeline
+from app.core.processor import FrameDirection, FrameProcessor
+
+
+class Recorder(FrameProcessor):
+    def __init__(self, name: str, delay: float = 0.0):
+        super().__init__(name=name)
+        self.delay = delay
+        self.seen: list[Frame] = []
+
+    async def process_frame(self, frame: Frame, direction: int):
+        if self.delay and isinstance(frame, TextFrame):
+            await asyncio.sleep(self.delay)
+        self.seen.append(frame)
+        await self.push_frame(frame, direction)
+
+
+class Fanout(FrameProcessor):
+    """Turns each audio frame into a text frame for the slow stage."""
+
+    def __init__(self):
+        super().__init__(name="VAD")
+        self.audio_times: list[float] = []
+
+    async def process_frame(self, frame: Frame, direction: int):
+        if isinstance(frame, AudioFrame):
+            self.audio_times.append(asyncio.get_running_loop().time())
+            await self.push_frame(TextFrame(text="turn"), direction)
+        else:
+            await self.push_frame(frame, direction)
+
+
+async def _until(predicate, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+
+
+@pytest.mark.asyncio
+async def test_channel_fast_lane_and_backpressure():
+    channel = FrameChannel("stage", maxsize=1)
+    first, second = TextFrame(text="a"), TextFrame(text="b")
+    cancel = CancelFrame()
+
+    await channel.put(first, FrameDirection.DOWNSTREAM)
+    blocked = asyncio.create_task(channel.put(second, FrameDirection.DOWNSTREAM))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()  # waits for space instead of dropping
+
+    await channel.put(cancel, FrameDirection.DOWNSTREAM, fast=True)
+    assert (await channel.get())[0] is cancel  # fast lane overtakes queued data
+    assert (await channel.get())[0] is first
+    await blocked
+    assert (await channel.get())[0] is second
+    assert channel.stats.blocked_puts == 1
+    assert channel.stats.max_depth == 2
+
+
+@pytest.mark.asyncio
+async def test_frames_flow_in_order_through_channels():
+    p1, p2 = Recorder("P1"), Recorder("P2")
+    pipeline = Pipeline([p1, p2], channel_size=4)
+    await pipeline.start()
+
+    frames = [TextFrame(text=str(i)) for i in range(20)]
+    for frame in frames:
+        await pipeline.queue_frame(frame)
+    await _until(lambda: len(p2.seen) == 20)
+    await pipeline.stop()
+
+    assert p2.seen == frames
+    assert pipeline.channel_stats()["P2"].frames_in == 20
+    assert pipeline._dropped_frames_count == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_stage_does_not_block_earlier_stages():
+    vad = Fanout()
+    tts = Recorder("TTS", delay=0.05)
+    pipeline = Pipeline([vad, tts], channel_size=8)
+    await pipeline.start()
+
+    start = asyncio.get_running_loop().time()
+    for _ in range(5):
+        await pipeline.queue_frame(AudioFrame(data=b"\x00" * 320, sample_rate=8000))
+    await _until(lambda: len(vad.audio_times) == 5)
+    vad_done = vad.audio_times[-1] - start
+    await _until(lambda: len(tts.seen) == 5)
+    await pipeline.stop()
+
+    # VAD handled every audio frame while TTS was still busy with the first turn
+    assert vad_done < 0.05
+    assert pipeline.channel_stats()["TTS"].max_depth >= 4
+
+
+@pytest.mark.asyncio
+async def test_full_inbox_propagates_backpressure_to_queue_frame():
+    tts = Recorder("TTS", delay=0.02)
+    pipeline = Pipeline([tts], max_queue_size=2, channel_size=1)
+    await pipeline.start()
+
+    start = asyncio.get_running_loop().time()
+    for i in range(8):
+        await pipeline.queue_frame(TextFrame(text=str(i)))
+    # The producer was held back instead of frames being dropped
+    assert asyncio.get_running_loop().time() - start >= 0.06
+    await _until(lambda: len([f for f in tts.seen if isinstance(f, TextFrame)]) == 8)
+    await pipeline.stop()
+
+    assert pipeline._dropped_frames_count == 0
+    assert pipeline.channel_stats()["TTS"].blocked_puts > 0
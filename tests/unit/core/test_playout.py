@@ -0,0 +1,217 @@
+"""
+Unit tests for the shared telephony playout scheduler (app.core.audio.playout).
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.adapters.telephony.media_writer import MediaWriter
+from app.core.audio import playout
+from app.core.audio.playout import OFFLOAD_MIN_STREAMS, PlayoutScheduler, PlayoutStream
+from app.core.cpu_offload import CPUOffloadPool
+from app.core.managers import AudioManager
+
+
+class Recorder:
+    def __init__(self):
+        self.payloads: list[bytes] = []
+        self.times: list[float] = []
+
+    def __call__(self, payload: bytes) -> None:
+        self.payloads.append(payload)
+        self.times.append(time.monotonic())
+
+
+def _frames(*markers: int) -> bytes:
+    return b"".join(bytes([m]) * 160 for m in markers)
+
+
+class TestPlayoutStream:
+    def test_one_frame_per_tick_and_catch_up_is_coalesced(self):
+        stream = PlayoutStream(send=Recorder())
+        stream.enqueue(_frames(1, 2, 3, 4) + b"\x05" * 20)
+
+        assert stream.collect(1) == [_frames(1)]
+        # Late tick: three frames due, sent as one message
+        assert stream.collect(3) == [_frames(2, 3, 4)]
+        assert stream.collect(1) == [b"\x05" * 20]
+        assert stream.collect(1) == []
+        assert stream.stats.frames_sent == 5
+
+    def test_steady_state_coalescing(self):
+        stream = PlayoutStream(send=Recorder(), frames_per_message=2)
+        stream.enqueue(_frames(1, 2, 3))
+
+        assert stream.collect(1) == []
+        assert stream.collect(1) == [_frames(1, 2)]
+        assert stream.collect(1) == []
+        assert stream.collect(1) == [_frames(3)]
+
+    def test_render_fills_silence(self):
+        stream = PlayoutStream(send=Recorder(), render=lambda frame: frame or b"\xff" * 160)
+        stream.enqueue(_frames(1))
+
+        assert stream.collect(2) == [_frames(1) + b"\xff" * 160]
+
+    def test_underrun_counts_short_starvation_gaps_only(self):
+        stream = PlayoutStream(send=Recorder())
+        stream.enqueue(_frames(1))
+        stream.collect(1)
+        stream.collect(3)  # starved for 3 ticks
+        stream.enqueue(_frames(2))
+        stream.collect(1)
+        assert stream.stats.underruns == 1
+
+        stream.collect(100)  # end of utterance, long silence
+        stream.enqueue(_frames(3))
+        stream.collect(1)
+        assert stream.stats.underruns == 1
+
+    def test_clear_drops_queued_audio(self):
+        stream = PlayoutStream(send=Recorder())
+        stream.enqueue(_frames(1, 2, 3))
+        assert stream.clear() == 3
+        assert stream.collect(1) == []
+
+
+class TestPlayoutScheduler:
+    def test_frames_due_against_deadline_clock(self):
+        now = [0.0]
+        scheduler = PlayoutScheduler(frame_seconds=0.02, max_catch_up_frames=5, clock=lambda: now[0])
+
+        now[0] = 0.001
+        assert scheduler._frames_due(0.0, 0) == (1, 0)
+        assert scheduler._frames_due(0.0, 1) == (0, 0)
+        # Woke up 3 frames late: catch up
+        now[0] = 0.081
+        assert scheduler._frames_due(0.0, 2) == (3, 0)
+        # Woke up far too late: bounded catch-up, the rest is skipped
+        now[0] = 0.301
+        assert scheduler._frames_due(0.0, 5) == (5, 6)
+        assert scheduler.stats.late_ticks == 2
+        assert scheduler.stats.skipped_frames == 6
+
+    @pytest.mark.asyncio
+    async def test_paces_all_streams_from_one_task_without_drift(self):
+        scheduler = PlayoutScheduler(frame_seconds=0.01)
+        first, second = Recorder(), Recorder()
+        streams = [PlayoutStream(send=first), PlayoutStream(send=second)]
+        for stream in streams:
+            stream.enqueue(_frames(*range(20)))
+            scheduler.register(stream)
+        task = scheduler._task
+
+        start = time.monotonic()
+        # Wait on what reached the transports (frames_sent counts at collect time)
+        while sum(len(b"".join(r.payloads)) for r in (first, second)) < 6400 and time.monotonic() - start < 2:
+            await asyncio.sleep(0.01)
+        await scheduler.close()
+
+        assert scheduler._task is None and task.done()
+        assert b"".join(first.payloads) == _frames(*range(20)) == b"".join(second.payloads)
+        # Paced at real time, not burst: 20 frames of 10ms span ~190ms
+        span = first.times[-1] - first.times[0]
+        assert 0.15 <= span <= 0.5
+
+    @pytest.mark.asyncio
+    async def test_a_stalled_socket_does_not_delay_other_calls(self):
+        unblock = asyncio.Event()
+
+        async def stalled_send_text(text: str) -> None:
+            await unblock.wait()
+
+        writer = MediaWriter(stalled_send_text)
+        writer.set_stream("twilio", "MZ1")
+        recorder = Recorder()
+        scheduler = PlayoutScheduler(frame_seconds=0.01)
+        for send in (writer.send_audio, recorder):
+            stream = PlayoutStream(send=send)
+            stream.enqueue(_frames(*range(10)))
+            scheduler.register(stream)
+
+        start = time.monotonic()
+        while len(b"".join(recorder.payloads)) < 1600 and time.monotonic() - start < 2:
+            await asyncio.sleep(0.01)
+        await scheduler.close()
+
+        assert b"".join(recorder.payloads) == _frames(*range(10))
+        # The stalled call's frames wait in its own queue
+        assert writer.pending > 0
+        unblock.set()
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_register_rejects_a_send_that_awaits(self):
+        async def send_audio(payload: bytes) -> None:
+            pass
+
+        scheduler = PlayoutScheduler()
+        with pytest.raises(TypeError):
+            scheduler.register(PlayoutStream(send=send_audio))
+        assert scheduler.stream_count == 0 and scheduler._task is None
+
+    @pytest.mark.asyncio
+    async def test_scheduler_stops_when_last_stream_leaves(self):
+        scheduler = PlayoutScheduler(frame_seconds=0.01)
+        stream = PlayoutStream(send=Recorder())
+        scheduler.register(stream)
+        task = scheduler._task
+
+        scheduler.unregister(stream)
+        await asyncio.wait_for(task, timeout=1)
+        assert scheduler.stream_count == 0
+
+    @pytest.mark.asyncio
+    async def test_busy_ticks_render_on_the_offload_pool_and_barge_in_drops(self, monkeypatch):
+        pool = CPUOffloadPool(threads=1)
+        monkeypatch.setattr(playout, "get_cpu_offload", lambda: pool)
+        render_threads = set()
+        rendering = threading.Event()
+        release = threading.Event()
+
+        def render(frame):
+            render_threads.add(threading.get_ident())
+            rendering.set()
+            release.wait(1)
+            return frame
+
+        scheduler = PlayoutScheduler()
+        recorders = [Recorder() for _ in range(OFFLOAD_MIN_STREAMS)]
+        streams = [PlayoutStream(send=r, render=render) for r in recorders]
+        for stream in streams:
+            stream.enqueue(_frames(1))
+            scheduler._streams.add(stream)
+
+        serving = asyncio.create_task(scheduler._serve(1))
+        await asyncio.to_thread(rendering.wait, 1)
+        streams[0].clear()  # barge-in while its frame is being mixed
+        release.set()
+        await serving
+        pool.shutdown()
+
+        assert render_threads and threading.get_ident() not in render_threads
+        assert recorders[0].payloads == []
+        assert all(r.payloads == [_frames(1)] for r in recorders[1:])
+
+
+@pytest.mark.asyncio
+async def test_audio_manager_enqueues_telephony_audio_for_paced_playout():
+    class Transport:
+        def __init__(self):
+            self.sent = []
+
+        def queue_audio(self, chunk):
+            self.sent.append(chunk)
+
+    transport = Transport()
+    manager = AudioManager(transport, "twilio")
+
+    await manager.send_audio_chunked(_frames(1, 2, 3))
+    # Nothing is burst to the carrier: frames wait for their ticks
+    assert transport.sent == []
+    assert manager.playout.buffered_frames == 3
+
+    await manager.clear_queue()
+    assert manager.playout.buffered_frames == 0
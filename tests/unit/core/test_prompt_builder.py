@@ -0,0 +1,79 @@
+"""
+Unit tests for compiled system prompts (app.core.prompt_builder) and their use in LLMProcessor.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.prompt_builder import PromptBuilder
+from app.domain.models.llm_models import LLMChunk
+from app.domain.models.tool_models import ToolDefinition
+from app.processors.logic.llm import LLMProcessor
+
+
+def _config(**overrides):
+    fields = {
+        "system_prompt": "Eres Andrea de {empresa}.",
+        "response_length": "short",
+        "conversation_tone": "warm",
+        "conversation_formality": "formal",
+        "dynamic_vars_enabled": True,
+        "dynamic_vars": '{"empresa": "ACME", "nombre": "Luis"}',
+    }
+    return SimpleNamespace(**{**fields, **overrides})
+
+
+def test_render_matches_a_full_build():
+    prompt = PromptBuilder.build_system_prompt(_config(), {"cliente": "{nombre}", "saldo": 1200})
+
+    assert prompt.startswith("Eres Andrea de ACME.\n\n<dynamic_style_overrides>\n- Longitud:")
+    assert "- Formalidad: Trata de 'usted' y mantén la etiqueta." in prompt
+    assert prompt.endswith("<context_data>\n- cliente: Luis\n- saldo: 1200\n</context_data>\n")
+    assert PromptBuilder.build_system_prompt(_config()) == PromptBuilder.compile(_config()).static
+
+
+def test_compiled_prompt_is_shared_per_config_version():
+    first = PromptBuilder.compile(_config())
+
+    assert PromptBuilder.compile(_config()) is first  # another call, same profile
+    assert PromptBuilder.compile(_config(conversation_tone="friendly")) is not first
+    assert PromptBuilder.compile(_config(dynamic_vars='{"empresa": "Otra"}')).static.startswith(
+        "Eres Andrea de Otra."
+    )
+
+
+class CountingTools:
+    tool_count = 1
+
+    def __init__(self):
+        self.exports = 0
+
+    def get_tool_definitions(self):
+        self.exports += 1
+        return [ToolDefinition(name="lookup", description="Busca", parameters={}, required=[])]
+
+
+class RecordingLLM:
+    def __init__(self):
+        self.requests = []
+
+    async def generate_stream(self, request):
+        self.requests.append(request)
+        yield LLMChunk(text="Claro.")
+
+
+@pytest.mark.asyncio
+async def test_llm_processor_builds_prompt_and_tools_once_and_renders_context_per_turn():
+    tools, llm = CountingTools(), RecordingLLM()
+    context = {"crm": "sin datos"}
+    processor = LLMProcessor(llm, _config(), [], context=context, execute_tool_use_case=tools)
+
+    await processor._handle_user_text("hola")
+    context["crm"] = "cliente VIP"  # CRM context arrived mid-call
+    await processor._handle_user_text("mi saldo")
+
+    assert tools.exports == 1
+    assert llm.requests[0].tools is llm.requests[1].tools
+    assert llm.requests[0].tools[0]["name"] == "lookup"
+    assert llm.requests[0].system_prompt.endswith("- crm: sin datos\n</context_data>\n")
+    assert llm.requests[1].system_prompt.endswith("- crm: cliente VIP\n</context_data>\n")
@@ -0,0 +1,72 @@
+"""
+Unit tests for the inbound PCM ring buffer (app.core.audio.ring_buffer).
+"""
+import numpy as np
+import pytest
+
+from app.core.audio.ring_buffer import PCMRingBuffer
+
+PCM = np.arange(-500, 500, dtype=np.int16)
+
+
+def test_windows_are_views_and_stay_contiguous_across_the_wrap():
+    ring = PCMRingBuffer(capacity=300, max_window=64)
+    reader = ring.reader()
+
+    windows = []
+    for start in range(0, 960, 80):  # 20 ms frames at 4 kHz, many laps of the ring
+        ring.write(PCM[start : start + 80].tobytes())
+        while (window := reader.read(64)) is not None:
+            assert window.base is not None  # view, not a copy
+            windows.append(window.copy())
+
+    assert np.array_equal(np.concatenate(windows), PCM[: len(windows) * 64])
+    assert reader.dropped == 0
+
+
+def test_readers_have_independent_cursors():
+    ring = PCMRingBuffer(capacity=256, max_window=32)
+    vad = ring.reader()
+    ring.write(PCM[:32].tobytes())
+    recorder = ring.reader()  # starts at the write cursor
+    ring.write(PCM[32:64].tobytes())
+
+    assert np.array_equal(vad.read(32), PCM[:32])
+    assert np.array_equal(recorder.read(32), PCM[32:64])
+    assert np.array_equal(vad.read(32), PCM[32:64])
+    assert vad.read(1) is None and recorder.available == 0
+
+
+def test_float32_window_is_scaled_into_scratch():
+    ring = PCMRingBuffer(capacity=128, max_window=16)
+    reader = ring.reader()
+    ring.write(PCM[:32].tobytes())
+
+    first = reader.read_float32(16)
+    assert first.dtype == np.float32
+    assert np.allclose(first, PCM[:16] / 32768.0)
+    second = reader.read_float32(16)
+    assert np.shares_memory(first, second)  # same scratch, no allocation
+
+
+def test_lagging_reader_skips_to_oldest_retained_audio():
+    ring = PCMRingBuffer(capacity=100, max_window=10)
+    reader = ring.reader()
+
+    ring.write(PCM[:250].tobytes())  # larger than the ring: only the newest 100 are kept
+
+    assert reader.available == 100
+    assert reader.dropped == 150
+    assert np.array_equal(reader.read(10), PCM[150:160])
+    assert reader.skip() == 90
+
+
+def test_view_bounds_are_checked():
+    with pytest.raises(ValueError):
+        PCMRingBuffer(capacity=8, max_window=16)
+    ring = PCMRingBuffer(capacity=64, max_window=16)
+    ring.write(PCM[:8].tobytes())
+    with pytest.raises(ValueError):
+        ring.view(0, 32)
+    with pytest.raises(ValueError):
+        ring.view(4, 8)  # not written yet
@@ -0,0 +1,90 @@
+"""
+Unit tests for the shared, batched Silero VAD service (app.core.vad.service).
+"""
+import asyncio
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+
+from app.adapters.outbound.vad import SileroVADAdapter  # noqa: E402
+from app.core.vad.model import SileroOnnxModel  # noqa: E402
+from app.core.vad.service import (  # noqa: E402
+    DEFAULT_MODEL_PATH,
+    VADInferenceService,
+    get_vad_service,
+)
+
+
+def _windows(seed: int, count: int, samples: int = 256) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    t = np.arange(samples) / 8000
+    return [
+        (0.3 * np.sin(2 * np.pi * (150 + 40 * i) * t) + 0.05 * rng.standard_normal(samples)).astype(np.float32)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def service():
+    return VADInferenceService(DEFAULT_MODEL_PATH)
+
+
+@pytest.mark.asyncio
+async def test_batched_results_match_a_dedicated_model_per_call(service):
+    calls = [_windows(seed, 6) for seed in range(8)]
+    streams = [service.open_stream(8000) for _ in calls]
+    before = service.stats.batches
+
+    async def run(stream, windows):
+        return [await stream.infer(w) for w in windows]
+
+    batched = await asyncio.gather(*(run(s, w) for s, w in zip(streams, calls, strict=True)))
+
+    for windows, probabilities in zip(calls, batched, strict=True):
+        model = SileroOnnxModel(str(DEFAULT_MODEL_PATH))
+        expected = [float(model(w, 8000)) for w in windows]
+        np.testing.assert_allclose(probabilities, expected, rtol=1e-5, atol=1e-6)
+    # 8 calls x 6 windows ran as ~6 batches, not 48 inferences
+    assert service.stats.batches - before <= 12
+    assert service.stats.max_batch == 8
+
+
+@pytest.mark.asyncio
+async def test_windows_of_one_stream_are_never_in_the_same_batch(service):
+    stream = service.open_stream(8000)
+    windows = _windows(3, 4)
+
+    concurrent = await asyncio.gather(*(stream.infer(w) for w in windows))
+
+    reference = service.open_stream(8000)
+    sequential = [reference.infer_sync(w) for w in windows]
+    np.testing.assert_allclose(concurrent, sequential, rtol=1e-5, atol=1e-6)
+
+
+def test_reset_and_sample_rates(service):
+    stream = service.open_stream(16000)
+    window = _windows(4, 1, samples=512)[0]
+    first = stream.infer_sync(window)
+    stream.infer_sync(window)
+    stream.reset()
+    assert stream.infer_sync(window) == pytest.approx(first, abs=1e-6)
+    with pytest.raises(ValueError):
+        stream.infer_sync(window[:256])
+    with pytest.raises(ValueError):
+        service.open_stream(44100)
+
+
+@pytest.mark.asyncio
+async def test_v2_adapters_share_the_process_session():
+    first, second = SileroVADAdapter(), SileroVADAdapter()
+    assert first._service is second._service is get_vad_service()
+
+    pcm = (_windows(5, 1)[0] * 32767).astype(np.int16).tobytes()
+    p1 = await first.speech_probability(pcm, 8000)
+    await second.speech_probability(pcm, 8000)
+    await second.speech_probability(pcm, 8000)
+    first.reset()
+    # Per-call state: the other call's windows did not leak into this one
+    assert await first.speech_probability(pcm, 8000) == pytest.approx(p1, abs=1e-6)
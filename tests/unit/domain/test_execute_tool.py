@@ -3,6 +3,8 @@ Unit tests for ExecuteToolUseCase.
 
 Validates domain use case for tool orchestration.
 """
+import asyncio
+
 import pytest
 from app.domain.use_cases.execute_tool import ExecuteToolUseCase
 from app.domain.models.tool_models import ToolRequest, ToolResponse, ToolDefinition
@@ -154,5 +156,76 @@ class TestExecuteToolUseCase:
         assert use_case.tool_count == 3
 
 
+class SlowTool(MockTool):
+    """Mock tool that takes `delay` seconds and records concurrency."""
+
+    def __init__(self, name: str, delay: float, tracker: dict):
+        super().__init__(name)
+        self._delay = delay
+        self._tracker = tracker
+
+    async def execute(self, request: ToolRequest) -> ToolResponse:
+        self._tracker["running"] += 1
+        self._tracker["peak"] = max(self._tracker["peak"], self._tracker["running"])
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            self._tracker["running"] -= 1
+        return await super().execute(request)
+
+
+class TestExecuteMany:
+    """Concurrent execution of the tools of one LLM completion."""
+
+    @pytest.mark.asyncio
+    async def test_independent_tools_run_concurrently_in_request_order(self):
+        tracker = {"running": 0, "peak": 0}
+        tools = {name: SlowTool(name, 0.05, tracker) for name in ("availability", "customer")}
+        use_case = ExecuteToolUseCase(tools)
+
+        start = asyncio.get_running_loop().time()
+        responses = await use_case.execute_many([
+            ToolRequest(tool_name="customer", arguments={}),
+            ToolRequest(tool_name="availability", arguments={}),
+        ])
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert [r.tool_name for r in responses] == ["customer", "availability"]
+        assert all(r.success for r in responses)
+        assert tracker["peak"] == 2
+        assert elapsed < 0.09  # not 2 x 50ms
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        tracker = {"running": 0, "peak": 0}
+        tools = {f"tool_{i}": SlowTool(f"tool_{i}", 0.01, tracker) for i in range(5)}
+        use_case = ExecuteToolUseCase(tools, max_concurrency=2)
+
+        responses = await use_case.execute_many(
+            [ToolRequest(tool_name=name, arguments={}) for name in tools]
+        )
+
+        assert len(responses) == 5
+        assert tracker["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_a_slow_tool_times_out_without_failing_the_others(self):
+        tracker = {"running": 0, "peak": 0}
+        tools = {
+            "slow": SlowTool("slow", 1.0, tracker),
+            "fast": MockTool("fast"),
+        }
+        use_case = ExecuteToolUseCase(tools)
+
+        slow, fast = await use_case.execute_many([
+            ToolRequest(tool_name="slow", arguments={}, timeout_seconds=0.05),
+            ToolRequest(tool_name="fast", arguments={}),
+        ])
+
+        assert slow.success is False
+        assert "timeout" in slow.error_message.lower()
+        assert fast.success is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,122 @@
+"""
+Unit tests for ToolResultCache and its use from ExecuteToolUseCase.
+"""
+import asyncio
+
+import pytest
+
+from app.domain.models.tool_models import ToolDefinition, ToolRequest, ToolResponse
+from app.domain.ports.tool_port import ToolPort
+from app.domain.use_cases.execute_tool import ExecuteToolUseCase
+from app.domain.use_cases.tool_result_cache import ToolResultCache, cache_key
+
+
+class CountingTool(ToolPort):
+    """Tool counting executions; fails while should_succeed is False."""
+
+    def __init__(self, name: str, ttl: float = 60.0, delay: float = 0.0):
+        self._name = name
+        self._ttl = ttl
+        self._delay = delay
+        self.calls = 0
+        self.should_succeed = True
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def get_definition(self) -> ToolDefinition:
+        return ToolDefinition(
+            name=self._name, description="lookup", parameters={}, cache_ttl_seconds=self._ttl
+        )
+
+    async def execute(self, request: ToolRequest) -> ToolResponse:
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        return ToolResponse(
+            tool_name=self._name,
+            result={"n": self.calls} if self.should_succeed else None,
+            success=self.should_succeed,
+            error_message="" if self.should_succeed else "backend down",
+            execution_time_ms=self._delay * 1000,
+            trace_id=request.trace_id,
+        )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _request(tool: str = "get_customer", trace_id: str = "", **arguments) -> ToolRequest:
+    return ToolRequest(tool_name=tool, arguments=arguments, trace_id=trace_id)
+
+
+def test_cache_key_ignores_argument_order():
+    a = ToolRequest(tool_name="t", arguments={"a": 1, "b": {"y": 2, "x": 1}})
+    b = ToolRequest(tool_name="t", arguments={"b": {"x": 1, "y": 2}, "a": 1})
+    c = ToolRequest(tool_name="t", arguments={"a": 1}, context={"server_url": "https://other"})
+
+    assert cache_key(a) == cache_key(b)
+    assert cache_key(a) != cache_key(c)
+
+
+@pytest.mark.asyncio
+async def test_repeated_lookup_is_served_from_cache_until_ttl():
+    clock = FakeClock()
+    tool = CountingTool("get_customer", ttl=60.0)
+    use_case = ExecuteToolUseCase({tool.name: tool}, cache=ToolResultCache(clock=clock))
+
+    first = await use_case.execute(_request(phone="555", trace_id="t1"))
+    assert use_case.is_cached(_request(phone="555"))
+    second = await use_case.execute(_request(phone="555", trace_id="t2"))
+
+    assert tool.calls == 1
+    assert second.result == first.result
+    assert second.trace_id == "t2"
+    assert second.execution_time_ms == 0.0
+
+    clock.now = 61.0
+    assert not use_case.is_cached(_request(phone="555"))
+    await use_case.execute(_request(phone="555"))
+    assert tool.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_execution():
+    tool = CountingTool("check_availability", delay=0.02)
+    cache = ToolResultCache()
+    use_case = ExecuteToolUseCase({tool.name: tool}, cache=cache)
+
+    responses = await use_case.execute_many([_request("check_availability", day="lunes")] * 3)
+
+    assert tool.calls == 1
+    assert all(r.success for r in responses)
+    assert cache.stats.misses == 1
+    assert cache.stats.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached():
+    tool = CountingTool("get_customer")
+    use_case = ExecuteToolUseCase({tool.name: tool}, cache=ToolResultCache())
+
+    tool.should_succeed = False
+    assert (await use_case.execute(_request(phone="555"))).success is False
+    tool.should_succeed = True
+    assert (await use_case.execute(_request(phone="555"))).success is True
+    assert tool.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_tools_without_ttl_always_execute():
+    tool = CountingTool("book_appointment", ttl=0.0)
+    use_case = ExecuteToolUseCase({tool.name: tool}, cache=ToolResultCache())
+
+    await use_case.execute_many([_request("book_appointment", day="lunes")] * 2)
+
+    assert tool.calls == 2
+    assert not use_case.is_cached(_request("book_appointment", day="lunes"))
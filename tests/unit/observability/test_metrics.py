@@ -34,6 +34,19 @@ class TestMetricsCollector:
         metrics = await collector.get_metrics(trace_id)
         assert metrics.llm_ttfb == 350.0
     
+    @pytest.mark.asyncio
+    async def test_record_tts_ttfb(self):
+        """Should record TTS TTFB separately from total TTS latency."""
+        collector = MetricsCollector()
+        trace_id = "test-trace-tts"
+
+        await collector.record_latency(trace_id, 'tts_ttfb', 120.0)
+        await collector.record_latency(trace_id, 'tts', 900.0)
+
+        metrics = await collector.get_metrics(trace_id)
+        assert metrics.tts_ttfb == 120.0
+        assert metrics.tts_latency == 900.0
+
     @pytest.mark.asyncio
     async def test_record_multiple_components(self):
         """Should record latencies for multiple components."""
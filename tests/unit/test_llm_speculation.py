@@ -0,0 +1,128 @@
+"""
+Speculative LLM prefetch: ContextAggregator pushes the tentative turn when the user
+stops speaking; LLMProcessor generates on it and holds the output until the turn commits.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.frames import (
+    CancelFrame,
+    Frame,
+    LLMSpeculationFrame,
+    TextFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from app.core.processor import FrameProcessor
+from app.domain.models.llm_models import LLMChunk
+from app.processors.logic.aggregator import ContextAggregator
+from app.processors.logic.llm import LLMProcessor
+
+
+class Collector(FrameProcessor):
+    def __init__(self):
+        super().__init__(name="Collector")
+        self.frames: list[Frame] = []
+
+    async def process_frame(self, frame, direction):
+        self.frames.append(frame)
+
+    @property
+    def texts(self) -> list[str]:
+        return [f.text for f in self.frames if isinstance(f, TextFrame)]
+
+
+class FakeLLM:
+    def __init__(self):
+        self.requests = []
+
+    async def generate_stream(self, request):
+        self.requests.append(request)
+        prompt = request.messages[-1].content
+        yield LLMChunk(text=f"Answer to {prompt}. ")
+        yield LLMChunk(text="Anything else?", finish_reason="stop")
+
+
+def _llm(history):
+    port = FakeLLM()
+    llm = LLMProcessor(port, SimpleNamespace(context_window=10), history)
+    sink = Collector()
+    llm.link(sink)
+    return llm, port, sink
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_committed_turn_releases_the_held_response_without_a_new_request():
+    history = [{"role": "assistant", "content": "Hi"}]
+    llm, port, sink = _llm(history)
+
+    await llm.process_frame(LLMSpeculationFrame(text="book a table"), 1)
+    await _settle()
+    # Generated, but nothing reaches TTS and history is untouched before the commit
+    assert len(port.requests) == 1
+    assert port.requests[0].messages[-1].content == "book a table"
+    assert sink.frames == [] and len(history) == 1
+
+    history.append({"role": "user", "content": "book a table"})  # aggregator commit
+    await llm.process_frame(TextFrame(text="book a table"), 1)
+    await _settle()
+
+    assert len(port.requests) == 1
+    assert sink.texts == ["Answer to book a table. ", "Anything else?"]
+    assert [m["role"] for m in history] == ["assistant", "user", "assistant"]
+
+
+@pytest.mark.asyncio
+async def test_changed_turn_discards_the_speculation_and_regenerates():
+    history = []
+    llm, port, sink = _llm(history)
+
+    await llm.process_frame(LLMSpeculationFrame(text="book a"), 1)
+    await _settle()
+    await llm.process_frame(TextFrame(text="book a table"), 1)
+    await _settle()
+
+    assert len(port.requests) == 2
+    assert sink.texts == ["Answer to book a table. ", "Anything else?"]
+    assert [m["content"] for m in history] == ["book a table", "Answer to book a table. Anything else?"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_frame_drops_the_held_speculation():
+    llm, port, sink = _llm([])
+
+    await llm.process_frame(LLMSpeculationFrame(text="book a table"), 1)
+    await _settle()
+    await llm.process_frame(CancelFrame(reason="User Barge-In"), 1)
+    await _settle()
+
+    assert llm._speculation is None
+    assert [type(f) for f in sink.frames] == [CancelFrame]
+
+
+@pytest.mark.asyncio
+async def test_aggregator_speculates_on_stop_and_commits_after_the_same_timeout():
+    history = []
+    agg = ContextAggregator(SimpleNamespace(), history, speculative=True)
+    agg.turn_timeout = 0.05
+    sink = Collector()
+    agg.link(sink)
+
+    await agg.process_frame(UserStartedSpeakingFrame(), 1)
+    await agg.process_frame(TextFrame(text="book a table"), 1)
+    await agg.process_frame(UserStoppedSpeakingFrame(), 1)
+
+    speculations = [f for f in sink.frames if isinstance(f, LLMSpeculationFrame)]
+    assert [f.text for f in speculations] == ["book a table"]
+    assert sink.texts == []  # not committed yet
+
+    await asyncio.sleep(0.1)
+    assert sink.texts == ["book a table"]
+    assert history == [{"role": "user", "content": "book a table"}]